@@ -0,0 +1,107 @@
+"""
+Backtest Session Kernel
+=======================
+One-pass scan of a session's bars for the deviation -> SMT -> reclaim
+sequence used by MidnightReclaimStrategy.
+
+The strategy runs the scan once per session over the numpy bar buffer and
+next() replays the resulting bar indices instead of re-evaluating the
+conditions bar by bar. The scan is causal: a decision at bar i only reads
+bars <= i, so scanning a prefix gives the same answers as scanning the
+full session.
+
+JIT-compiled with numba when available (see utils/_njit.py).
+"""
+
+import numpy as np
+
+from utils._njit import njit
+
+
+@njit(cache=True)
+def scan_session(
+    open_,
+    high,
+    low,
+    close,
+    timestamps,
+    start,
+    end,
+    window_end_ns,
+    midnight_open,
+    bias_sign,
+    lookback,
+    timeout_ns,
+    min_body_ratio
+):
+    """
+    Find the deviation, reclaim entry and reclaim timeout bars of a session.
+
+    Mirrors the bar-by-bar state flow of the strategy:
+    - AWAITING_DEVIATION: first bar closing beyond the midnight open
+      against the bias; the extreme is the lowest low (long) / highest
+      high (short) of the last `lookback` bars including that bar
+    - AWAITING_SMT: confirmed on the next bar (simplified SMT)
+    - AWAITING_RECLAIM: from the bar after that, time out once more than
+      timeout_ns has elapsed since the deviation, otherwise enter on the
+      first bar closing back across the midnight open in the bias
+      direction with body/range >= min_body_ratio
+
+    Args:
+        open_, high, low, close: Bar prices (time-ordered)
+        timestamps: Bar timestamps as UTC epoch nanoseconds
+        start: Index of the bar the session started on
+        end: Number of bars available (scan stops before it)
+        window_end_ns: Last timestamp inside the trading window
+        midnight_open: Session midnight open price
+        bias_sign: +1 for LONG bias, -1 for SHORT (both directions share
+            one code path: price moves are multiplied by the sign)
+        lookback: Bars used for the deviation extreme
+        timeout_ns: Reclaim time limit in nanoseconds
+        min_body_ratio: Minimum reclaim candle body/range
+
+    Returns:
+        Tuple of (deviation_idx, deviation_extreme, entry_idx, timeout_idx);
+        indices are -1 when the event does not occur within [start, end)
+    """
+    deviation_idx = -1
+    deviation_extreme = np.nan
+    entry_idx = -1
+    timeout_idx = -1
+
+    # Longs sweep lows, shorts sweep highs
+    extreme_src = low if bias_sign > 0 else high
+
+    # Deviation
+    i = start
+    while i < end and timestamps[i] <= window_end_ns:
+        if bias_sign * (close[i] - midnight_open) < 0:
+            deviation_idx = i
+            first = max(0, i - lookback + 1)
+            deviation_extreme = extreme_src[first]
+            for k in range(first + 1, i + 1):
+                if bias_sign * (extreme_src[k] - deviation_extreme) < 0:
+                    deviation_extreme = extreme_src[k]
+            break
+        i += 1
+
+    if deviation_idx < 0:
+        return deviation_idx, deviation_extreme, entry_idx, timeout_idx
+
+    # SMT confirms on deviation_idx + 1; reclaim checks start after it
+    i = deviation_idx + 2
+    while i < end and timestamps[i] <= window_end_ns:
+        if timestamps[i] - timestamps[deviation_idx] > timeout_ns:
+            timeout_idx = i
+            break
+
+        body = close[i] - open_[i]
+        reclaimed = bias_sign * (close[i] - midnight_open) > 0 and bias_sign * body > 0
+
+        range_size = high[i] - low[i]
+        if reclaimed and range_size > 0 and abs(body) / range_size >= min_body_ratio:
+            entry_idx = i
+            break
+        i += 1
+
+    return deviation_idx, deviation_extreme, entry_idx, timeout_idx
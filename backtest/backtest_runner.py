@@ -7,7 +7,10 @@ This is the entry point for running historical backtests.
 """
 
 import backtrader as bt
+import time
 from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
 import pandas as pd
 
 from backtest.bt_strategy import MidnightReclaimStrategy
@@ -24,7 +27,9 @@ class BacktestRunner:
         self,
         starting_capital: float = 100000.0,
         risk_per_trade_pct: float = 0.01,
-        debug: bool = True
+        debug: bool = True,
+        cache_dir: Optional[str] = "data/cache",
+        cache_ttl_hours: float = 12.0
     ):
         """
         Initialize backtest runner.
@@ -33,10 +38,14 @@ class BacktestRunner:
             starting_capital: Starting account size
             risk_per_trade_pct: Risk per trade as % of account
             debug: Print debug messages
+            cache_dir: Directory for cached Yahoo bars (None disables caching)
+            cache_ttl_hours: Refetch cached bars older than this
         """
         self.starting_capital = starting_capital
         self.risk_per_trade_pct = risk_per_trade_pct
         self.debug = debug
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.cache_ttl_hours = cache_ttl_hours
         
         # Initialize config
         Config.initialize()
@@ -70,13 +79,16 @@ class BacktestRunner:
         print(f"LOADING DATA")
         print(f"{'='*70}")
         
-        # Load data
+        # Load data - one batch request for all instruments; all feeds go
+        # into one Cerebro since ES drives NQ's SMT check
         loader = YahooFinanceLoader()
         
+        print(f"Fetching {', '.join(instruments)} data ({period})...")
+        bars = self._fetch_bars(loader, instruments, period, '1m')
+        
         data_feeds = {}
-        for symbol in instruments:
-            print(f"Fetching {symbol} data ({period})...")
-            df = loader.fetch_historical_bars(symbol, period=period, interval='1m')
+        for symbol in instruments:  # Keep order: first instrument is the primary feed
+            df = bars[symbol]
             
             if df.empty:
                 raise ValueError(f"No data for {symbol}")
@@ -112,10 +124,9 @@ class BacktestRunner:
         cerebro.broker.setcash(self.starting_capital)
         cerebro.broker.setcommission(commission=0.0)  # Set commission if needed
         
-        # Add analyzers
+        # Add analyzers (only those reported below)
         cerebro.addanalyzer(bt.analyzers.SharpeRatio, _name='sharpe')
         cerebro.addanalyzer(bt.analyzers.DrawDown, _name='drawdown')
-        cerebro.addanalyzer(bt.analyzers.Returns, _name='returns')
         cerebro.addanalyzer(bt.analyzers.TradeAnalyzer, _name='trades')
         
         print(f"Starting portfolio value: ${cerebro.broker.getvalue():,.2f}")
@@ -125,7 +136,11 @@ class BacktestRunner:
         print(f"RUNNING BACKTEST")
         print(f"{'='*70}\n")
         
-        results = cerebro.run()
+        # exactbars=1 keeps only the line history indicators need, so memory
+        # stays flat on long runs (Backtrader then streams bars instead of
+        # preloading them; the strategy keeps its own NQ bar buffer).
+        # stdstats=False skips the broker/trade observers we don't plot.
+        results = cerebro.run(exactbars=1, stdstats=False)
         
         # Print results
         print(f"\n{'='*70}")
@@ -145,44 +160,92 @@ class BacktestRunner:
         # Analyzer results
         strat = results[0]
         
-        # Sharpe
-        try:
-            sharpe = strat.analyzers.sharpe.get_analysis()
-            if sharpe and 'sharperatio' in sharpe:
-                print(f"\n📊 METRICS")
-                print(f"   Sharpe Ratio: {sharpe['sharperatio']:.2f}")
-        except:
-            pass
+        # Analyses are AutoOrderedDicts: read them with .get() so missing
+        # keys aren't auto-created and absent metrics are simply skipped
+        print(f"\n📊 METRICS")
+        
+        # Sharpe (None when there are too few returns)
+        sharpe = strat.analyzers.sharpe.get_analysis() or {}
+        sharpe_ratio = sharpe.get('sharperatio')
+        if sharpe_ratio is not None:
+            print(f"   Sharpe Ratio: {sharpe_ratio:.2f}")
         
         # Drawdown
-        try:
-            dd = strat.analyzers.drawdown.get_analysis()
-            if dd:
-                print(f"   Max Drawdown: {dd.max.drawdown:.2f}%")
-        except:
-            pass
+        dd = strat.analyzers.drawdown.get_analysis() or {}
+        max_dd = dd.get('max', {}).get('drawdown')
+        if max_dd is not None:
+            print(f"   Max Drawdown: {max_dd:.2f}%")
         
         # Trades
-        try:
-            trades = strat.analyzers.trades.get_analysis()
-            if trades and 'total' in trades:
-                total = trades.total.total if hasattr(trades.total, 'total') else 0
-                won = trades.won.total if hasattr(trades, 'won') and hasattr(trades.won, 'total') else 0
-                lost = trades.lost.total if hasattr(trades, 'lost') and hasattr(trades.lost, 'total') else 0
-                
-                print(f"\n📈 TRADES")
-                print(f"   Total: {total}")
-                print(f"   Won: {won}")
-                print(f"   Lost: {lost}")
-                if total > 0:
-                    win_rate = (won / total) * 100
-                    print(f"   Win Rate: {win_rate:.1f}%")
-        except:
-            pass
+        trades = strat.analyzers.trades.get_analysis() or {}
+        if 'total' in trades:
+            total = trades['total'].get('total', 0)
+            won = trades.get('won', {}).get('total', 0)
+            lost = trades.get('lost', {}).get('total', 0)
+            
+            print(f"\n📈 TRADES")
+            print(f"   Total: {total}")
+            print(f"   Won: {won}")
+            print(f"   Lost: {lost}")
+            if total > 0:
+                win_rate = (won / total) * 100
+                print(f"   Win Rate: {win_rate:.1f}%")
         
         print(f"\n{'='*70}\n")
         
         return cerebro
+    
+    def _fetch_bars(
+        self,
+        loader: YahooFinanceLoader,
+        symbols: List[str],
+        period: str,
+        interval: str
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch bars through the on-disk cache.
+        
+        Cache files are keyed by (symbol, period, interval, date) and
+        refetched once older than cache_ttl_hours. Pickle keeps the
+        timezone-aware index intact without extra dependencies. Symbols
+        missing from the cache are downloaded together in one batch.
+        
+        Args:
+            loader: Yahoo Finance loader
+            symbols: Instrument symbols
+            period: Yahoo Finance period
+            interval: Bar size
+        
+        Returns:
+            Dict of symbol -> DataFrame with OHLCV data
+        """
+        bars = {}
+        paths = {}
+        
+        if self.cache_dir is not None:
+            for symbol in symbols:
+                path = self.cache_dir / f"{symbol}_{period}_{interval}_{datetime.now():%Y%m%d}.pkl"
+                paths[symbol] = path
+                
+                if path.exists():
+                    age_hours = (time.time() - path.stat().st_mtime) / 3600
+                    if age_hours < self.cache_ttl_hours:
+                        print(f"  {symbol}: using cached bars ({path})")
+                        bars[symbol] = pd.read_pickle(path)
+        
+        missing = [symbol for symbol in symbols if symbol not in bars]
+        if missing:
+            fetched = loader.fetch_historical_bars_batch(missing, period=period, interval=interval)
+            
+            for symbol in missing:
+                df = fetched.get(symbol, pd.DataFrame())
+                bars[symbol] = df
+                
+                if symbol in paths and not df.empty:
+                    paths[symbol].parent.mkdir(parents=True, exist_ok=True)
+                    df.to_pickle(paths[symbol])
+        
+        return bars
 
 
 # Example usage
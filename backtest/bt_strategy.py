@@ -11,8 +11,12 @@ This wraps our strategy engine into Backtrader's interface so we can:
 """
 
 import backtrader as bt
+import logging
+import sys
 from datetime import datetime, time
-from typing import Dict, Any, List
+from logging.handlers import MemoryHandler
+from typing import Dict, Any, List, NamedTuple
+import numpy as np
 import pandas as pd
 
 from core.indicators import (
@@ -27,6 +31,93 @@ from core.risk_manager import RiskManager
 from strategy_logging.schemas import TradingState
 from utils.config_loader import Config
 from utils.time_utils import TimeUtils
+from backtest._kernel import scan_session
+
+
+# Debug output goes through this logger; the strategy attaches a buffered
+# stdout handler when debug=True. Debug blocks are skipped under python -O.
+log = logging.getLogger(__name__)
+
+
+# Column layout of the OHLCV bar buffer
+BAR_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+OPEN_COL, HIGH_COL, LOW_COL, CLOSE_COL, VOLUME_COL = range(len(BAR_COLUMNS))
+
+# Bars scanned (including the current one) for the deviation extreme
+DEVIATION_LOOKBACK = 20
+
+# Closed-trade record layout (bias: +1 LONG, -1 SHORT)
+TRADE_RECORD_DTYPE = np.dtype([
+    ('date', 'datetime64[D]'),
+    ('bias', 'i1'),
+    ('entry', 'f8'),
+    ('exit', 'f8'),
+    ('pnl_r', 'f8'),
+    ('win', '?'),
+])
+
+# Initial trade record capacity (at most one trade per session)
+TRADE_RECORD_CAPACITY = 256
+
+# Backtrader date numbers are days since 0001-01-01 (proleptic ordinal 1)
+_EPOCH_ORDINAL = 719163.0
+_US_PER_DAY = 86400 * 1_000_000
+
+# bt.num2date rounds date numbers within 10us of a whole second
+_SNAP_DAYS = 10 / _US_PER_DAY
+
+
+class StrategyConfig(NamedTuple):
+    """Frozen v1.0 parameters read by the strategy (loaded once per process)."""
+    trading_window_start: str
+    trading_window_end: str
+    reclaim_time_limit: float
+    reclaim_body_ratio: float
+    reclaim_timeout_ns: int
+    ons_min_ratio: float
+    ons_max_ratio: float
+    isi_threshold_min: float
+    isi_threshold_max: float
+
+
+_STRATEGY_CONFIG: StrategyConfig = None
+
+
+def get_strategy_config() -> StrategyConfig:
+    """
+    Get the strategy parameters, reading Config on first use.
+    
+    The v1.0 config is frozen, so the lookups are done once and shared
+    by every strategy instance (e.g. across optimization runs).
+    """
+    global _STRATEGY_CONFIG
+    if _STRATEGY_CONFIG is None:
+        Config.initialize()
+        reclaim_time_limit = Config.get('reclaim', 'max_time_minutes')
+        _STRATEGY_CONFIG = StrategyConfig(
+            trading_window_start=Config.get('session', 'trading_window_start'),
+            trading_window_end=Config.get('session', 'trading_window_end'),
+            reclaim_time_limit=reclaim_time_limit,
+            reclaim_body_ratio=Config.get('reclaim', 'min_body_ratio'),
+            reclaim_timeout_ns=int(round(reclaim_time_limit * 60 * 1_000_000_000)),
+            ons_min_ratio=Config.get('ons', 'min_adr_ratio'),
+            ons_max_ratio=Config.get('ons', 'max_adr_ratio'),
+            isi_threshold_min=Config.get('isi', 'threshold_min'),
+            isi_threshold_max=Config.get('isi', 'threshold_max'),
+        )
+    return _STRATEGY_CONFIG
+
+
+def _num_to_ns(num):
+    """Backtrader date number(s) to UTC epoch nanoseconds (microsecond precision)."""
+    micros = np.rint((np.asarray(num) - _EPOCH_ORDINAL) * _US_PER_DAY).astype(np.int64)
+    
+    # Snap float error within 10us of a whole second, as bt.num2date does
+    frac = micros % 1_000_000
+    micros = np.where(frac < 10, micros - frac, micros)
+    micros = np.where(frac > 999_990, micros - frac + 1_000_000, micros)
+    
+    return micros * 1000
 
 
 class MidnightReclaimStrategy(bt.Strategy):
@@ -46,8 +137,19 @@ class MidnightReclaimStrategy(bt.Strategy):
     
     def __init__(self):
         """Initialize strategy with all components."""
-        # Initialize config
-        Config.initialize()
+        # Buffered debug output, flushed in stop()
+        self._log_handler: MemoryHandler = None
+        if self.params.debug:
+            target = logging.StreamHandler(sys.stdout)
+            target.setFormatter(logging.Formatter('%(message)s'))
+            self._log_handler = MemoryHandler(
+                capacity=1024, flushLevel=logging.CRITICAL, target=target
+            )
+            log.addHandler(self._log_handler)
+            log.setLevel(logging.DEBUG)
+        
+        # Frozen config values (shared, read once per process)
+        self.cfg = get_strategy_config()
         
         # Get data feeds
         self.nq_data = self.datas[0]  # Primary (NQ)
@@ -59,19 +161,20 @@ class MidnightReclaimStrategy(bt.Strategy):
             account_size=self.params.account_size,
             risk_per_trade_pct=self.params.risk_per_trade_pct,
             tp1_r_multiple=self.params.tp1_r_multiple,
-            partial_exit_pct=self.params.partial_exit_pct
+            partial_exit_pct=self.params.partial_exit_pct,
+            verbose=self.params.debug
         )
         
         # Indicators
         self.mo_calc = MidnightOpenCalculator()
         self.adr_calc = ADRCalculator(lookback_days=20)
         self.ons_filter = ONSFilter(
-            min_ratio=Config.get('ons', 'min_adr_ratio'),
-            max_ratio=Config.get('ons', 'max_adr_ratio')
+            min_ratio=self.cfg.ons_min_ratio,
+            max_ratio=self.cfg.ons_max_ratio
         )
         self.isi_calc = ISICalculator(
-            threshold_min=Config.get('isi', 'threshold_min'),
-            threshold_max=Config.get('isi', 'threshold_max')
+            threshold_min=self.cfg.isi_threshold_min,
+            threshold_max=self.cfg.isi_threshold_max
         )
         self.smt_detector = SMTDetector()
         
@@ -81,6 +184,11 @@ class MidnightReclaimStrategy(bt.Strategy):
         self.midnight_open: float = None
         self.adr: float = None
         self.bias: str = None
+        self._bias_sign: int = 0  # +1 LONG, -1 SHORT
+        
+        # Per-session indicator caches (keyed by EST session date)
+        self._mo_cache: Dict[Any, float] = {}
+        self._adr_cache: Dict[Any, float] = {}
         
         # Deviation tracking
         self.deviation_detected = False
@@ -89,32 +197,83 @@ class MidnightReclaimStrategy(bt.Strategy):
         self.deviation_bars: List[int] = []
         
         # Trade tracking
-        self.trade_records: List[Dict[str, Any]] = []
+        self._trade_buf = np.zeros(TRADE_RECORD_CAPACITY, dtype=TRADE_RECORD_DTYPE)
+        self._n_trades = 0
         self.current_order = None
         
+        # NQ bar buffer - indicators read history from here instead of
+        # walking Backtrader's line buffers. _buf_len counts the bars seen
+        # so far. A preloaded feed is copied in whole up front (so the
+        # session scan can look ahead); a streaming feed is appended per bar.
+        dt_line = np.asarray(self.nq_data.datetime.array)
+        self._preloaded = len(dt_line) > 0
+        if self._preloaded:
+            self._buf = np.column_stack([
+                np.asarray(getattr(self.nq_data.lines, col).array, dtype=np.float64)
+                for col in BAR_COLUMNS
+            ])
+            self._ts_buf = _num_to_ns(dt_line)  # UTC epoch ns
+            self._buf_filled = len(dt_line)
+        else:
+            self._buf = np.empty((1, len(BAR_COLUMNS)), dtype=np.float64)
+            self._ts_buf = np.empty(1, dtype=np.int64)
+            self._buf_filled = 0
+        self._buf_len = 0
+        self._index_cache: pd.DatetimeIndex = None
+        
+        # Trading window (EST wall clock) and its UTC ns bounds for the
+        # current session, set in _new_session
+        start_h, start_m = map(int, self.cfg.trading_window_start.split(':'))
+        end_h, end_m = map(int, self.cfg.trading_window_end.split(':'))
+        self._window_start_time = time(start_h, start_m)
+        self._window_end_time = time(end_h, end_m)
+        self._window_start_ns: int = None
+        self._window_end_ns: int = None
+        
+        # Session scan (see backtest/_kernel.py), replayed by next()
+        self._session_start_idx: int = None
+        self._signals = None
+        self._signals_end = 0
+        
+        # Date number at which a locked session's lock expires (next
+        # calendar day); next() skips bars before it without converting
+        # their timestamps
+        self._locked_until_num = float('-inf')
+        
         # Instrument spec
         self.instrument_spec = Config.get_instrument_spec('NQ')
-        
-        # Config
-        self.trading_window_start = Config.get('session', 'trading_window_start')
-        self.trading_window_end = Config.get('session', 'trading_window_end')
-        self.reclaim_time_limit = Config.get('reclaim', 'max_time_minutes')
-        self.reclaim_body_ratio = Config.get('reclaim', 'min_body_ratio')
-        
-        if self.params.debug:
-            print("="*70)
-            print("BACKTEST STRATEGY INITIALIZED")
-            print("="*70)
-            print(f"Account size: ${self.params.account_size:,.2f}")
-            print(f"Risk per trade: {self.params.risk_per_trade_pct:.1%}")
-            print(f"Data feeds: NQ + {'ES' if self.es_data is not None else 'None'}")
-            print("="*70)
+        self.risk_manager.set_instrument(self.instrument_spec)
+        
+        # Per-bar state handlers, keyed by TradingState value
+        self._dispatch = {
+            TradingState.IN_TRADE.value: self._update_position,
+            TradingState.AWAITING_DEVIATION.value: self._check_deviation,
+            TradingState.AWAITING_SMT.value: self._check_smt,
+            TradingState.AWAITING_RECLAIM.value: self._check_reclaim,
+        }
+        
+        if __debug__ and self.params.debug:
+            log.debug(
+                "%s\nBACKTEST STRATEGY INITIALIZED\n%s\n"
+                "Account size: $%s\nRisk per trade: %.1f%%\nData feeds: NQ + %s\n%s",
+                "="*70, "="*70,
+                f"{self.params.account_size:,.2f}",
+                self.params.risk_per_trade_pct * 100,
+                'ES' if self.es_data is not None else 'None',
+                "="*70
+            )
     
     def next(self):
         """Called on each bar."""
-        # Get current bar data
-        current_date = self.nq_data.datetime.date()
+        self._append_bar()
+        
+        # Session locked until the next calendar day: nothing to do
+        if self.nq_data.datetime[0] < self._locked_until_num:
+            return
+        
+        # Get current bar data (read each line once)
         current_time = self.nq_data.datetime.datetime()
+        current_date = current_time.date()
         current_price = self.nq_data.close[0]
         
         # Check for new session
@@ -122,47 +281,31 @@ class MidnightReclaimStrategy(bt.Strategy):
             self._new_session(current_date)
         
         # Skip if not in trading window
-        if not self._in_trading_window(current_time):
+        if not self._in_trading_window():
             return
         
         # Start session if not started
         if not self.session_started:
-            self._start_session()
+            self._start_session(current_time, current_price)
         
-        # Check if session is locked
-        if self.state_machine.current_state == TradingState.SESSION_LOCKED:
-            return
-        
-        # Update position if in trade
-        if self.state_machine.current_state == TradingState.IN_TRADE:
-            self._update_position(current_price)
-            return
-        
-        # State: AWAITING_DEVIATION
-        if self.state_machine.current_state == TradingState.AWAITING_DEVIATION:
-            self._check_deviation(current_price, current_time)
-        
-        # State: AWAITING_SMT
-        elif self.state_machine.current_state == TradingState.AWAITING_SMT:
-            self._check_smt()
-        
-        # State: AWAITING_RECLAIM
-        elif self.state_machine.current_state == TradingState.AWAITING_RECLAIM:
-            self._check_reclaim(current_price, current_time)
+        # Dispatch on state (locked / idle states have no handler)
+        handler = self._dispatch.get(self.state_machine.current_state.value)
+        if handler is not None:
+            handler(current_price, current_time)
     
     def notify_order(self, order):
         """Called when order status changes."""
         if order.status in [order.Completed]:
             if order.isbuy():
-                if self.params.debug:
-                    print(f"   BUY EXECUTED: {order.executed.price:.2f}")
+                if __debug__ and self.params.debug:
+                    log.debug("   BUY EXECUTED: %.2f", order.executed.price)
             else:
-                if self.params.debug:
-                    print(f"   SELL EXECUTED: {order.executed.price:.2f}")
+                if __debug__ and self.params.debug:
+                    log.debug("   SELL EXECUTED: %.2f", order.executed.price)
         
         elif order.status in [order.Canceled, order.Margin, order.Rejected]:
-            if self.params.debug:
-                print(f"   Order {order.status}")
+            if __debug__ and self.params.debug:
+                log.debug("   Order %s", order.status)
         
         self.current_order = None
     
@@ -173,172 +316,209 @@ class MidnightReclaimStrategy(bt.Strategy):
         self.midnight_open = None
         self.adr = None
         self.bias = None
+        self._bias_sign = 0
         self.deviation_detected = False
         self.deviation_time = None
         self.deviation_extreme = None
         self.deviation_bars = []
+        self._signals = None
+        self._signals_end = 0
+        
+        # Window bounds for this session; the EST window falls on the
+        # same calendar date as the (UTC) session date
+        self._window_start_ns = pd.Timestamp(
+            TimeUtils.EST.localize(datetime.combine(new_date, self._window_start_time))
+        ).value
+        self._window_end_ns = pd.Timestamp(
+            TimeUtils.EST.localize(datetime.combine(new_date, self._window_end_time))
+        ).value
         
         # Reset state machine
         self.state_machine.reset_for_new_session(datetime.combine(new_date, datetime.min.time()))
         
-        if self.params.debug:
-            print(f"\n{'='*70}")
-            print(f"NEW SESSION: {new_date}")
-            print(f"{'='*70}")
+        if __debug__ and self.params.debug:
+            log.debug("\n%s\nNEW SESSION: %s\n%s", "="*70, new_date, "="*70)
     
-    def _start_session(self):
-        """Start trading session."""
+    def _start_session(self, ts: datetime, current_price: float):
+        """
+        Start trading session.
+        
+        Args:
+            ts: Current bar time (Backtrader datetimes are UTC)
+            current_price: Current bar close
+        """
         self.session_started = True
         
+        # Use bar time, not wall-clock time
+        session_date = TimeUtils.to_est(ts).date()
+        
+        # Scan runs from this bar up to the end of the trading window
+        self._session_start_idx = self._buf_len - 1
+        
+        # Indicators read the bar buffer directly (bars seen so far only)
+        n = self._buf_len
+        high = self._buf[:n, HIGH_COL]
+        low = self._buf[:n, LOW_COL]
+        timestamps = self._ts_buf[:n]
+        
         # Calculate midnight open
         try:
-            # Convert backtrader data to pandas
-            nq_df = self._get_dataframe(self.nq_data)
+            if session_date not in self._mo_cache:
+                self._mo_cache[session_date] = self.mo_calc.calculate_arrays(
+                    self._buf[:n, OPEN_COL], timestamps, ts
+                )
+            if session_date not in self._adr_cache:
+                self._adr_cache[session_date] = self.adr_calc.calculate_arrays(
+                    high, low, timestamps, ts
+                )
             
-            self.midnight_open = self.mo_calc.calculate(nq_df, datetime.now())
-            self.adr = self.adr_calc.calculate(nq_df, datetime.now())
+            self.midnight_open = self._mo_cache[session_date]
+            self.adr = self._adr_cache[session_date]
             
-            if self.params.debug:
-                print(f"\n📍 Midnight Open: {self.midnight_open:.2f}")
-                print(f"📊 ADR: {self.adr:.2f}")
+            if __debug__ and self.params.debug:
+                log.debug("\n📍 Midnight Open: %.2f\n📊 ADR: %.2f", self.midnight_open, self.adr)
             
         except Exception as e:
-            if self.params.debug:
-                print(f"❌ Session start failed: {e}")
+            if __debug__ and self.params.debug:
+                log.debug("❌ Session start failed: %s", e)
             return
         
         # Validate ONS
         self.state_machine.transition_to(TradingState.SESSION_ACTIVE, "Session opened")
         
         try:
-            nq_df = self._get_dataframe(self.nq_data)
-            ons_result = self.ons_filter.validate(nq_df, datetime.now())
+            ons_result = self.ons_filter.validate_arrays(high, low, timestamps, ts)
             
-            if not ons_result['valid']:
-                if self.params.debug:
-                    print(f"❌ ONS Invalid: {ons_result['reason']}")
+            if not ons_result.valid:
+                if __debug__ and self.params.debug:
+                    log.debug("❌ ONS Invalid: %s", ons_result.reason)
                 
-                self.state_machine.transition_to(TradingState.ONS_INVALID, ons_result['reason'])
-                self.state_machine.transition_to(TradingState.SESSION_LOCKED, "ONS filter failed")
+                self.state_machine.transition_to(TradingState.ONS_INVALID, ons_result.reason)
+                self._lock_session("ONS filter failed")
                 return
             
-            if self.params.debug:
-                print(f"✅ ONS Valid: {ons_result['ratio']:.1%}")
+            if __debug__ and self.params.debug:
+                log.debug("✅ ONS Valid: %.1f%%", ons_result.ratio * 100)
             
         except Exception as e:
-            if self.params.debug:
-                print(f"❌ ONS validation failed: {e}")
+            if __debug__ and self.params.debug:
+                log.debug("❌ ONS validation failed: %s", e)
             return
         
         # Determine bias
-        current_price = self.nq_data.close[0]
         self.bias = "LONG" if current_price < self.midnight_open else "SHORT"
+        self._bias_sign = 1 if self.bias == "LONG" else -1
         
-        if self.params.debug:
-            print(f"🎯 Bias: {self.bias}")
+        if __debug__ and self.params.debug:
+            log.debug("🎯 Bias: %s", self.bias)
         
         # Transition to awaiting deviation
         self.state_machine.transition_to(TradingState.AWAITING_DEVIATION, "Monitoring for deviation")
     
+    def _lock_session(self, reason: str):
+        """
+        Lock the session for the rest of the calendar day.
+        
+        Args:
+            reason: Reason recorded with the state transition
+        """
+        if self.state_machine.transition_to(TradingState.SESSION_LOCKED, reason):
+            # Sessions roll over on the bar's (UTC) calendar date, whose
+            # date number is its proleptic ordinal
+            self._locked_until_num = self.current_date.toordinal() + 1 - _SNAP_DAYS
+    
     def _check_deviation(self, current_price, current_time):
         """Check for deviation (sweep)."""
         if self.deviation_detected:
             return
         
-        if self.bias == "LONG":
-            if current_price < self.midnight_open:
-                # Find lowest point in recent bars
-                lookback = min(20, len(self.nq_data))
-                lows = [self.nq_data.low[-i] for i in range(lookback)]
-                
-                self.deviation_extreme = min(lows)
-                self.deviation_time = current_time
-                self.deviation_detected = True
-                
-                if self.params.debug:
-                    print(f"\n⚡ Deviation detected: {self.deviation_extreme:.2f}")
-                
-                self.state_machine.transition_to(TradingState.AWAITING_SMT, "Sweep detected")
+        deviation_idx, deviation_extreme, _, _ = self._session_signals()
+        if deviation_idx != self._buf_len - 1:
+            return
         
-        elif self.bias == "SHORT":
-            if current_price > self.midnight_open:
-                lookback = min(20, len(self.nq_data))
-                highs = [self.nq_data.high[-i] for i in range(lookback)]
-                
-                self.deviation_extreme = max(highs)
-                self.deviation_time = current_time
-                self.deviation_detected = True
-                
-                if self.params.debug:
-                    print(f"\n⚡ Deviation detected: {self.deviation_extreme:.2f}")
-                
-                self.state_machine.transition_to(TradingState.AWAITING_SMT, "Sweep detected")
+        # Extreme = lowest low (LONG) / highest high (SHORT) of the last
+        # DEVIATION_LOOKBACK bars, computed by the scan
+        self.deviation_extreme = float(deviation_extreme)
+        self.deviation_time = current_time
+        self.deviation_detected = True
+        
+        if __debug__ and self.params.debug:
+            log.debug("\n⚡ Deviation detected: %.2f", self.deviation_extreme)
+        
+        self.state_machine.transition_to(TradingState.AWAITING_SMT, "Sweep detected")
     
-    def _check_smt(self):
+    def _check_smt(self, current_price, current_time):
         """Check SMT confirmation."""
         # Simplified for backtesting
         # In production, would use proper SMT detection
         
-        if self.params.debug:
-            print(f"✅ SMT confirmed (simplified)")
+        if __debug__ and self.params.debug:
+            log.debug("✅ SMT confirmed (simplified)")
         
         self.state_machine.transition_to(TradingState.AWAITING_RECLAIM, "SMT confirmed")
     
     def _check_reclaim(self, current_price, current_time):
         """Check for reclaim."""
-        # Check timeout
-        if self.deviation_time:
-            elapsed = (current_time - self.deviation_time).total_seconds() / 60
-            if elapsed > self.reclaim_time_limit:
-                if self.params.debug:
-                    print(f"⏰ Reclaim timeout")
-                
-                self.state_machine.transition_to(TradingState.SESSION_LOCKED, "Reclaim timeout")
-                return
+        _, _, entry_idx, timeout_idx = self._session_signals()
+        current_idx = self._buf_len - 1
         
-        # Check for reclaim
-        current_bar = self.nq_data
+        # Check timeout
+        if current_idx == timeout_idx:
+            if __debug__ and self.params.debug:
+                log.debug("⏰ Reclaim timeout")
+            
+            self._lock_session("Reclaim timeout")
+            return
         
-        if self.bias == "LONG":
-            if current_bar.close[0] > self.midnight_open and current_bar.close[0] > current_bar.open[0]:
-                body = abs(current_bar.close[0] - current_bar.open[0])
-                range_size = current_bar.high[0] - current_bar.low[0]
-                
-                if range_size > 0:
-                    body_ratio = body / range_size
-                    
-                    if body_ratio >= self.reclaim_body_ratio:
-                        self._enter_trade(current_bar.close[0])
-        
-        elif self.bias == "SHORT":
-            if current_bar.close[0] < self.midnight_open and current_bar.close[0] < current_bar.open[0]:
-                body = abs(current_bar.close[0] - current_bar.open[0])
-                range_size = current_bar.high[0] - current_bar.low[0]
-                
-                if range_size > 0:
-                    body_ratio = body / range_size
-                    
-                    if body_ratio >= self.reclaim_body_ratio:
-                        self._enter_trade(current_bar.close[0])
+        # Check for reclaim (close back across MO with a strong body)
+        if current_idx == entry_idx:
+            self._enter_trade(current_price)
+    
+    def _session_signals(self):
+        """
+        Deviation / entry / timeout bar indices for the current session.
+        
+        Runs the session scan over every bar available - the whole feed
+        when preloaded, so it runs once per session; bars seen so far when
+        streaming, so it reruns as new bars arrive.
+        """
+        end = self._buf_filled
+        if self._signals is None or self._signals_end < end:
+            self._signals = scan_session(
+                self._buf[:, OPEN_COL],
+                self._buf[:, HIGH_COL],
+                self._buf[:, LOW_COL],
+                self._buf[:, CLOSE_COL],
+                self._ts_buf,
+                self._session_start_idx,
+                end,
+                self._window_end_ns,
+                self.midnight_open,
+                self._bias_sign,
+                DEVIATION_LOOKBACK,
+                self.cfg.reclaim_timeout_ns,
+                self.cfg.reclaim_body_ratio
+            )
+            self._signals_end = end
+        return self._signals
     
     def _enter_trade(self, entry_price):
         """Enter trade."""
-        if self.params.debug:
-            print(f"\n🎯 Entering trade at {entry_price:.2f}")
+        if __debug__ and self.params.debug:
+            log.debug("\n🎯 Entering trade at %.2f", entry_price)
         
-        # Calculate stops
-        if self.bias == "LONG":
-            stop_loss = self.deviation_extreme - 2.0
-        else:
-            stop_loss = self.deviation_extreme + 2.0
+        # Calculate stops (2 points beyond the deviation extreme)
+        stop_loss = self.deviation_extreme - 2.0 * self._bias_sign
         
         # Open position with risk manager
         position = self.risk_manager.open_position(
             entry_price=entry_price,
             stop_loss=stop_loss,
-            bias=self.bias,
-            instrument_spec=self.instrument_spec
+            bias=self.bias
         )
+        if position is None:
+            self._lock_session("Entry rejected: stop not beyond entry")
+            return
         
         # Place order
         if self.bias == "LONG":
@@ -348,12 +528,9 @@ class MidnightReclaimStrategy(bt.Strategy):
         
         self.state_machine.transition_to(TradingState.IN_TRADE, "Trade entered")
     
-    def _update_position(self, current_price):
+    def _update_position(self, current_price, current_time=None):
         """Update open position."""
-        result = self.risk_manager.update_position(
-            current_price=current_price,
-            instrument_spec=self.instrument_spec
-        )
+        result = self.risk_manager.update_position(current_price)
         
         if result:
             # Exit signal
@@ -363,75 +540,134 @@ class MidnightReclaimStrategy(bt.Strategy):
                 self.current_order = self.buy()
             
             if result['type'] == 'FULL_EXIT':
-                self.state_machine.transition_to(
-                    TradingState.SESSION_LOCKED,
-                    f"Trade closed: {result['reason']}"
-                )
+                self._lock_session(f"Trade closed: {result['reason']}")
                 
                 # Record trade
-                self.trade_records.append({
-                    'date': self.current_date,
-                    'bias': self.bias,
-                    'entry': self.risk_manager.current_position.entry_price if self.risk_manager.current_position else 0,
-                    'exit': result['exit_price'],
-                    'pnl_r': result['pnl_r'],
-                    'win': result['win']
-                })
+                if self._n_trades == len(self._trade_buf):
+                    self._trade_buf = np.concatenate([self._trade_buf, np.zeros_like(self._trade_buf)])
+                self._trade_buf[self._n_trades] = (
+                    self.current_date,
+                    self._bias_sign,
+                    self.risk_manager.current_position.entry_price if self.risk_manager.current_position else 0,
+                    result['exit_price'],
+                    result['pnl_r'],
+                    result['win']
+                )
+                self._n_trades += 1
+    
+    @property
+    def trade_records(self) -> np.ndarray:
+        """
+        Closed trades as a structured array (see TRADE_RECORD_DTYPE).
+        
+        Columns can be analysed directly, e.g. trade_records['pnl_r'].sum().
+        """
+        return self._trade_buf[:self._n_trades]
     
-    def _in_trading_window(self, current_time):
-        """Check if in trading window."""
-        return TimeUtils.is_in_trading_window(
-            current_time,
-            self.trading_window_start,
-            self.trading_window_end
+    def _in_trading_window(self):
+        """Check if the current bar is in the session's trading window."""
+        ts = self._ts_buf[self._buf_len - 1]
+        return self._window_start_ns <= ts <= self._window_end_ns
+    
+    def _append_bar(self):
+        """Advance the bar buffer to the current NQ bar."""
+        # With several feeds next() can fire without a new NQ bar
+        if len(self.nq_data) == self._buf_len:
+            return
+        
+        if self._preloaded:
+            self._buf_len = len(self.nq_data)
+            return
+        
+        if self._buf_len == len(self._buf):
+            self._buf = np.concatenate([self._buf, np.empty_like(self._buf)])
+            self._ts_buf = np.concatenate([self._ts_buf, np.empty_like(self._ts_buf)])
+        
+        data = self.nq_data
+        self._buf[self._buf_len] = (
+            data.open[0], data.high[0], data.low[0], data.close[0], data.volume[0]
         )
+        self._ts_buf[self._buf_len] = _num_to_ns(data.datetime[0])
+        self._buf_len += 1
+        self._buf_filled = self._buf_len
     
-    def _get_dataframe(self, data_feed) -> pd.DataFrame:
-        """Convert backtrader data to pandas DataFrame."""
-        # Get all available data
-        data_list = []
-        
-        for i in range(len(data_feed)):
-            idx = -i if i > 0 else 0
-            data_list.append({
-                'open': data_feed.open[idx],
-                'high': data_feed.high[idx],
-                'low': data_feed.low[idx],
-                'close': data_feed.close[idx],
-                'volume': data_feed.volume[idx],
-            })
-        
-        # Reverse (oldest first)
-        data_list.reverse()
-        
-        # Create DataFrame
-        df = pd.DataFrame(data_list)
-        
-        # Add timestamps (simplified)
-        df.index = pd.date_range(
-            end=data_feed.datetime.datetime(),
-            periods=len(df),
-            freq='1min'
+    def _get_dataframe(self, data_feed=None) -> pd.DataFrame:
+        """
+        Get a DataFrame of the bars seen so far.
+        
+        For NQ (the default) the frame wraps the bar buffer without copying
+        it; the index holds the real bar timestamps in EST (Backtrader
+        stores them as UTC). Other feeds are converted from their lines.
+        """
+        if data_feed is not None and data_feed is not self.nq_data:
+            return self._feed_to_dataframe(data_feed)
+        
+        n = self._buf_len
+        
+        # Extend the cached index to every buffered bar: a preloaded feed
+        # converts all timestamps once, a streaming feed only new ones
+        cached = 0 if self._index_cache is None else len(self._index_cache)
+        filled = self._buf_filled
+        if cached < n:
+            new_index = pd.DatetimeIndex(
+                self._ts_buf[cached:filled].astype('datetime64[ns]')
+            ).tz_localize(TimeUtils.UTC).tz_convert(TimeUtils.EST)
+            if self._index_cache is None:
+                self._index_cache = new_index
+            else:
+                self._index_cache = self._index_cache.append(new_index)
+        
+        return pd.DataFrame(
+            self._buf[:n],
+            columns=BAR_COLUMNS,
+            index=self._index_cache[:n],
+            copy=False
         )
+    
+    def _feed_to_dataframe(self, data_feed) -> pd.DataFrame:
+        """
+        Convert a feed's buffered bars to a DataFrame in one pass.
         
-        return df
+        Each line is sliced straight into a preallocated (N, 5) array, so
+        there is no per-bar Python work.
+        """
+        n = len(data_feed.datetime.get(size=len(data_feed)))
+        
+        values = np.empty((n, len(BAR_COLUMNS)), dtype=np.float64)
+        for col_idx, col in enumerate(BAR_COLUMNS):
+            values[:, col_idx] = getattr(data_feed.lines, col).get(size=n)
+        
+        index = pd.DatetimeIndex(
+            _num_to_ns(data_feed.datetime.get(size=n)).astype('datetime64[ns]')
+        ).tz_localize(TimeUtils.UTC).tz_convert(TimeUtils.EST)
+        
+        return pd.DataFrame(values, columns=BAR_COLUMNS, index=index, copy=False)
     
     def stop(self):
         """Called when backtest ends."""
-        if self.params.debug:
-            print("\n" + "="*70)
-            print("BACKTEST COMPLETE")
-            print("="*70)
-            
+        if __debug__ and self.params.debug:
             stats = self.risk_manager.get_performance_summary()
-            print(f"Total trades: {stats['total_trades']}")
-            print(f"Winners: {stats['winning_trades']}")
-            print(f"Losers: {stats['losing_trades']}")
-            print(f"Win rate: {stats['win_rate']:.1f}%")
-            print(f"Total P&L: ${stats['total_pnl_dollars']:,.2f}")
-            print(f"Total R: {stats['total_pnl_r']:.2f}R")
-            print(f"Final account: ${stats['account_size']:,.2f}")
-            print("="*70)
+            log.debug(
+                "\n%s\nBACKTEST COMPLETE\n%s\n"
+                "Total trades: %d\nWinners: %d\nLosers: %d\nWin rate: %.1f%%\n"
+                "Total P&L: $%s\nTotal R: %.2fR\nFinal account: $%s\n%s",
+                "="*70, "="*70,
+                stats['total_trades'],
+                stats['winning_trades'],
+                stats['losing_trades'],
+                stats['win_rate'],
+                f"{stats['total_pnl_dollars']:,.2f}",
+                stats['total_pnl_r'],
+                f"{stats['account_size']:,.2f}",
+                "="*70
+            )
+        
+        # Flush buffered debug output
+        if self._log_handler is not None:
+            self._log_handler.flush()
+            log.removeHandler(self._log_handler)
+            self._log_handler.close()
+            self._log_handler = None
 
 
 if __name__ == "__main__":
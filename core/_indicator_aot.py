@@ -0,0 +1,71 @@
+"""
+Ahead-of-Time Indicator Kernels
+===============================
+Compiles the indicator kernels in core/indicator_kernels.py into a native
+extension module (core/indicator_aot.*.so / .pyd) with numba.pycc, so
+backtests start without JIT warm-up.
+
+Build once per environment (requires numba and a C compiler):
+
+    python -m core._indicator_aot
+
+core/indicators.py imports the compiled module when present and falls back
+to the JIT (or pure numpy) kernels otherwise. Rebuild after changing
+core/indicator_kernels.py.
+"""
+
+import os
+
+from numba.pycc import CC
+
+from core import indicator_kernels as kernels
+
+
+cc = CC('indicator_aot')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+cc.export(
+    'daily_extremes_loop',
+    'Tuple((i8[:], f8[:], f8[:]))(f8[:], f8[:], i8[:])'
+)(kernels.daily_extremes_loop.py_func)
+
+cc.export(
+    'range_extremes_loop',
+    'Tuple((f8, f8, i8))(f8[:], f8[:], i8, i8)'
+)(kernels.range_extremes_loop.py_func)
+
+cc.export(
+    'rolling_mean_loop',
+    'f8[:](f8[:], i8)'
+)(kernels.rolling_mean_loop.py_func)
+
+# float32 variants for ISICalculator / SMTDetector(precision='f32')
+cc.export(
+    'rolling_mean_loop_f32',
+    'f8[:](f4[:], i8)'
+)(kernels.rolling_mean_loop.py_func)
+
+cc.export(
+    'isi_components_loop',
+    'Tuple((f8, f8, f8))(f8[:], f8[:], f8[:], f8[:])'
+)(kernels.isi_components_loop.py_func)
+
+cc.export(
+    'isi_components_loop_f32',
+    'Tuple((f8, f8, f8))(f4[:], f4[:], f4[:], f4[:])'
+)(kernels.isi_components_loop.py_func)
+
+cc.export(
+    'sweep_below_loop',
+    'i8(f8[:], f8)'
+)(kernels.sweep_below_loop.py_func)
+
+cc.export(
+    'sweep_above_loop',
+    'i8(f8[:], f8)'
+)(kernels.sweep_above_loop.py_func)
+
+
+if __name__ == "__main__":
+    cc.compile()
+    print(f"✅ Built {cc.name} in {cc.output_dir}")
@@ -0,0 +1,40 @@
+"""
+Ahead-of-Time Strategy Kernel
+=============================
+Compiles the session bar loop in core/strategy_kernels.py into a native
+extension module (core/strategy_aot.*.so / .pyd) with numba.pycc, so
+backtests and parameter sweeps start without JIT warm-up.
+
+Build once per environment (requires numba and a C compiler):
+
+    python -m core._strategy_aot
+
+core/strategy.py imports the compiled module when present and falls back
+to the JIT (or pure Python) kernel otherwise. Rebuild after changing
+core/strategy_kernels.py.
+"""
+
+import os
+
+from numba.pycc import CC
+
+from core import strategy_kernels as kernels
+
+
+cc = CC('strategy_aot')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# (open, high, low, close, body_ratio, times_ns, state, start,
+#  midnight_open, bias_sign, deviation_lookback, deviation_time_ns,
+#  reclaim_time_limit_ns, reclaim_body_ratio, stop_loss, tp1_price)
+cc.export(
+    'session_core_loop',
+    'Tuple((i8, i8, f8))('
+    'f8[:], f8[:], f8[:], f8[:], f8[:], i8[:], i8, i8, '
+    'f8, f8, i8, i8, i8, f8, f8, f8)'
+)(kernels.session_core_loop.py_func)
+
+
+if __name__ == "__main__":
+    cc.compile()
+    print(f"✅ Built {cc.name} in {cc.output_dir}")
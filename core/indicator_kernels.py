@@ -0,0 +1,289 @@
+"""
+Indicator Kernels
+=================
+Array-level inner loops for the indicators (ADR, ONS, ATR, ISI, SMT).
+
+The indicator classes in core/indicators.py unpack their DataFrames into
+numpy arrays and call these kernels. Kernels are JIT-compiled with numba
+when it is installed (see utils/_njit.py) and run as plain Python otherwise.
+
+Conventions:
+- timestamps are int64 nanoseconds since the Unix epoch (UTC)
+- day_keys are wall-clock days (local wall ns // DAY_NS) in the data's timezone
+- arrays must be in time order
+"""
+
+import numpy as np
+
+from utils._njit import njit, prange
+
+
+# Nanoseconds per day (wall-clock day bucketing)
+DAY_NS = 86_400_000_000_000
+
+
+@njit(cache=True)
+def daily_extremes_loop(high, low, day_keys):
+    """
+    Highest high and lowest low of each wall-clock day (daily bars).
+
+    Mirrors ``df.resample('1D').agg({'high': 'max', 'low': 'min'})``:
+    consecutive bars with the same day key form one day and NaN values
+    are ignored. A day with only NaN bars is kept with high=-inf and
+    low=+inf (resample's NaN row, dropped by the caller).
+
+    Args:
+        high: Bar highs
+        low: Bar lows
+        day_keys: Wall-clock day number of each bar
+
+    Returns:
+        Tuple of (days, day_highs, day_lows), oldest first
+    """
+    n = len(day_keys)
+    days = np.empty(n, dtype=np.int64)
+    day_highs = np.empty(n, dtype=np.float64)
+    day_lows = np.empty(n, dtype=np.float64)
+    count = 0
+
+    i = 0
+    while i < n:
+        day = day_keys[i]
+        day_high = -np.inf
+        day_low = np.inf
+        while i < n and day_keys[i] == day:
+            # NaN compares false and is skipped
+            if high[i] > day_high:
+                day_high = high[i]
+            if low[i] < day_low:
+                day_low = low[i]
+            i += 1
+
+        days[count] = day
+        day_highs[count] = day_high
+        day_lows[count] = day_low
+        count += 1
+
+    return days[:count], day_highs[:count], day_lows[:count]
+
+
+@njit(cache=True)
+def range_extremes_loop(high, low, start, end):
+    """
+    Highest high and lowest low of bars start <= i < end.
+
+    Callers locate the bar range with np.searchsorted on the timestamps,
+    so only the bars inside the window are read.
+
+    Returns:
+        Tuple of (high, low, bar_count); NaN values are ignored and an
+        empty or all-NaN range keeps -inf / +inf
+    """
+    range_high = -np.inf
+    range_low = np.inf
+    for i in range(start, end):
+        if high[i] > range_high:
+            range_high = high[i]
+        if low[i] < range_low:
+            range_low = low[i]
+    return range_high, range_low, max(end - start, 0)
+
+
+@njit(cache=True)
+def rolling_mean_loop(values, period):
+    """
+    Rolling mean over `period` values (running sum, one add and one
+    subtract per step).
+
+    Mirrors ``Series.rolling(period).mean()``, including its numerics, so
+    results stay identical on long series:
+    - the running sum is Kahan-compensated (separately for adds and
+      removes), so it does not drift over millions of steps
+    - a window of identical values returns that value exactly
+    - the first period-1 values, and any window containing a NaN, are NaN
+
+    Args:
+        values: Input series (e.g. true range)
+        period: Window length
+
+    Returns:
+        Array of rolling means, same length as values
+    """
+    n = len(values)
+    out = np.full(n, np.nan)
+    total = 0.0
+    add_compensation = 0.0
+    remove_compensation = 0.0
+    n_obs = 0
+    n_negative = 0
+    prev_value = values[0] if n > 0 else np.nan
+    n_same = 0  # consecutive values equal to prev_value
+
+    for i in range(n):
+        # Drop the value leaving the window
+        if i >= period:
+            old = values[i - period]
+            if not np.isnan(old):
+                n_obs -= 1
+                y = -old - remove_compensation
+                t = total + y
+                remove_compensation = t - total - y
+                total = t
+                if old < 0:
+                    n_negative -= 1
+
+        # Add the new value
+        value = values[i]
+        if not np.isnan(value):
+            n_obs += 1
+            y = value - add_compensation
+            t = total + y
+            add_compensation = t - total - y
+            total = t
+            if value < 0:
+                n_negative += 1
+            if value == prev_value:
+                n_same += 1
+            else:
+                n_same = 1
+                prev_value = value
+
+        if i >= period - 1 and n_obs == period:
+            mean = total / n_obs
+            if n_same >= n_obs:
+                mean = prev_value
+            elif n_negative == 0 and mean < 0:
+                mean = 0.0
+            elif n_negative == n_obs and mean > 0:
+                mean = 0.0
+            out[i] = mean
+
+    return out
+
+
+@njit(cache=True)
+def isi_components_loop(open_, high, low, close):
+    """
+    Candle averages used by the ISI, in one pass over the move's bars.
+
+    Mirrors the pandas version: zero-range bars are left out of the
+    ratio means (ranges.replace(0, np.nan)) and NaN values are skipped,
+    as Series.mean() does.
+
+    Args:
+        open_, high, low, close: Bar prices of the move
+
+    Returns:
+        Tuple of (avg_body_points, avg_body_ratio, avg_wick_ratio); a
+        mean with no valid values is NaN
+    """
+    body_sum = 0.0
+    body_count = 0
+    body_ratio_sum = 0.0
+    body_ratio_count = 0
+    wick_ratio_sum = 0.0
+    wick_ratio_count = 0
+
+    for i in range(len(open_)):
+        o = open_[i]
+        c = close[i]
+        body = abs(c - o)
+        if not np.isnan(body):
+            body_sum += body
+            body_count += 1
+
+        # Zero / NaN ranges are missing, as ranges.replace(0, np.nan)
+        range_size = high[i] - low[i]
+        if range_size == 0 or np.isnan(range_size):
+            continue
+        inv_range = 1.0 / range_size  # one divide shared by both ratios
+
+        body_ratio = body * inv_range
+        if not np.isnan(body_ratio):
+            body_ratio_sum += body_ratio
+            body_ratio_count += 1
+
+        # Upper + lower wick = (high - body top) + (body bottom - low)
+        # = range - body, so no max/min of open/close is needed. With one
+        # of open/close missing the body top and bottom coincide (pandas'
+        # NaN-skipping max/min(axis=1)), i.e. a zero body
+        if np.isnan(body):
+            wick_body = np.nan if np.isnan(o) and np.isnan(c) else 0.0
+        else:
+            wick_body = body
+
+        wick_ratio = (range_size - wick_body) * inv_range
+        if not np.isnan(wick_ratio):
+            wick_ratio_sum += wick_ratio
+            wick_ratio_count += 1
+
+    avg_body = body_sum / body_count if body_count > 0 else np.nan
+    avg_body_ratio = body_ratio_sum / body_ratio_count if body_ratio_count > 0 else np.nan
+    avg_wick_ratio = wick_ratio_sum / wick_ratio_count if wick_ratio_count > 0 else np.nan
+
+    return avg_body, avg_body_ratio, avg_wick_ratio
+
+
+@njit(cache=True)
+def sweep_below_loop(low, reference_level):
+    """
+    Bar of the lowest low if it swept below reference_level.
+
+    The lowest bar swept the level iff any bar did. Ties keep the first
+    bar and NaN lows are ignored (as np.nanargmin).
+
+    Returns:
+        Index of the sweep bar, or -1 if the level was not swept
+    """
+    best = -1
+    for i in range(len(low)):
+        if low[i] < reference_level and (best < 0 or low[i] < low[best]):
+            best = i
+    return best
+
+
+@njit(cache=True)
+def sweep_above_loop(high, reference_level):
+    """
+    Bar of the highest high if it swept above reference_level.
+
+    Mirror of sweep_below_loop (first bar on ties, NaN ignored).
+
+    Returns:
+        Index of the sweep bar, or -1 if the level was not swept
+    """
+    best = -1
+    for i in range(len(high)):
+        if high[i] > reference_level and (best < 0 or high[i] > high[best]):
+            best = i
+    return best
+
+
+@njit(cache=True, parallel=True)
+def range_extremes_batch_loop(high, low, starts, ends):
+    """
+    Highest high and lowest low of many bar ranges, one per target date.
+
+    Ranges are independent, so they are evaluated in parallel (prange).
+
+    Args:
+        high: Bar highs
+        low: Bar lows
+        starts: First bar index of each range (inclusive)
+        ends: Last bar index of each range (exclusive)
+
+    Returns:
+        Tuple of (highs, lows, bar_counts); NaN values are ignored and
+        empty or all-NaN ranges keep -inf / +inf
+    """
+    n = len(starts)
+    range_highs = np.empty(n, dtype=np.float64)
+    range_lows = np.empty(n, dtype=np.float64)
+    counts = np.empty(n, dtype=np.int64)
+
+    for k in prange(n):
+        range_highs[k], range_lows[k], counts[k] = range_extremes_loop(
+            high, low, starts[k], ends[k]
+        )
+
+    return range_highs, range_lows, counts
@@ -13,12 +13,282 @@ Indicators:
 All calculations are timezone-aware and use EST for strategy logic.
 """
 
+import weakref
 import pandas as pd
 import numpy as np
 from datetime import datetime, time
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, List, NamedTuple
 from utils.time_utils import TimeUtils
 from utils.config_loader import Config
+from utils._njit import NUMBA_AVAILABLE
+from utils._results import ResultMapping
+from core.indicator_kernels import DAY_NS, range_extremes_batch_loop
+
+try:
+    import bottleneck as bn
+except ImportError:  # pragma: no cover - optional dependency
+    bn = None
+
+# Prefer the ahead-of-time build (python -m core._indicator_aot) to skip
+# JIT warm-up; fall back to the JIT / pure numpy kernels
+try:
+    from core.indicator_aot import (
+        daily_extremes_loop,
+        range_extremes_loop,
+        rolling_mean_loop,
+        rolling_mean_loop_f32,
+        isi_components_loop,
+        isi_components_loop_f32,
+        sweep_below_loop,
+        sweep_above_loop,
+    )
+    _COMPILED_KERNELS = True
+except ImportError:
+    _COMPILED_KERNELS = NUMBA_AVAILABLE
+    from core.indicator_kernels import (
+        daily_extremes_loop,
+        range_extremes_loop,
+        rolling_mean_loop,
+        isi_components_loop,
+        sweep_below_loop,
+        sweep_above_loop,
+    )
+    # The JIT kernels specialize on the array dtype by themselves
+    rolling_mean_loop_f32 = rolling_mean_loop
+    isi_components_loop_f32 = isi_components_loop
+
+
+# Array dtypes for the ATR / ISI `precision` option
+PRECISIONS = {'f64': np.float64, 'f32': np.float32}
+
+# One row per reference level pair from SMTDetector.detect_divergence_batch
+SMT_BATCH_DTYPE = np.dtype([
+    ('smt_binary', '?'),
+    ('smt_degree', 'f8'),
+    ('a_swept', '?'),
+    ('a_sweep_depth_norm', 'f8'),
+    ('b_swept', '?'),
+    ('b_sweep_depth_norm', 'f8'),
+])
+
+# One row per target date from ONSFilter.validate_batch
+ONS_BATCH_DTYPE = np.dtype([
+    ('valid', '?'),
+    ('ratio', 'f8'),
+    ('adr', 'f8'),
+    ('ons_range', 'f8'),
+    ('ons_high', 'f8'),
+    ('ons_low', 'f8'),
+])
+
+
+class _ONSFields(NamedTuple):
+    valid: bool
+    ons_range: float
+    ons_high: float
+    ons_low: float
+    adr: float
+    ratio: float
+    reason: Optional[str]
+
+
+class ONSResult(ResultMapping, _ONSFields):
+    """ONSFilter.validate result (reason is None when valid)."""
+    __slots__ = ()
+
+
+class _ISIFields(NamedTuple):
+    isi: float
+    avg_body_ratio: float
+    consecutive_bars: int
+    avg_wick_ratio: float
+    atr: float
+    assessment: str
+
+
+class ISIResult(ResultMapping, _ISIFields):
+    """ISICalculator.calculate result."""
+    __slots__ = ()
+
+
+class _SweepFields(NamedTuple):
+    swept: bool
+    sweep_depth: float
+    sweep_depth_norm: float
+    sweep_price: Optional[float]
+    sweep_time: Optional[pd.Timestamp]
+    direction: str
+
+
+class SweepResult(ResultMapping, _SweepFields):
+    """
+    SMTDetector.detect_sweep result.
+    
+    sweep_price is the lowest low ('below') or highest high ('above');
+    the dict view keys it 'sweep_low' / 'sweep_high' as in v1.0.
+    """
+    __slots__ = ()
+    
+    def _asdict(self) -> Dict[str, Any]:
+        return {
+            'swept': self.swept,
+            'sweep_depth': self.sweep_depth,
+            'sweep_depth_norm': self.sweep_depth_norm,
+            'sweep_low' if self.direction == 'below' else 'sweep_high': self.sweep_price,
+            'sweep_time': self.sweep_time
+        }
+
+
+class _SMTFields(NamedTuple):
+    smt_binary: bool
+    smt_degree: float
+    instrument_a_sweep: SweepResult
+    instrument_b_sweep: SweepResult
+
+
+class SMTResult(ResultMapping, _SMTFields):
+    """SMTDetector.detect_divergence result."""
+    __slots__ = ()
+
+
+def _ordered(df: pd.DataFrame) -> pd.DataFrame:
+    """Return df sorted by time (kernels expect time-ordered arrays)."""
+    if df.index.is_monotonic_increasing:
+        return df
+    return df.sort_index()
+
+
+def _column(df: pd.DataFrame, name: str, dtype=np.float64) -> np.ndarray:
+    """Column as a contiguous array (no copy when already one of dtype)."""
+    return np.ascontiguousarray(df[name].to_numpy(dtype=dtype))
+
+
+def _ohlc_arrays(
+    df: pd.DataFrame,
+    dtype=np.float64
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Open, high, low and close columns, converted once at the boundary."""
+    return tuple(_column(df, name, dtype) for name in ('open', 'high', 'low', 'close'))
+
+
+def _precision_dtype(precision: str):
+    """numpy dtype for a `precision` option ('f64' or 'f32')."""
+    if precision not in PRECISIONS:
+        raise ValueError(f"Unknown precision '{precision}'. Use one of {tuple(PRECISIONS)}")
+    return PRECISIONS[precision]
+
+
+def _rolling_mean(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Rolling mean kernel for values' dtype (float64 or float32).
+    
+    Without numba (and no AOT build) the kernel is a Python loop, so
+    bottleneck's C move_mean is used when installed. Its running sum is
+    not compensated: results can differ from pandas in the last bits.
+    """
+    if not _COMPILED_KERNELS and bn is not None:
+        return bn.move_mean(values, window=period, min_count=period).astype(np.float64, copy=False)
+    if values.dtype == np.float32:
+        return rolling_mean_loop_f32(values, period)
+    return rolling_mean_loop(values, period)
+
+
+def _isi_components(open_, high, low, close) -> Tuple[float, float, float]:
+    """ISI candle averages kernel for the arrays' dtype (float64 or float32)."""
+    if open_.dtype == np.float32:
+        return isi_components_loop_f32(open_, high, low, close)
+    return isi_components_loop(open_, high, low, close)
+
+
+# UTC epoch ns of the DatetimeIndexes seen, keyed by id(); an entry is
+# dropped when its index is garbage collected
+_INDEX_NS_CACHE: Dict[int, Tuple[weakref.ref, np.ndarray]] = {}
+
+
+def _index_ns(index: pd.DatetimeIndex) -> np.ndarray:
+    """
+    UTC epoch nanoseconds of a DatetimeIndex (naive is treated as UTC).
+    
+    Indexes are immutable, so the conversion (a full copy for non-ns
+    units, e.g. pandas' default 'us') is done once per index object.
+    """
+    key = id(index)
+    entry = _INDEX_NS_CACHE.get(key)
+    if entry is not None and entry[0]() is index:
+        return entry[1]
+    
+    values = index.as_unit('ns').asi8
+    _INDEX_NS_CACHE[key] = (
+        weakref.ref(index, lambda _, key=key: _INDEX_NS_CACHE.pop(key, None)),
+        values
+    )
+    return values
+
+
+def _timestamp_ns(dt: datetime) -> int:
+    """UTC epoch nanoseconds of a timezone-aware datetime."""
+    return pd.Timestamp(dt).value
+
+
+def _true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """
+    True range: max of high-low, |high-prev close| and |low-prev close|.
+    
+    np.fmax skips NaN like DataFrame.max(axis=1), so the first bar (no
+    previous close) is high-low.
+    """
+    prev_close = np.empty_like(close)
+    prev_close[0] = np.nan
+    prev_close[1:] = close[:-1]
+    
+    tr = np.fmax(high - low, np.abs(high - prev_close))
+    return np.fmax(tr, np.abs(low - prev_close), out=tr)
+
+
+def _atr_values(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> np.ndarray:
+    """ATR: rolling mean of the true range."""
+    if len(close) == 0:
+        return np.empty(0, dtype=np.float64)
+    return _rolling_mean(_true_range(high, low, close), period)
+
+
+# ATR series shared by ISICalculator and SMTDetector, keyed by
+# (id(df), period, dtype); entries are dropped when their frame is collected
+_ATR_CACHE: Dict[Tuple[int, int, str], Tuple[weakref.ref, int, pd.Series]] = {}
+
+
+def _atr(df: pd.DataFrame, period: int, dtype=np.float64) -> pd.Series:
+    """
+    ATR series of df, computed once per frame, period and input dtype.
+    
+    A cached series is reused while the frame is the same object with the
+    same number of bars (frames are not modified in place by callers).
+    """
+    key = (id(df), period, np.dtype(dtype).str)
+    entry = _ATR_CACHE.get(key)
+    if entry is not None and entry[0]() is df and entry[1] == len(df):
+        return entry[2]
+    
+    _, high, low, close = _ohlc_arrays(df, dtype)
+    atr = pd.Series(_atr_values(high, low, close, period), index=df.index)
+    _ATR_CACHE[key] = (
+        weakref.ref(df, lambda _, key=key: _ATR_CACHE.pop(key, None)),
+        len(df),
+        atr
+    )
+    return atr
+
+
+def _buffer_id(values: np.ndarray) -> Tuple[Any, int, Tuple[int, ...]]:
+    """Identity of the memory an array views: (owner, address, strides)."""
+    owner = values if values.base is None else values.base
+    return owner, values.__array_interface__['data'][0], values.strides
+
+
+def _wall_ns(timestamps: np.ndarray, tz) -> np.ndarray:
+    """Wall-clock nanoseconds in tz for UTC epoch nanosecond timestamps."""
+    index = pd.DatetimeIndex(timestamps.astype('datetime64[ns]'))
+    return index.tz_localize(TimeUtils.UTC).tz_convert(tz).tz_localize(None).asi8
 
 
 class MidnightOpenCalculator:
@@ -43,6 +313,42 @@ class MidnightOpenCalculator:
         Returns:
             Midnight open price (open at 00:00 EST)
         
+        Raises:
+            ValueError: If no data exists at midnight
+        """
+        cache_key = TimeUtils.to_est(target_date).date()
+        if cache_key in self._cache:
+            return self._cache[cache_key]
+        
+        df = _ordered(df)
+        try:
+            return self.calculate_arrays(
+                _column(df, 'open'), _index_ns(df.index), target_date
+            )
+        except ValueError as e:
+            if df.empty:
+                raise
+            raise ValueError(
+                f"{e}. Available range: {df.index[0]} to {df.index[-1]}"
+            ) from None
+    
+    def calculate_arrays(
+        self,
+        open_: np.ndarray,
+        timestamps: np.ndarray,
+        target_date: datetime
+    ) -> float:
+        """
+        Get midnight open price from raw arrays.
+        
+        Args:
+            open_: Bar open prices (time-ordered)
+            timestamps: Bar timestamps as UTC epoch nanoseconds
+            target_date: The date to get midnight open for
+        
+        Returns:
+            Midnight open price (open at 00:00 EST)
+        
         Raises:
             ValueError: If no data exists at midnight
         """
@@ -55,26 +361,18 @@ class MidnightOpenCalculator:
         if cache_key in self._cache:
             return self._cache[cache_key]
         
-        # Ensure dataframe index is in EST
-        if df.index.tz != TimeUtils.EST:
-            df = df.copy()
-            df.index = df.index.tz_convert(TimeUtils.EST)
-        
-        # Find the bar at or immediately after midnight
-        # Some data sources might not have exact midnight bar
-        midnight_bars = df[
-            (df.index >= midnight) &
-            (df.index < midnight + pd.Timedelta(minutes=5))
-        ]
+        # Find the bar at or immediately after midnight (binary search on
+        # the sorted timestamps). Some data sources might not have exact
+        # midnight bar
+        start_ns = _timestamp_ns(midnight)
+        end_ns = start_ns + 5 * 60 * 1_000_000_000
+        i = int(np.searchsorted(timestamps, start_ns))
+        mo_price = open_[i] if i < len(timestamps) and timestamps[i] < end_ns else np.nan
         
-        if midnight_bars.empty:
-            raise ValueError(
-                f"No data found at midnight {midnight}. "
-                f"Available range: {df.index[0]} to {df.index[-1]}"
-            )
+        if np.isnan(mo_price):
+            raise ValueError(f"No data found at midnight {midnight}")
         
-        # Use the open of the first bar at/after midnight
-        mo_price = midnight_bars.iloc[0]['open']
+        mo_price = float(mo_price)
         
         # Cache it
         self._cache[cache_key] = mo_price
@@ -94,14 +392,31 @@ class ADRCalculator:
     Used for normalizing overnight ranges and sweep depths.
     """
     
-    def __init__(self, lookback_days: int = 20):
+    ENGINES = ('pandas', 'polars')
+    
+    def __init__(self, lookback_days: int = 20, engine: str = 'pandas'):
         """
         Initialize ADR calculator.
         
         Args:
             lookback_days: Number of days to average (default: 20 from config)
+            engine: 'pandas' (numpy kernels, default) or 'polars' (lazy,
+                multi-threaded daily aggregation for very long histories;
+                requires the optional polars package). Only calculate()
+                uses the engine; calculate_arrays() always uses the kernels.
         """
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown ADR engine '{engine}'. Use one of {self.ENGINES}")
+        
         self.lookback_days = lookback_days
+        self.engine = engine
+        
+        # Daily bars of the last bar arrays seen; extended with only the
+        # new bars while the caller keeps appending to the same buffers
+        self._daily_cache: Optional[Dict[str, Any]] = None
+        
+        # Polars copy of the last frame seen: (weakref to df, bar count, frame)
+        self._polars_cache = None
     
     def calculate(self, df: pd.DataFrame, as_of_date: datetime) -> float:
         """
@@ -114,39 +429,209 @@ class ADRCalculator:
         Returns:
             ADR value
         
+        Raises:
+            ValueError: If insufficient data
+        """
+        if self.engine == 'polars':
+            return self._calculate_polars(df, as_of_date)
+        
+        # Daily bars are bucketed in the data's own timezone
+        df = _ordered(df)
+        return self.calculate_arrays(
+            _column(df, 'high'),
+            _column(df, 'low'),
+            _index_ns(df.index),
+            as_of_date,
+            tz=df.index.tz or TimeUtils.UTC
+        )
+    
+    def calculate_arrays(
+        self,
+        high: np.ndarray,
+        low: np.ndarray,
+        timestamps: np.ndarray,
+        as_of_date: datetime,
+        tz=TimeUtils.EST
+    ) -> float:
+        """
+        Calculate ADR from raw arrays.
+        
+        Args:
+            high: Bar highs (time-ordered)
+            low: Bar lows (time-ordered)
+            timestamps: Bar timestamps as UTC epoch nanoseconds
+            as_of_date: Calculate ADR up to this date (exclusive)
+            tz: Timezone whose calendar days define the daily bars
+        
+        Returns:
+            ADR value
+        
         Raises:
             ValueError: If insufficient data
         """
         # Convert to EST
         as_of_est = TimeUtils.to_est(as_of_date)
         
-        # Resample to daily bars (if not already)
-        daily = df.resample('1D').agg({
-            'open': 'first',
-            'high': 'max',
-            'low': 'min',
-            'close': 'last'
-        }).dropna()
+        days, day_highs, day_lows = self._daily_bars(high, low, timestamps, tz)
+        cutoff_wall_ns = _wall_ns(
+            np.array([_timestamp_ns(as_of_est)], dtype=np.int64), tz
+        )[0]
+        
+        # Days starting before the cutoff that had valid bars
+        # (like resample().dropna() then daily.index < as_of)
+        historical = (
+            (days * DAY_NS < cutoff_wall_ns)
+            & (day_highs != -np.inf)
+            & (day_lows != np.inf)
+        )
+        ranges = day_highs[historical] - day_lows[historical]
+        available = len(ranges)
+        
+        if available < self.lookback_days:
+            raise ValueError(
+                f"Insufficient data for ADR calculation. "
+                f"Need {self.lookback_days} days, have {available}"
+            )
         
-        # Get data before as_of_date
-        historical = daily[daily.index < as_of_est]
+        return float(ranges[available - self.lookback_days:].mean())
+    
+    def _calculate_polars(self, df: pd.DataFrame, as_of_date: datetime) -> float:
+        """
+        Calculate ADR with a Polars lazy query (engine='polars').
         
-        if len(historical) < self.lookback_days:
+        Same definition as the pandas path: daily bars are wall-clock days
+        in the data's timezone, NaN-only days are dropped, and days whose
+        start is before as_of_date are averaged.
+        """
+        import polars as pl
+        
+        bars = self._polars_frame(df)
+        
+        # Compare day labels in the data's own timezone (naive = UTC)
+        as_of = pd.Timestamp(TimeUtils.to_est(as_of_date))
+        as_of = as_of.tz_convert(df.index.tz) if df.index.tz else as_of.tz_convert(TimeUtils.UTC).tz_localize(None)
+        
+        daily = (
+            bars
+            .group_by_dynamic('ts', every='1d')
+            .agg(pl.col('high').max(), pl.col('low').min())
+            .drop_nulls()
+            .filter(pl.col('ts') < as_of.to_pydatetime())
+            .select((pl.col('high') - pl.col('low')).alias('range'))
+            .collect()
+        )
+        
+        available = daily.height
+        if available < self.lookback_days:
             raise ValueError(
                 f"Insufficient data for ADR calculation. "
-                f"Need {self.lookback_days} days, have {len(historical)}"
+                f"Need {self.lookback_days} days, have {available}"
             )
         
-        # Get last N days
-        last_n = historical.tail(self.lookback_days)
-        
-        # Calculate daily ranges
-        daily_ranges = last_n['high'] - last_n['low']
+        return float(daily['range'].tail(self.lookback_days).mean())
+    
+    def _polars_frame(self, df: pd.DataFrame):
+        """Lazy Polars frame (ts, high, low) of df, converted once per frame."""
+        import polars as pl
+        
+        if self._polars_cache is not None:
+            df_ref, n_bars, bars = self._polars_cache
+            if df_ref() is df and n_bars == len(df):
+                return bars
+        
+        # Built from numpy columns (no pyarrow needed); timestamps carry
+        # the data's timezone so days are wall-clock days, naive = UTC
+        ts = pl.Series('ts', _index_ns(df.index)).cast(pl.Datetime('ns', time_zone='UTC'))
+        if df.index.tz is not None:
+            ts = ts.dt.convert_time_zone(str(df.index.tz))
+        else:
+            ts = ts.dt.replace_time_zone(None)
+        
+        # NaN prices become nulls, which the daily max/min skip
+        bars = pl.DataFrame({
+            'ts': ts,
+            'high': _column(df, 'high'),
+            'low': _column(df, 'low'),
+        }).lazy().with_columns(
+            pl.col('high', 'low').fill_nan(None)
+        ).sort('ts')
+        self._polars_cache = (weakref.ref(df), len(df), bars)
+        
+        return bars
+    
+    def _daily_bars(
+        self,
+        high: np.ndarray,
+        low: np.ndarray,
+        timestamps: np.ndarray,
+        tz
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Daily bars (day keys, highs, lows) of the given minute bars.
         
-        # Average
-        adr = daily_ranges.mean()
+        The result is cached for the arrays' underlying buffers. A later
+        call on a longer view of the same buffers (a backtest appending
+        bars) only aggregates the new bars; bars already seen must not be
+        modified in place.
+        """
+        sources = [_buffer_id(values) for values in (high, low, timestamps)]
+        n_bars = len(timestamps)
+        
+        cache = self._daily_cache
+        start = 0
+        if (
+            cache is not None
+            and cache['tz'] == tz
+            and cache['n_bars'] <= n_bars
+            and all(
+                ref() is owner and key == (address, strides)
+                for (ref, key), (owner, address, strides) in zip(cache['sources'], sources)
+            )
+        ):
+            start = cache['n_bars']
+            if start == n_bars:
+                return cache['days'], cache['highs'], cache['lows']
+        
+        # Daily bars are keyed by wall-clock date, like resample('1D')
+        day_keys = _wall_ns(timestamps[start:], tz) // DAY_NS
+        days, day_highs, day_lows = daily_extremes_loop(
+            high[start:], low[start:], day_keys
+        )
+        
+        if start > 0:
+            old_days, old_highs, old_lows = cache['days'], cache['highs'], cache['lows']
+            
+            # New bars may continue the last cached day
+            if len(days) and len(old_days) and days[0] == old_days[-1]:
+                old_highs = old_highs.copy()
+                old_lows = old_lows.copy()
+                old_highs[-1] = max(old_highs[-1], day_highs[0])
+                old_lows[-1] = min(old_lows[-1], day_lows[0])
+                days, day_highs, day_lows = days[1:], day_highs[1:], day_lows[1:]
+            
+            days = np.concatenate([old_days, days])
+            day_highs = np.concatenate([old_highs, day_highs])
+            day_lows = np.concatenate([old_lows, day_lows])
+        
+        try:
+            refs = [weakref.ref(owner) for owner, _, _ in sources]
+        except TypeError:  # buffer owner without weakref support
+            self._daily_cache = None
+            return days, day_highs, day_lows
+        
+        self._daily_cache = {
+            'sources': [
+                (ref, (address, strides))
+                for ref, (_, address, strides) in zip(refs, sources)
+            ],
+            'tz': tz,
+            'n_bars': n_bars,
+            'days': days,
+            'highs': day_highs,
+            'lows': day_lows,
+        }
         
-        return adr
+        return days, day_highs, day_lows
 
 
 class ONSFilter:
@@ -192,6 +677,30 @@ class ONSFilter:
             df: DataFrame with OHLC data
             target_date: The date to calculate ONS for
         
+        Returns:
+            Tuple of (ons_high, ons_low, ons_range)
+        """
+        df = _ordered(df)
+        return self.calculate_ons_range_arrays(
+            _column(df, 'high'), _column(df, 'low'), _index_ns(df.index), target_date
+        )
+    
+    def calculate_ons_range_arrays(
+        self,
+        high: np.ndarray,
+        low: np.ndarray,
+        timestamps: np.ndarray,
+        target_date: datetime
+    ) -> Tuple[float, float, float]:
+        """
+        Calculate overnight session range from raw arrays.
+        
+        Args:
+            high: Bar highs
+            low: Bar lows
+            timestamps: Bar timestamps as UTC epoch nanoseconds
+            target_date: The date to calculate ONS for
+        
         Returns:
             Tuple of (ons_high, ons_low, ons_range)
         """
@@ -200,19 +709,22 @@ class ONSFilter:
         # Get overnight period
         ons_start, ons_end = TimeUtils.get_overnight_range_period(target_est)
         
-        # Filter data to overnight period
-        ons_data = df[
-            (df.index >= ons_start) &
-            (df.index <= ons_end)
-        ]
+        # The window is a contiguous run of the sorted bars (inclusive)
+        start = int(np.searchsorted(timestamps, _timestamp_ns(ons_start), side='left'))
+        end = int(np.searchsorted(timestamps, _timestamp_ns(ons_end), side='right'))
+        ons_high, ons_low, count = range_extremes_loop(high, low, start, end)
         
-        if ons_data.empty:
+        if count == 0:
             raise ValueError(
                 f"No data in overnight session {ons_start} to {ons_end}"
             )
         
-        ons_high = ons_data['high'].max()
-        ons_low = ons_data['low'].min()
+        # All-NaN window (matches pandas max/min of NaN)
+        if np.isinf(ons_high) or np.isinf(ons_low):
+            return np.nan, np.nan, np.nan
+        
+        ons_high = float(ons_high)
+        ons_low = float(ons_low)
         ons_range = ons_high - ons_low
         
         return ons_high, ons_low, ons_range
@@ -221,7 +733,7 @@ class ONSFilter:
         self,
         df: pd.DataFrame,
         target_date: datetime
-    ) -> Dict[str, Any]:
+    ) -> ONSResult:
         """
         Validate overnight session range against ADR.
         
@@ -230,21 +742,70 @@ class ONSFilter:
             target_date: Date to validate
         
         Returns:
-            Dict with validation results:
-            {
-                'valid': bool,
-                'ons_range': float,
-                'adr': float,
-                'ratio': float,
-                'reason': str (if invalid)
-            }
+            ONSResult (fields: valid, ons_range, ons_high, ons_low, adr,
+            ratio, reason - None if valid); also readable as a dict
+        """
+        df = _ordered(df)
+        return self.validate_arrays(
+            _column(df, 'high'),
+            _column(df, 'low'),
+            _index_ns(df.index),
+            target_date,
+            tz=df.index.tz or TimeUtils.UTC
+        )
+    
+    def validate_arrays(
+        self,
+        high: np.ndarray,
+        low: np.ndarray,
+        timestamps: np.ndarray,
+        target_date: datetime,
+        tz=TimeUtils.EST
+    ) -> ONSResult:
+        """
+        Validate overnight session range against ADR from raw arrays.
+        
+        Args:
+            high: Bar highs (time-ordered)
+            low: Bar lows (time-ordered)
+            timestamps: Bar timestamps as UTC epoch nanoseconds
+            target_date: Date to validate
+            tz: Timezone whose calendar days define the ADR daily bars
+        
+        Returns:
+            ONSResult (see validate)
         """
         # Calculate ONS range
-        ons_high, ons_low, ons_range = self.calculate_ons_range(df, target_date)
+        ons_high, ons_low, ons_range = self.calculate_ons_range_arrays(
+            high, low, timestamps, target_date
+        )
         
         # Calculate ADR (up to target date, not including it)
-        adr = self.adr_calculator.calculate(df, target_date)
+        adr = self.adr_calculator.calculate_arrays(
+            high, low, timestamps, target_date, tz=tz
+        )
         
+        return self.evaluate(ons_high, ons_low, ons_range, adr)
+    
+    def evaluate(
+        self,
+        ons_high: float,
+        ons_low: float,
+        ons_range: float,
+        adr: float
+    ) -> ONSResult:
+        """
+        Validate an already calculated overnight range against ADR.
+        
+        Args:
+            ons_high: Overnight session high
+            ons_low: Overnight session low
+            ons_range: Overnight session range
+            adr: ADR as of the target date
+        
+        Returns:
+            ONSResult (see validate)
+        """
         # Calculate ratio
         ratio = ons_range / adr
         
@@ -259,15 +820,92 @@ class ONSFilter:
             else:
                 reason = f"ONS too wide: {ratio:.2%} > {self.max_ratio:.2%}"
         
-        return {
-            'valid': valid,
-            'ons_range': ons_range,
-            'ons_high': ons_high,
-            'ons_low': ons_low,
-            'adr': adr,
-            'ratio': ratio,
-            'reason': reason
-        }
+        return ONSResult(
+            valid=valid,
+            ons_range=ons_range,
+            ons_high=ons_high,
+            ons_low=ons_low,
+            adr=adr,
+            ratio=ratio,
+            reason=reason
+        )
+    
+    def validate_batch(
+        self,
+        df: pd.DataFrame,
+        target_dates: List[datetime]
+    ) -> np.ndarray:
+        """
+        Validate many dates at once (e.g. every session of a backtest).
+        
+        Daily bars for the ADR are built once, and the overnight ranges of
+        all dates are scanned in parallel. Values match validate() for each
+        date; dates validate() would raise on (no overnight bars, too few
+        ADR days) get NaN values and valid=False instead.
+        
+        Args:
+            df: DataFrame with OHLC data
+            target_dates: Dates to validate
+        
+        Returns:
+            Structured array (ONS_BATCH_DTYPE), one row per target date
+        """
+        df = _ordered(df)
+        high = _column(df, 'high')
+        low = _column(df, 'low')
+        timestamps = _index_ns(df.index)
+        tz = df.index.tz or TimeUtils.UTC
+        
+        results = np.zeros(len(target_dates), dtype=ONS_BATCH_DTYPE)
+        if len(target_dates) == 0:
+            return results
+        
+        # Overnight windows -> bar index ranges (inclusive on both ends)
+        windows = [
+            TimeUtils.get_overnight_range_period(TimeUtils.to_est(target_date))
+            for target_date in target_dates
+        ]
+        ons_starts = np.array([_timestamp_ns(start) for start, _ in windows], dtype=np.int64)
+        ons_ends = np.array([_timestamp_ns(end) for _, end in windows], dtype=np.int64)
+        ons_highs, ons_lows, counts = range_extremes_batch_loop(
+            high,
+            low,
+            np.searchsorted(timestamps, ons_starts, side='left'),
+            np.searchsorted(timestamps, ons_ends, side='right')
+        )
+        
+        has_range = (counts > 0) & (ons_highs != -np.inf) & (ons_lows != np.inf)
+        results['ons_high'] = np.where(has_range, ons_highs, np.nan)
+        results['ons_low'] = np.where(has_range, ons_lows, np.nan)
+        results['ons_range'] = results['ons_high'] - results['ons_low']
+        
+        # ADR: mean range of the last lookback days before each date
+        adr_calc = self.adr_calculator
+        days, day_highs, day_lows = adr_calc._daily_bars(high, low, timestamps, tz)
+        valid_days = (day_highs != -np.inf) & (day_lows != np.inf)
+        ranges = day_highs[valid_days] - day_lows[valid_days]
+        
+        cutoffs = _wall_ns(
+            np.array([
+                _timestamp_ns(TimeUtils.to_est(target_date))
+                for target_date in target_dates
+            ], dtype=np.int64),
+            tz
+        )
+        n_before = np.searchsorted(days[valid_days] * DAY_NS, cutoffs, side='left')
+        
+        lookback = adr_calc.lookback_days
+        results['adr'] = [
+            ranges[n - lookback:n].mean() if n >= lookback else np.nan
+            for n in n_before
+        ]
+        
+        results['ratio'] = results['ons_range'] / results['adr']
+        results['valid'] = (
+            (results['ratio'] >= self.min_ratio) & (results['ratio'] <= self.max_ratio)
+        )
+        
+        return results
 
 
 class ISICalculator:
@@ -292,7 +930,8 @@ class ISICalculator:
         self,
         threshold_min: float = 1.2,
         threshold_max: float = 2.0,
-        atr_period: int = 14
+        atr_period: int = 14,
+        precision: str = 'f64'
     ):
         """
         Initialize ISI calculator.
@@ -301,10 +940,16 @@ class ISICalculator:
             threshold_min: Below this = fade OK
             threshold_max: Above this = no fade (strong trend)
             atr_period: Period for ATR calculation
+            precision: Price arrays as 'f64' (default) or 'f32' (half the
+                memory traffic; 0.25-tick futures prices are exact in
+                float32 and sums accumulate in float64). Results are
+                Python floats either way.
         """
         self.threshold_min = threshold_min
         self.threshold_max = threshold_max
         self.atr_period = atr_period
+        self.precision = precision
+        self._dtype = _precision_dtype(precision)
     
     def calculate_atr(self, df: pd.DataFrame, period: int = 14) -> pd.Series:
         """
@@ -317,29 +962,14 @@ class ISICalculator:
         Returns:
             Series of ATR values
         """
-        high = df['high']
-        low = df['low']
-        close = df['close']
-        
-        # True Range components
-        tr1 = high - low
-        tr2 = abs(high - close.shift())
-        tr3 = abs(low - close.shift())
-        
-        # True Range = max of the three
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        
-        # ATR = moving average of TR
-        atr = tr.rolling(window=period).mean()
-        
-        return atr
+        return _atr(df, period, self._dtype)
     
     def calculate(
         self,
         df: pd.DataFrame,
         start_idx: int,
         end_idx: int
-    ) -> Dict[str, Any]:
+    ) -> ISIResult:
         """
         Calculate ISI for a price move between two indices.
         
@@ -349,54 +979,58 @@ class ISICalculator:
             end_idx: End of move (deviation end/reclaim)
         
         Returns:
-            Dict with ISI calculation:
-            {
-                'isi': float,
-                'avg_body_ratio': float,
-                'consecutive_bars': int,
-                'avg_wick_ratio': float,
-                'atr': float,
-                'assessment': str ('FADE_OK', 'WAIT', 'NO_FADE')
-            }
-        """
-        # Get the bars in the move
-        move_bars = df.iloc[start_idx:end_idx+1]
-        
-        if len(move_bars) < 2:
-            return {
-                'isi': 0.0,
-                'avg_body_ratio': 0.0,
-                'consecutive_bars': 0,
-                'avg_wick_ratio': 1.0,
-                'atr': 0.0,
-                'assessment': 'INSUFFICIENT_DATA'
-            }
-        
-        # Calculate ATR at the end of the move
-        atr_series = self.calculate_atr(df, period=self.atr_period)
-        atr = atr_series.iloc[end_idx]
-        
-        if pd.isna(atr) or atr == 0:
-            atr = (df['high'].iloc[end_idx] - df['low'].iloc[end_idx]) * 1.5
-        
-        # Component 1: Average body ratio
-        bodies = abs(move_bars['close'] - move_bars['open'])
-        ranges = move_bars['high'] - move_bars['low']
-        body_ratios = bodies / ranges.replace(0, np.nan)
-        avg_body_ratio = body_ratios.mean()
+            ISIResult (also readable as a dict):
+            (
+                isi: float,
+                avg_body_ratio: float,
+                consecutive_bars: int,
+                avg_wick_ratio: float,
+                atr: float,
+                assessment: str ('FADE_OK', 'WAIT', 'NO_FADE')
+            )
+        """
+        # Pull each column once (float64 views, no frame copy); only the
+        # bars used below are sliced and, for precision='f32', converted
+        open_, high, low, close = _ohlc_arrays(df)
+        move = slice(start_idx, end_idx + 1)
+        move_bars = [
+            np.ascontiguousarray(values[move], dtype=self._dtype)
+            for values in (open_, high, low, close)
+        ]
         
         # Component 2: Consecutive bars in same direction
-        consecutive_bars = len(move_bars)
+        consecutive_bars = len(move_bars[0])
+        
+        if consecutive_bars < 2:
+            return ISIResult(
+                isi=0.0,
+                avg_body_ratio=0.0,
+                consecutive_bars=0,
+                avg_wick_ratio=1.0,
+                atr=0.0,
+                assessment='INSUFFICIENT_DATA'
+            )
+        
+        # Calculate ATR at the end of the move (only the bars it depends
+        # on: `period` true ranges, each needing the previous close)
+        end_pos = range(len(df))[end_idx]
+        tail = slice(max(0, end_pos - self.atr_period), end_pos + 1)
+        tail_bars = [
+            np.ascontiguousarray(values[tail], dtype=self._dtype)
+            for values in (high, low, close)
+        ]
+        atr = float(_atr_values(*tail_bars, self.atr_period)[-1])
+        
+        if np.isnan(atr) or atr == 0:
+            atr = float(high[end_pos] - low[end_pos]) * 1.5
         
+        # Component 1: Average body ratio
         # Component 3: Average wick ratio
-        upper_wicks = move_bars['high'] - move_bars[['open', 'close']].max(axis=1)
-        lower_wicks = move_bars[['open', 'close']].min(axis=1) - move_bars['low']
-        total_wicks = upper_wicks + lower_wicks
-        wick_ratios = total_wicks / ranges.replace(0, np.nan)
-        avg_wick_ratio = wick_ratios.mean()
+        avg_body_points, avg_body_ratio, avg_wick_ratio = (
+            float(value) for value in _isi_components(*move_bars)
+        )
         
         # Calculate ISI
-        avg_body_points = bodies.mean()
         isi = (avg_body_points / atr) * consecutive_bars * (1 - avg_wick_ratio)
         
         # Assess
@@ -407,14 +1041,14 @@ class ISICalculator:
         else:
             assessment = 'WAIT'
         
-        return {
-            'isi': isi,
-            'avg_body_ratio': avg_body_ratio,
-            'consecutive_bars': consecutive_bars,
-            'avg_wick_ratio': avg_wick_ratio,
-            'atr': atr,
-            'assessment': assessment
-        }
+        return ISIResult(
+            isi=isi,
+            avg_body_ratio=avg_body_ratio,
+            consecutive_bars=consecutive_bars,
+            avg_wick_ratio=avg_wick_ratio,
+            atr=atr,
+            assessment=assessment
+        )
 
 
 class SMTDetector:
@@ -431,7 +1065,8 @@ class SMTDetector:
     def __init__(
         self,
         min_sweep_ticks: int = 5,
-        atr_period: int = 14
+        atr_period: int = 14,
+        precision: str = 'f64'
     ):
         """
         Initialize SMT detector.
@@ -439,16 +1074,20 @@ class SMTDetector:
         Args:
             min_sweep_ticks: Minimum ticks below prior low to count as sweep
             atr_period: Period for ATR (used in degree calculation)
+            precision: ATR input arrays as 'f64' (default) or 'f32'; sweep
+                levels are always compared in float64
         """
         self.min_sweep_ticks = min_sweep_ticks
         self.atr_period = atr_period
+        self.precision = precision
+        self._dtype = _precision_dtype(precision)
     
     def detect_sweep(
         self,
         df: pd.DataFrame,
         reference_level: float,
         direction: str = 'below'
-    ) -> Dict[str, Any]:
+    ) -> SweepResult:
         """
         Detect if price swept a reference level.
         
@@ -458,98 +1097,83 @@ class SMTDetector:
             direction: 'below' for long setups, 'above' for short setups
         
         Returns:
-            Dict with sweep detection:
-            {
-                'swept': bool,
-                'sweep_depth': float (points),
-                'sweep_depth_norm': float (normalized by ATR),
-                'sweep_low': float (or sweep_high for short),
-                'sweep_time': datetime
-            }
+            SweepResult (also readable as a dict):
+            (
+                swept: bool,
+                sweep_depth: float (points),
+                sweep_depth_norm: float (normalized by ATR),
+                sweep_price: float (dict key 'sweep_low' / 'sweep_high'),
+                sweep_time: datetime,
+                direction: str
+            )
         """
+        # Dispatch on direction once; each side has its own kernel
         if direction == 'below':
-            # Check if any low swept below reference
-            sweep_bars = df[df['low'] < reference_level]
-            
-            if sweep_bars.empty:
-                return {
-                    'swept': False,
-                    'sweep_depth': 0.0,
-                    'sweep_depth_norm': 0.0,
-                    'sweep_low': None,
-                    'sweep_time': None
-                }
-            
-            # Get the lowest point
-            sweep_idx = sweep_bars['low'].idxmin()
-            sweep_low = sweep_bars.loc[sweep_idx, 'low']
-            sweep_depth = reference_level - sweep_low
-            
-            # Calculate ATR for normalization
-            atr_series = self._calculate_atr(df)
-            atr = atr_series.loc[sweep_idx]
-            
-            if pd.isna(atr) or atr == 0:
-                atr = (df.loc[sweep_idx, 'high'] - df.loc[sweep_idx, 'low']) * 1.5
-            
-            sweep_depth_norm = sweep_depth / atr
-            
-            return {
-                'swept': True,
-                'sweep_depth': sweep_depth,
-                'sweep_depth_norm': sweep_depth_norm,
-                'sweep_low': sweep_low,
-                'sweep_time': sweep_idx
-            }
-        
-        else:  # direction == 'above'
-            # Check if any high swept above reference
-            sweep_bars = df[df['high'] > reference_level]
-            
-            if sweep_bars.empty:
-                return {
-                    'swept': False,
-                    'sweep_depth': 0.0,
-                    'sweep_depth_norm': 0.0,
-                    'sweep_high': None,
-                    'sweep_time': None
-                }
-            
-            sweep_idx = sweep_bars['high'].idxmax()
-            sweep_high = sweep_bars.loc[sweep_idx, 'high']
-            sweep_depth = sweep_high - reference_level
-            
-            atr_series = self._calculate_atr(df)
-            atr = atr_series.loc[sweep_idx]
-            
-            if pd.isna(atr) or atr == 0:
-                atr = (df.loc[sweep_idx, 'high'] - df.loc[sweep_idx, 'low']) * 1.5
-            
-            sweep_depth_norm = sweep_depth / atr
-            
-            return {
-                'swept': True,
-                'sweep_depth': sweep_depth,
-                'sweep_depth_norm': sweep_depth_norm,
-                'sweep_high': sweep_high,
-                'sweep_time': sweep_idx
-            }
+            return self._detect_sweep_below(df, reference_level)
+        return self._detect_sweep_above(df, reference_level)
     
-    def _calculate_atr(self, df: pd.DataFrame) -> pd.Series:
-        """Calculate ATR for the dataframe."""
-        high = df['high']
-        low = df['low']
-        close = df['close']
+    def _detect_sweep_below(self, df: pd.DataFrame, reference_level: float) -> SweepResult:
+        """detect_sweep for direction='below' (long setups)."""
+        prices = _column(df, 'low')
+        i = sweep_below_loop(prices, float(reference_level))
+        return self._sweep_result(df, reference_level, prices, i, 'below')
+    
+    def _detect_sweep_above(self, df: pd.DataFrame, reference_level: float) -> SweepResult:
+        """detect_sweep for direction='above' (short setups)."""
+        prices = _column(df, 'high')
+        i = sweep_above_loop(prices, float(reference_level))
+        return self._sweep_result(df, reference_level, prices, i, 'above')
+    
+    def _sweep_result(
+        self,
+        df: pd.DataFrame,
+        reference_level: float,
+        prices: np.ndarray,
+        i: int,
+        direction: str
+    ) -> SweepResult:
+        """
+        Build the detect_sweep result for sweep bar i (-1 = no sweep).
         
-        tr1 = high - low
-        tr2 = abs(high - close.shift())
-        tr3 = abs(low - close.shift())
+        The ATR is only computed when the level was swept.
+        """
+        if i < 0:
+            return SweepResult(
+                swept=False,
+                sweep_depth=0.0,
+                sweep_depth_norm=0.0,
+                sweep_price=None,
+                sweep_time=None,
+                direction=direction
+            )
+        
+        sweep_extreme = prices[i]
+        sweep_depth = abs(reference_level - sweep_extreme)
+        sweep_depth_norm = sweep_depth / self._sweep_atr(df, i)
+        
+        return SweepResult(
+            swept=True,
+            sweep_depth=sweep_depth,
+            sweep_depth_norm=sweep_depth_norm,
+            sweep_price=sweep_extreme,
+            sweep_time=df.index[i],
+            direction=direction
+        )
+    
+    def _sweep_atr(self, df: pd.DataFrame, i: int) -> float:
+        """ATR at sweep bar i for normalization (1.5x bar range if unavailable)."""
+        atr = self._calculate_atr(df).to_numpy()[i]
         
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        atr = tr.rolling(window=self.atr_period).mean()
+        if np.isnan(atr) or atr == 0:
+            high, low = _column(df, 'high'), _column(df, 'low')
+            atr = (high[i] - low[i]) * 1.5
         
         return atr
     
+    def _calculate_atr(self, df: pd.DataFrame) -> pd.Series:
+        """Calculate ATR for the dataframe (shared per-frame cache)."""
+        return _atr(df, self.atr_period, self._dtype)
+    
     def detect_divergence(
         self,
         instrument_a_df: pd.DataFrame,
@@ -557,7 +1181,7 @@ class SMTDetector:
         reference_level_a: float,
         reference_level_b: float,
         direction: str = 'below'
-    ) -> Dict[str, Any]:
+    ) -> SMTResult:
         """
         Detect SMT divergence between two instruments.
         
@@ -569,30 +1193,100 @@ class SMTDetector:
             direction: 'below' for long, 'above' for short
         
         Returns:
-            Dict with SMT analysis:
-            {
-                'smt_binary': bool (A swept, B didn't),
-                'smt_degree': float (difference in normalized sweeps),
-                'instrument_a_sweep': dict,
-                'instrument_b_sweep': dict
-            }
+            SMTResult (also readable as a dict):
+            (
+                smt_binary: bool (A swept, B didn't),
+                smt_degree: float (difference in normalized sweeps),
+                instrument_a_sweep: SweepResult,
+                instrument_b_sweep: SweepResult
+            )
         """
         # Detect sweeps on both instruments
         sweep_a = self.detect_sweep(instrument_a_df, reference_level_a, direction)
         sweep_b = self.detect_sweep(instrument_b_df, reference_level_b, direction)
         
         # Binary SMT: A swept, B didn't
-        smt_binary = sweep_a['swept'] and not sweep_b['swept']
+        smt_binary = sweep_a.swept and not sweep_b.swept
         
         # Degree: Difference in normalized sweep depths
-        smt_degree = sweep_a['sweep_depth_norm'] - sweep_b['sweep_depth_norm']
+        smt_degree = sweep_a.sweep_depth_norm - sweep_b.sweep_depth_norm
+        
+        return SMTResult(
+            smt_binary=smt_binary,
+            smt_degree=smt_degree,
+            instrument_a_sweep=sweep_a,
+            instrument_b_sweep=sweep_b
+        )
+    
+    def detect_divergence_batch(
+        self,
+        instrument_a_df: pd.DataFrame,
+        instrument_b_df: pd.DataFrame,
+        reference_levels_a: np.ndarray,
+        reference_levels_b: np.ndarray,
+        direction: str = 'below'
+    ) -> np.ndarray:
+        """
+        Detect SMT divergence for many reference level pairs at once.
         
-        return {
-            'smt_binary': smt_binary,
-            'smt_degree': smt_degree,
-            'instrument_a_sweep': sweep_a,
-            'instrument_b_sweep': sweep_b
-        }
+        A level is swept iff the instrument's extreme bar (lowest low or
+        highest high) crosses it, so each instrument is scanned once and
+        every level is compared against its extreme; the ATR is read at
+        most once per instrument. Values match detect_divergence() for
+        each pair.
+        
+        Args:
+            instrument_a_df: Primary instrument (e.g., NQ)
+            instrument_b_df: Reference instrument (e.g., ES)
+            reference_levels_a: Reference levels for instrument A
+            reference_levels_b: Reference levels for instrument B (same length)
+            direction: 'below' for long, 'above' for short
+        
+        Returns:
+            Structured array (SMT_BATCH_DTYPE), one row per level pair
+        """
+        levels_a = np.asarray(reference_levels_a, dtype=np.float64)
+        levels_b = np.asarray(reference_levels_b, dtype=np.float64)
+        if levels_a.shape != levels_b.shape:
+            raise ValueError("reference_levels_a and reference_levels_b must have the same length")
+        
+        results = np.zeros(len(levels_a), dtype=SMT_BATCH_DTYPE)
+        results['a_swept'], results['a_sweep_depth_norm'] = self._batch_sweeps(
+            instrument_a_df, levels_a, direction
+        )
+        results['b_swept'], results['b_sweep_depth_norm'] = self._batch_sweeps(
+            instrument_b_df, levels_b, direction
+        )
+        
+        results['smt_binary'] = results['a_swept'] & ~results['b_swept']
+        results['smt_degree'] = results['a_sweep_depth_norm'] - results['b_sweep_depth_norm']
+        return results
+    
+    def _batch_sweeps(
+        self,
+        df: pd.DataFrame,
+        reference_levels: np.ndarray,
+        direction: str
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Swept flags and normalized depths of df for many levels."""
+        # The extreme bar itself: every finite price sweeps an infinite level
+        if direction == 'below':
+            prices = _column(df, 'low')
+            i = sweep_below_loop(prices, np.inf)
+        else:
+            prices = _column(df, 'high')
+            i = sweep_above_loop(prices, -np.inf)
+        
+        if i < 0:
+            return np.zeros(len(reference_levels), dtype=bool), np.zeros(len(reference_levels))
+        
+        extreme = prices[i]
+        swept = extreme < reference_levels if direction == 'below' else extreme > reference_levels
+        if not swept.any():
+            return swept, np.zeros(len(reference_levels))
+        
+        depth_norm = np.abs(reference_levels - extreme) / self._sweep_atr(df, i)
+        return swept, np.where(swept, depth_norm, 0.0)
 
 
 # Test the indicators
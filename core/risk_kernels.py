@@ -0,0 +1,61 @@
+"""
+Risk Kernels
+============
+Array-level trade simulation for backtests (see RiskManager.simulate_trade).
+
+The kernel walks a price array with the same exit rules as
+RiskManager.update_position, so a backtest can replay a trade over many
+bars without a Python call per bar. Kernels are JIT-compiled with numba
+when it is installed (see utils/_njit.py) and run as plain Python otherwise.
+"""
+
+import numpy as np
+
+from utils._njit import njit
+
+
+# Exit reason codes returned by simulate_position_loop
+EXIT_NONE = 0
+EXIT_STOP_LOSS = 1
+EXIT_TRAILING_STOP = 2
+
+
+@njit(cache=True)
+def simulate_position_loop(prices, entry_price, stop_loss, tp1_price, direction):
+    """
+    Replay an open position over prices (one price per bar / tick).
+
+    Mirrors RiskManager.update_position for each price, in order: the
+    stop loss closes the position, else TP1 (if not hit yet) takes the
+    partial exit and moves the trailing stop to breakeven, else the
+    trailing stop closes it. direction is +1 (long) or -1 (short).
+
+    Args:
+        prices: Prices after entry, in time order
+        entry_price: Entry price
+        stop_loss: Initial stop loss
+        tp1_price: First target
+        direction: +1.0 long, -1.0 short
+
+    Returns:
+        Tuple of (exit_index, exit_price, reason, tp1_index); exit_index
+        and tp1_index are -1 (and exit_price NaN) when not reached, reason
+        is one of the EXIT_* codes
+    """
+    tp1_index = -1
+    trailing_stop = 0.0
+
+    for i in range(len(prices)):
+        price = prices[i]
+
+        if direction * (price - stop_loss) <= 0:
+            return i, stop_loss, EXIT_STOP_LOSS, tp1_index
+
+        if tp1_index < 0:
+            if direction * (price - tp1_price) >= 0:
+                tp1_index = i
+                trailing_stop = entry_price
+        elif direction * (price - trailing_stop) <= 0:
+            return i, trailing_stop, EXIT_TRAILING_STOP, tp1_index
+
+    return -1, np.nan, EXIT_NONE, tp1_index
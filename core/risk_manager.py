@@ -13,12 +13,26 @@ Key concepts:
 All risk calculations are in R-multiples for consistency.
 """
 
+import sys
+from collections import deque
 from dataclasses import dataclass
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, Tuple, TextIO, List, NamedTuple
+import numpy as np
 from utils.config_loader import Config
+from utils._results import ResultMapping
+from core.risk_kernels import (
+    simulate_position_loop,
+    EXIT_STOP_LOSS,
+    EXIT_TRAILING_STOP
+)
 
 
-@dataclass
+# Position.exit_state: which exit levels are live
+POSITION_ARMED = 0  # Stop loss and TP1
+POSITION_TRAILING = 1  # Stop loss and trailing stop (after TP1)
+
+
+@dataclass(slots=True)
 class Position:
     """
     Represents an open trading position.
@@ -44,6 +58,37 @@ class Position:
     unrealized_pnl_r: float = 0.0
     realized_pnl_dollars: float = 0.0
     realized_pnl_r: float = 0.0
+    
+    # Constants cached at open so the per-tick path doesn't recompute them
+    is_long: bool = True
+    direction: float = 1.0  # +1 long, -1 short
+    point_value: float = 0.0
+    r_per_dollar: float = 0.0  # 1 / initial_risk_dollars
+    
+    exit_state: int = POSITION_ARMED
+
+
+class _PerformanceFields(NamedTuple):
+    total_trades: int
+    winning_trades: int
+    losing_trades: int
+    win_rate: float
+    total_pnl_dollars: float
+    total_pnl_r: float
+    avg_pnl_r: float
+    account_size: float
+    account_growth_pct: float
+
+
+class PerformanceSummary(ResultMapping, _PerformanceFields):
+    """RiskManager.get_performance_summary result."""
+    __slots__ = ()
+
+
+def _first_true(mask: np.ndarray) -> int:
+    """Index of the first True in mask, or len(mask) if there is none."""
+    i = int(mask.argmax())
+    return i if mask[i] else len(mask)
 
 
 class RiskManager:
@@ -56,7 +101,9 @@ class RiskManager:
         account_size: float = 100000.0,
         risk_per_trade_pct: float = 0.01,
         tp1_r_multiple: float = 1.0,
-        partial_exit_pct: float = 0.50
+        partial_exit_pct: float = 0.50,
+        verbose: bool = True,
+        event_log_size: int = 10_000
     ):
         """
         Initialize risk manager.
@@ -66,11 +113,17 @@ class RiskManager:
             risk_per_trade_pct: Risk per trade as % of account (e.g., 0.01 = 1%)
             tp1_r_multiple: First target in R-multiples (1.0 = 1R)
             partial_exit_pct: % of position to exit at TP1 (0.50 = 50%)
+            verbose: Print position events as they happen. When False they
+                are kept unformatted in event_log (see flush_events)
+            event_log_size: Most recent events kept when not verbose
         """
         self.account_size = account_size
+        self._initial_account_size = account_size
         self.risk_per_trade_pct = risk_per_trade_pct
         self.tp1_r_multiple = tp1_r_multiple
         self.partial_exit_pct = partial_exit_pct
+        self.verbose = verbose
+        self.event_log: deque = deque(maxlen=event_log_size)
         
         # Risk limits
         self.risk_per_trade_dollars = account_size * risk_per_trade_pct
@@ -78,23 +131,103 @@ class RiskManager:
         # Position tracking
         self.current_position: Optional[Position] = None
         
+        # Instrument (see set_instrument)
+        self._instrument_spec: Optional[Dict[str, Any]] = None
+        self._point_value: Optional[float] = None
+        self._tick_size: Optional[float] = None
+        
         # Performance tracking
         self.total_trades = 0
         self.winning_trades = 0
         self.total_pnl_dollars = 0.0
         self.total_pnl_r = 0.0
         
-        print(f"💰 Risk Manager initialized")
-        print(f"   Account size: ${account_size:,.2f}")
-        print(f"   Risk per trade: {risk_per_trade_pct:.1%} (${self.risk_per_trade_dollars:,.2f})")
-        print(f"   TP1 target: {tp1_r_multiple}R")
-        print(f"   Partial exit: {partial_exit_pct:.0%}")
+        if verbose:
+            print(f"💰 Risk Manager initialized")
+            print(f"   Account size: ${account_size:,.2f}")
+            print(f"   Risk per trade: {risk_per_trade_pct:.1%} (${self.risk_per_trade_dollars:,.2f})")
+            print(f"   TP1 target: {tp1_r_multiple}R")
+            print(f"   Partial exit: {partial_exit_pct:.0%}")
+    
+    def _record(self, *event) -> None:
+        """Print a position event now (verbose) or keep it for flush_events()."""
+        if self.verbose:
+            print(self._format_event(event))
+        else:
+            self.event_log.append(event)
+    
+    def _format_event(self, event: Tuple) -> str:
+        """Text of a recorded position event (as printed when verbose)."""
+        kind = event[0]
+        if kind == 'OPEN':
+            _, entry_price, stop_loss, tp1_price, size, risk_dollars, risk_pct = event
+            return (
+                f"\n📈 Position opened:\n"
+                f"   Entry: {entry_price:.2f}\n"
+                f"   Stop: {stop_loss:.2f}\n"
+                f"   TP1: {tp1_price:.2f}\n"
+                f"   Size: {size} contracts\n"
+                f"   Risk: ${risk_dollars:,.2f} ({risk_pct:.1%})"
+            )
+        if kind == 'PARTIAL_EXIT':
+            _, exit_price, size, exit_pct, pnl_dollars, pnl_r, remaining, stop = event
+            return (
+                f"\n📊 Partial exit at TP1:\n"
+                f"   Exit: {exit_price:.2f}\n"
+                f"   Size: {size} contracts ({exit_pct:.0%})\n"
+                f"   P&L: ${pnl_dollars:,.2f} ({pnl_r:.2f}R)\n"
+                f"   Remaining: {remaining} contracts\n"
+                f"   Stop moved to breakeven: {stop:.2f}"
+            )
+        _, reason, exit_price, pnl_dollars, pnl_r, account_size = event  # FULL_EXIT
+        return (
+            f"\n🔚 Position closed:\n"
+            f"   Reason: {reason}\n"
+            f"   Exit: {exit_price:.2f}\n"
+            f"   Total P&L: ${pnl_dollars:,.2f} ({pnl_r:.2f}R)\n"
+            f"   New account size: ${account_size:,.2f}"
+        )
+    
+    def flush_events(self, file: Optional[TextIO] = None) -> None:
+        """
+        Write and clear the events kept while not verbose.
+        
+        Args:
+            file: Destination (default sys.stdout), written in one call
+        """
+        if not self.event_log:
+            return
+        file = file if file is not None else sys.stdout
+        file.write('\n'.join(self._format_event(event) for event in self.event_log) + '\n')
+        self.event_log.clear()
+    
+    def set_instrument(self, instrument_spec: Dict[str, Any]) -> None:
+        """
+        Set the instrument traded by this risk manager.
+        
+        Sizing and opening methods then work without an instrument_spec
+        argument and read the cached point value instead of the dict.
+        
+        Args:
+            instrument_spec: Instrument specifications (point_value, tick_size, etc.)
+        """
+        self._instrument_spec = instrument_spec
+        self._point_value = float(instrument_spec['point_value'])
+        self._tick_size = float(instrument_spec['tick_size'])
+    
+    def _get_point_value(self, instrument_spec: Optional[Dict[str, Any]]) -> float:
+        """Point value from instrument_spec, or from set_instrument if None."""
+        if instrument_spec is not None:
+            return instrument_spec['point_value']
+        if self._point_value is None:
+            raise ValueError("No instrument: pass instrument_spec or call set_instrument() first")
+        return self._point_value
     
     def calculate_position_size(
         self,
         entry_price: float,
         stop_loss: float,
-        instrument_spec: Dict[str, Any]
+        instrument_spec: Optional[Dict[str, Any]] = None
     ) -> int:
         """
         Calculate position size based on risk.
@@ -105,16 +238,20 @@ class RiskManager:
         Args:
             entry_price: Entry price
             stop_loss: Stop loss price
-            instrument_spec: Instrument specifications (point_value, tick_size, etc.)
+            instrument_spec: Instrument specifications (point_value, tick_size, etc.).
+                Defaults to the instrument from set_instrument
         
         Returns:
             Number of contracts to trade
         """
-        point_value = instrument_spec['point_value']
-        tick_size = instrument_spec['tick_size']
-        
+        return self._size_for_risk(
+            abs(entry_price - stop_loss),
+            self._get_point_value(instrument_spec)
+        )
+    
+    def _size_for_risk(self, risk_per_point: float, point_value: float) -> int:
+        """Contracts for a stop risk_per_point away (see calculate_position_size)."""
         # Calculate risk per contract
-        risk_per_point = abs(entry_price - stop_loss)
         risk_per_contract = risk_per_point * point_value
         
         if risk_per_contract == 0:
@@ -137,8 +274,8 @@ class RiskManager:
         entry_price: float,
         stop_loss: float,
         bias: str,
-        instrument_spec: Dict[str, Any]
-    ) -> Position:
+        instrument_spec: Optional[Dict[str, Any]] = None
+    ) -> Optional[Position]:
         """
         Open a new position.
         
@@ -146,28 +283,28 @@ class RiskManager:
             entry_price: Entry price
             stop_loss: Stop loss price
             bias: "LONG" or "SHORT"
-            instrument_spec: Instrument specifications
+            instrument_spec: Instrument specifications. Defaults to the
+                instrument from set_instrument
         
         Returns:
-            Position object
+            Position object, or None (nothing opened) if stop_loss is not
+            beyond entry_price on the losing side
         """
+        # Signed risk: positive only with the stop on the losing side
+        direction = 1.0 if bias == "LONG" else -1.0
+        risk_points = direction * (entry_price - stop_loss)
+        if not risk_points > 0:
+            return None
+        
         # Calculate position size
-        position_size = self.calculate_position_size(
-            entry_price,
-            stop_loss,
-            instrument_spec
-        )
+        point_value = self._get_point_value(instrument_spec)
+        position_size = self._size_for_risk(risk_points, point_value)
         
         # Calculate TP1
-        risk_points = abs(entry_price - stop_loss)
-        
-        if bias == "LONG":
-            tp1_price = entry_price + (risk_points * self.tp1_r_multiple)
-        else:  # SHORT
-            tp1_price = entry_price - (risk_points * self.tp1_r_multiple)
+        tp1_price = entry_price + direction * risk_points * self.tp1_r_multiple
         
         # Calculate initial risk
-        initial_risk_dollars = position_size * risk_points * instrument_spec['point_value']
+        initial_risk_dollars = position_size * risk_points * point_value
         
         # Create position
         position = Position(
@@ -177,31 +314,114 @@ class RiskManager:
             current_position_size=position_size,
             tp1_price=tp1_price,
             initial_risk_dollars=initial_risk_dollars,
-            initial_risk_r=1.0
+            initial_risk_r=1.0,
+            is_long=direction > 0,
+            direction=direction,
+            point_value=point_value,
+            r_per_dollar=1.0 / initial_risk_dollars if initial_risk_dollars else float('nan')
         )
         
         self.current_position = position
         
-        print(f"\n📈 Position opened:")
-        print(f"   Entry: {entry_price:.2f}")
-        print(f"   Stop: {stop_loss:.2f}")
-        print(f"   TP1: {tp1_price:.2f}")
-        print(f"   Size: {position_size} contracts")
-        print(f"   Risk: ${initial_risk_dollars:,.2f} ({self.risk_per_trade_pct:.1%})")
+        self._record(
+            'OPEN', entry_price, stop_loss, tp1_price, position_size,
+            initial_risk_dollars, self.risk_per_trade_pct
+        )
         
         return position
     
+    def simulate_trade(
+        self,
+        prices: np.ndarray,
+        entry_price: float,
+        stop_loss: float,
+        bias: str,
+        instrument_spec: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Replay a trade over a price array for backtests.
+        
+        Same sizing, exits and P&L as open_position followed by
+        update_position on each price, but the bar loop runs in a compiled
+        kernel. Nothing is printed and the account state (open position,
+        statistics, account size) is not touched.
+        
+        Args:
+            prices: Prices after entry, in time order
+            entry_price: Entry price
+            stop_loss: Stop loss price
+            bias: "LONG" or "SHORT"
+            instrument_spec: Instrument specifications. Defaults to the
+                instrument from set_instrument
+        
+        Returns:
+            Exit dict as returned by update_position for the full exit,
+            plus exit_index / tp1_index (-1 if not reached). If the trade
+            is still open at the last price, type is 'OPEN', position_remains
+            is True and P&L covers the TP1 partial only. None if stop_loss
+            is not beyond entry_price (open_position would not open it).
+        """
+        direction = 1.0 if bias == "LONG" else -1.0
+        risk_points = direction * (entry_price - stop_loss)
+        if not risk_points > 0:
+            return None
+        
+        point_value = self._get_point_value(instrument_spec)
+        position_size = self._size_for_risk(risk_points, point_value)
+        tp1_price = entry_price + direction * risk_points * self.tp1_r_multiple
+        initial_risk_dollars = position_size * risk_points * point_value
+        
+        exit_index, exit_price, reason, tp1_index = simulate_position_loop(
+            np.ascontiguousarray(prices, dtype=np.float64),
+            float(entry_price),
+            float(stop_loss),
+            float(tp1_price),
+            direction
+        )
+        
+        # P&L: the TP1 partial, then the rest at the exit (as _partial_exit_tp1
+        # and _close_position)
+        remaining_size = position_size
+        pnl_dollars = 0.0
+        pnl_r = 0.0
+        if tp1_index >= 0:
+            partial_size = max(int(position_size * self.partial_exit_pct), 1)
+            remaining_size = position_size - partial_size
+            partial_dollars = partial_size * (direction * (tp1_price - entry_price)) * point_value
+            pnl_dollars += partial_dollars
+            pnl_r += partial_dollars / initial_risk_dollars
+        if exit_index >= 0:
+            exit_dollars = remaining_size * (direction * (exit_price - entry_price)) * point_value
+            pnl_dollars += exit_dollars
+            pnl_r += exit_dollars / initial_risk_dollars
+        
+        return {
+            'type': 'FULL_EXIT' if exit_index >= 0 else 'OPEN',
+            'reason': {
+                EXIT_STOP_LOSS: 'STOP_LOSS',
+                EXIT_TRAILING_STOP: 'TRAILING_STOP'
+            }.get(reason),
+            'exit_price': exit_price if exit_index >= 0 else None,
+            'pnl_dollars': pnl_dollars,
+            'pnl_r': pnl_r,
+            'win': pnl_r > 0,
+            'position_remains': exit_index < 0,
+            'exit_index': int(exit_index),
+            'tp1_index': int(tp1_index)
+        }
+    
     def update_position(
         self,
         current_price: float,
-        instrument_spec: Dict[str, Any]
+        instrument_spec: Optional[Dict[str, Any]] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Update position with current price and check for exits.
         
         Args:
             current_price: Current market price
-            instrument_spec: Instrument specifications
+            instrument_spec: Not used; the open Position carries the point
+                value it was opened with. Accepted for older callers
         
         Returns:
             Exit signal dict if position should close, None otherwise
@@ -210,81 +430,118 @@ class RiskManager:
             return None
         
         pos = self.current_position
-        point_value = instrument_spec['point_value']
         
-        # Determine if LONG or SHORT
-        is_long = pos.tp1_price > pos.entry_price
-        
-        # Check stop loss
-        if is_long:
-            if current_price <= pos.stop_loss:
-                return self._close_position(
-                    exit_price=pos.stop_loss,
-                    reason='STOP_LOSS',
-                    instrument_spec=instrument_spec
-                )
-        else:  # SHORT
-            if current_price >= pos.stop_loss:
-                return self._close_position(
-                    exit_price=pos.stop_loss,
-                    reason='STOP_LOSS',
-                    instrument_spec=instrument_spec
+        # direction is +1 (long) / -1 (short): one signed comparison per
+        # level covers both sides (long stop: price <= stop, short: >=)
+        direction = pos.direction
+        
+        # Check stop loss (live in every state)
+        if direction * (current_price - pos.stop_loss) <= 0:
+            return self._close_position(
+                exit_price=pos.stop_loss,
+                reason='STOP_LOSS'
+            )
+        
+        if pos.exit_state == POSITION_ARMED:
+            # Check TP1 (partial exit)
+            if direction * (current_price - pos.tp1_price) >= 0:
+                return self._partial_exit_tp1(
+                    exit_price=pos.tp1_price
                 )
         
-        # Check TP1 (partial exit)
-        if not pos.tp1_hit:
-            if is_long:
-                if current_price >= pos.tp1_price:
-                    return self._partial_exit_tp1(
-                        exit_price=pos.tp1_price,
-                        instrument_spec=instrument_spec
-                    )
-            else:  # SHORT
-                if current_price <= pos.tp1_price:
-                    return self._partial_exit_tp1(
-                        exit_price=pos.tp1_price,
-                        instrument_spec=instrument_spec
-                    )
-        
-        # Check trailing stop (if TP1 hit)
-        if pos.tp1_hit and pos.trailing_stop is not None:
-            if is_long:
-                if current_price <= pos.trailing_stop:
-                    return self._close_position(
-                        exit_price=pos.trailing_stop,
-                        reason='TRAILING_STOP',
-                        instrument_spec=instrument_spec
-                    )
-            else:  # SHORT
-                if current_price >= pos.trailing_stop:
-                    return self._close_position(
-                        exit_price=pos.trailing_stop,
-                        reason='TRAILING_STOP',
-                        instrument_spec=instrument_spec
-                    )
-        
-        # Update unrealized P&L
-        self._update_unrealized_pnl(current_price, instrument_spec)
+        # POSITION_TRAILING: check trailing stop
+        elif direction * (current_price - pos.trailing_stop) <= 0:
+            return self._close_position(
+                exit_price=pos.trailing_stop,
+                reason='TRAILING_STOP'
+            )
+        
+        # Update unrealized P&L (inlined _update_unrealized_pnl: this is
+        # the path nearly every tick takes)
+        pnl_dollars = pos.current_position_size * (direction * (current_price - pos.entry_price)) * pos.point_value
+        pos.unrealized_pnl_dollars = pnl_dollars
+        pos.unrealized_pnl_r = pnl_dollars * pos.r_per_dollar
         
         return None
     
+    def update_position_batch(
+        self,
+        prices: np.ndarray,
+        instrument_spec: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Apply update_position to each price in order, scanning with numpy.
+        
+        Between exits no per-price Python work is needed: each stretch is
+        one vectorized search for the first price that hits the stop, TP1
+        or trailing stop. Position state, unrealized P&L and the exit
+        signals are the same as calling update_position per price.
+        
+        Args:
+            prices: Prices in time order
+            instrument_spec: Not used (see update_position)
+        
+        Returns:
+            Exit signal dicts in the order they happened (empty if none)
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        exits = []
+        start = 0
+        
+        while self.current_position is not None and start < len(prices):
+            pos = self.current_position
+            segment = prices[start:]
+            
+            # Same checks as update_position: the stop wins a tie with the
+            # other level on the same price
+            stop_idx = _first_true(pos.direction * (segment - pos.stop_loss) <= 0)
+            if pos.exit_state == POSITION_ARMED:
+                level_idx = _first_true(pos.direction * (segment - pos.tp1_price) >= 0)
+            else:
+                level_idx = _first_true(pos.direction * (segment - pos.trailing_stop) <= 0)
+            
+            idx = min(stop_idx, level_idx)
+            if idx == len(segment):
+                self._update_unrealized_pnl(segment[-1])
+                break
+            
+            # Unrealized P&L as of the last price before the exit
+            if idx > 0:
+                self._update_unrealized_pnl(segment[idx - 1])
+            
+            if stop_idx <= level_idx:
+                exits.append(self._close_position(
+                    exit_price=pos.stop_loss,
+                    reason='STOP_LOSS'
+                ))
+            elif pos.exit_state == POSITION_ARMED:
+                exits.append(self._partial_exit_tp1(
+                    exit_price=pos.tp1_price
+                ))
+            else:
+                exits.append(self._close_position(
+                    exit_price=pos.trailing_stop,
+                    reason='TRAILING_STOP'
+                ))
+            
+            start += idx + 1
+        
+        return exits
+    
     def _partial_exit_tp1(
         self,
-        exit_price: float,
-        instrument_spec: Dict[str, Any]
+        exit_price: float
     ) -> Dict[str, Any]:
         """
         Execute partial exit at TP1.
         
         Args:
             exit_price: Exit price (TP1)
-            instrument_spec: Instrument specifications
         
         Returns:
             Partial exit signal dict
         """
         pos = self.current_position
-        point_value = instrument_spec['point_value']
         
         # Calculate partial size
         partial_size = int(pos.initial_position_size * self.partial_exit_pct)
@@ -293,14 +550,9 @@ class RiskManager:
             partial_size = 1  # At least 1 contract
         
         # Calculate P&L for partial
-        is_long = pos.tp1_price > pos.entry_price
-        
-        if is_long:
-            pnl_points = exit_price - pos.entry_price
-        else:
-            pnl_points = pos.entry_price - exit_price
+        pnl_points = pos.direction * (exit_price - pos.entry_price)
         
-        pnl_dollars = partial_size * pnl_points * point_value
+        pnl_dollars = partial_size * pnl_points * pos.point_value
         pnl_r = pnl_dollars / pos.initial_risk_dollars
         
         # Update position
@@ -312,13 +564,12 @@ class RiskManager:
         # Move stop to breakeven
         pos.trailing_stop = pos.entry_price
         pos.breakeven_active = True
+        pos.exit_state = POSITION_TRAILING
         
-        print(f"\n📊 Partial exit at TP1:")
-        print(f"   Exit: {exit_price:.2f}")
-        print(f"   Size: {partial_size} contracts ({self.partial_exit_pct:.0%})")
-        print(f"   P&L: ${pnl_dollars:,.2f} ({pnl_r:.2f}R)")
-        print(f"   Remaining: {pos.current_position_size} contracts")
-        print(f"   Stop moved to breakeven: {pos.trailing_stop:.2f}")
+        self._record(
+            'PARTIAL_EXIT', exit_price, partial_size, self.partial_exit_pct,
+            pnl_dollars, pnl_r, pos.current_position_size, pos.trailing_stop
+        )
         
         return {
             'type': 'PARTIAL_EXIT',
@@ -333,8 +584,7 @@ class RiskManager:
     def _close_position(
         self,
         exit_price: float,
-        reason: str,
-        instrument_spec: Dict[str, Any]
+        reason: str
     ) -> Dict[str, Any]:
         """
         Close entire position.
@@ -342,23 +592,16 @@ class RiskManager:
         Args:
             exit_price: Exit price
             reason: Exit reason
-            instrument_spec: Instrument specifications
         
         Returns:
             Exit signal dict
         """
         pos = self.current_position
-        point_value = instrument_spec['point_value']
         
         # Calculate P&L for remaining position
-        is_long = pos.tp1_price > pos.entry_price
-        
-        if is_long:
-            pnl_points = exit_price - pos.entry_price
-        else:
-            pnl_points = pos.entry_price - exit_price
+        pnl_points = pos.direction * (exit_price - pos.entry_price)
         
-        pnl_dollars = pos.current_position_size * pnl_points * point_value
+        pnl_dollars = pos.current_position_size * pnl_points * pos.point_value
         pnl_r = pnl_dollars / pos.initial_risk_dollars
         
         # Total P&L (including partials)
@@ -377,11 +620,9 @@ class RiskManager:
         self.account_size += total_pnl_dollars
         self.risk_per_trade_dollars = self.account_size * self.risk_per_trade_pct
         
-        print(f"\n🔚 Position closed:")
-        print(f"   Reason: {reason}")
-        print(f"   Exit: {exit_price:.2f}")
-        print(f"   Total P&L: ${total_pnl_dollars:,.2f} ({total_pnl_r:.2f}R)")
-        print(f"   New account size: ${self.account_size:,.2f}")
+        self._record(
+            'FULL_EXIT', reason, exit_price, total_pnl_dollars, total_pnl_r, self.account_size
+        )
         
         # Clear position
         self.current_position = None
@@ -396,49 +637,53 @@ class RiskManager:
             'position_remains': False
         }
     
-    def _update_unrealized_pnl(
-        self,
-        current_price: float,
-        instrument_spec: Dict[str, Any]
-    ) -> None:
-        """Update unrealized P&L."""
-        pos = self.current_position
-        point_value = instrument_spec['point_value']
+    def _update_unrealized_pnl(self, current_price: float) -> None:
+        """
+        Update unrealized P&L (uses the position's cached constants).
         
-        is_long = pos.tp1_price > pos.entry_price
+        update_position inlines this; keep the two in step.
+        """
+        pos = self.current_position
         
-        if is_long:
-            pnl_points = current_price - pos.entry_price
-        else:
-            pnl_points = pos.entry_price - current_price
+        pnl_points = pos.direction * (current_price - pos.entry_price)
         
-        pnl_dollars = pos.current_position_size * pnl_points * point_value
-        pnl_r = pnl_dollars / pos.initial_risk_dollars
+        pnl_dollars = pos.current_position_size * pnl_points * pos.point_value
+        pnl_r = pnl_dollars * pos.r_per_dollar
         
         pos.unrealized_pnl_dollars = pnl_dollars
         pos.unrealized_pnl_r = pnl_r
     
-    def get_performance_summary(self) -> Dict[str, Any]:
+    def get_performance_summary(self) -> PerformanceSummary:
         """
         Get performance statistics.
         
         Returns:
-            Dict with performance metrics
+            PerformanceSummary (also readable as a dict: stats['win_rate'])
         """
-        win_rate = (self.winning_trades / self.total_trades * 100) if self.total_trades > 0 else 0.0
-        avg_pnl_r = self.total_pnl_r / self.total_trades if self.total_trades > 0 else 0.0
+        if self.total_trades > 0:
+            win_rate = self.winning_trades / self.total_trades * 100
+            avg_pnl_r = self.total_pnl_r / self.total_trades
+        else:
+            win_rate = avg_pnl_r = 0.0
         
-        return {
-            'total_trades': self.total_trades,
-            'winning_trades': self.winning_trades,
-            'losing_trades': self.total_trades - self.winning_trades,
-            'win_rate': win_rate,
-            'total_pnl_dollars': self.total_pnl_dollars,
-            'total_pnl_r': self.total_pnl_r,
-            'avg_pnl_r': avg_pnl_r,
-            'account_size': self.account_size,
-            'account_growth_pct': (self.total_pnl_dollars / (self.account_size - self.total_pnl_dollars)) * 100
-        }
+        # Growth against the starting balance (account_size - total P&L
+        # is the same number, but the subtraction loses precision)
+        if self._initial_account_size:
+            account_growth_pct = self.total_pnl_dollars / self._initial_account_size * 100
+        else:
+            account_growth_pct = 0.0
+        
+        return PerformanceSummary(
+            total_trades=self.total_trades,
+            winning_trades=self.winning_trades,
+            losing_trades=self.total_trades - self.winning_trades,
+            win_rate=win_rate,
+            total_pnl_dollars=self.total_pnl_dollars,
+            total_pnl_r=self.total_pnl_r,
+            avg_pnl_r=avg_pnl_r,
+            account_size=self.account_size,
+            account_growth_pct=account_growth_pct
+        )
 
 
 # Example usage
@@ -12,13 +12,18 @@ CRITICAL RULES:
 This is write-only telemetry for post-50 filter evaluation.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cached_property
 from typing import List, Optional, Dict, Any
-from datetime import datetime
-import hashlib
+import sys
+import numpy as np
 
 
-@dataclass
+# A failed filter is a "near miss" within this fraction of its threshold
+NEAR_MISS_RELATIVE_DISTANCE = 0.2
+
+
+@dataclass(slots=True)
 class FilterCheck:
     """
     Result of a single filter check.
@@ -33,6 +38,20 @@ class FilterCheck:
     
     # Context
     notes: Optional[str] = None
+    
+    # Within NEAR_MISS_RELATIVE_DISTANCE of the threshold? None when it
+    # can't be determined (no distance, or no / zero threshold)
+    near_miss: Optional[bool] = field(default=None, init=False)
+    
+    def __post_init__(self):
+        # Interned, like the names in CORE_FILTERS / GATING_FILTERS, so set
+        # membership checks hit the identity fast path
+        self.filter_name = sys.intern(self.filter_name)
+        
+        if self.distance is not None and self.threshold:
+            self.near_miss = (
+                abs(self.distance) / abs(self.threshold) < NEAR_MISS_RELATIVE_DISTANCE
+            )
 
 
 class ShadowTradeManager:
@@ -40,21 +59,22 @@ class ShadowTradeManager:
     Determines if a rejected setup qualifies as a shadow trade.
     """
     
-    # Filters that can block trades
-    CORE_FILTERS = [
+    # Filters that can block trades (sets of interned names: membership is
+    # tested per check)
+    CORE_FILTERS = frozenset(map(sys.intern, [
         'TIME_WINDOW',
         'ONS_VALID',
         'DEVIATION_DETECTED',
         'RECLAIM_DETECTED'
-    ]
+    ]))
     
-    GATING_FILTERS = [
+    GATING_FILTERS = frozenset(map(sys.intern, [
         'SMT_BINARY',
         'SMT_DEGREE',
         'ISI_DISPLACEMENT',
         'RECLAIM_TIMEOUT',
         'RECLAIM_BODY_RATIO'
-    ]
+    ]))
     
     def __init__(self):
         self.shadow_trade_count = 0
@@ -78,24 +98,28 @@ class ShadowTradeManager:
         Returns:
             Dict with shadow trade decision and metadata
         """
-        # Separate core and gating filters
-        core_results = [f for f in filter_results if f.filter_name in self.CORE_FILTERS]
-        gating_results = [f for f in filter_results if f.filter_name in self.GATING_FILTERS]
-        
-        # Check 1: All core filters must pass
-        core_passed = all(f.passed for f in core_results)
-        
-        if not core_passed:
-            return {
-                'is_shadow_trade': False,
-                'reason': 'Core structural conditions not met',
-                'blocked_by': None
-            }
+        # One pass: Check 1 (all core filters must pass) stops at the first
+        # failed core filter; the names for Check 2 and the result, and the
+        # first failed gating filter, are collected on the way
+        passed_names = []
+        gating_fail_names = []
+        failed_filter = None
+        for f in filter_results:
+            if f.passed:
+                passed_names.append(f.filter_name)
+            elif f.filter_name in self.CORE_FILTERS:
+                return {
+                    'is_shadow_trade': False,
+                    'reason': 'Core structural conditions not met',
+                    'blocked_by': None
+                }
+            elif f.filter_name in self.GATING_FILTERS:
+                if failed_filter is None:
+                    failed_filter = f
+                gating_fail_names.append(f.filter_name)
         
         # Check 2: Count gating filter failures
-        gating_failures = [f for f in gating_results if not f.passed]
-        
-        if len(gating_failures) == 0:
+        if failed_filter is None:
             # This shouldn't happen - trade should have been taken
             return {
                 'is_shadow_trade': False,
@@ -103,17 +127,15 @@ class ShadowTradeManager:
                 'blocked_by': None
             }
         
-        if len(gating_failures) > 1:
+        if len(gating_fail_names) > 1:
             # Multiple failures - not a near miss
             return {
                 'is_shadow_trade': False,
-                'reason': f'Multiple filters failed ({len(gating_failures)})',
-                'blocked_by': [f.filter_name for f in gating_failures]
+                'reason': f'Multiple filters failed ({len(gating_fail_names)})',
+                'blocked_by': gating_fail_names
             }
         
         # Exactly one gating filter failed - this is a shadow trade candidate
-        failed_filter = gating_failures[0]
-        
         # Check 3: Was it a "near miss"? (optional proximity check)
         is_near_miss = self._is_near_miss(failed_filter)
         
@@ -127,26 +149,21 @@ class ShadowTradeManager:
             'blocking_filter_threshold': failed_filter.threshold,
             'proximity': failed_filter.distance,
             'is_near_miss': is_near_miss,
-            'filters_passed': [f.filter_name for f in filter_results if f.passed],
-            'filters_failed': [f.filter_name for f in gating_failures]
+            'filters_passed': passed_names,
+            'filters_failed': gating_fail_names
         }
     
     def _is_near_miss(self, failed_filter: FilterCheck) -> bool:
         """
         Determine if a failed filter was a "near miss".
         
-        Near miss definition: Within 20% of threshold.
+        Near miss definition: Within 20% of threshold (computed when the
+        FilterCheck is built).
         """
-        if failed_filter.distance is None:
+        if failed_filter.near_miss is None:
             return True  # Can't determine, assume yes
         
-        if failed_filter.threshold is None or failed_filter.threshold == 0:
-            return True
-        
-        # Calculate relative distance
-        relative_distance = abs(failed_filter.distance) / abs(failed_filter.threshold)
-        
-        return relative_distance < 0.2  # Within 20%
+        return failed_filter.near_miss
     
     def unlock_review(self, real_trade_count: int) -> None:
         """
@@ -194,14 +211,40 @@ class ShadowTradeAnalyzer:
             trade_log_df: DataFrame from logs/trades/ CSV
         """
         self.df = trade_log_df
-        self.real_trades = self.df[self.df['trade_type'] == 'REAL']
-        self.shadow_trades = self.df[self.df['trade_type'] == 'SHADOW']
         
-        if len(self.real_trades) < 50:
+        # Only the columns the analyses use, as arrays split by trade type
+        trade_type = trade_log_df['trade_type'].to_numpy()
+        self._real_mask = trade_type == 'REAL'
+        self._shadow_mask = trade_type == 'SHADOW'
+        
+        real_count = int(self._real_mask.sum())
+        if real_count < 50:
             raise ValueError(
                 f"Analysis prohibited until 50 real trades. "
-                f"Current count: {len(self.real_trades)}"
+                f"Current count: {real_count}"
             )
+        
+        pnl_r = trade_log_df['pnl_r'].to_numpy(dtype=float)
+        win = trade_log_df['win'].to_numpy(dtype=float)
+        self._real_pnl_r = pnl_r[self._real_mask]
+        self._real_win = win[self._real_mask]
+        self._pnl_r = pnl_r[self._shadow_mask]
+        self._win = win[self._shadow_mask]
+        
+        # Group the shadow trades once: blocking filter -> positions in the
+        # shadow arrays (first-seen order, rows without a filter dropped)
+        blocked_by = trade_log_df['blocked_by_filter'][self._shadow_mask]
+        self._by_filter = blocked_by.groupby(blocked_by, sort=False).indices
+    
+    @cached_property
+    def real_trades(self):
+        """Real trade rows of the log (built on first use)."""
+        return self.df[self._real_mask]
+    
+    @cached_property
+    def shadow_trades(self):
+        """Shadow trade rows of the log (built on first use)."""
+        return self.df[self._shadow_mask]
     
     def analyze_by_filter(self) -> Dict[str, Dict[str, float]]:
         """
@@ -211,22 +254,15 @@ class ShadowTradeAnalyzer:
             Dict of filter_name -> performance metrics
         """
         results = {}
-        
-        for filter_name in self.shadow_trades['blocked_by_filter'].unique():
-            if pd.isna(filter_name):
-                continue
-            
-            filter_shadows = self.shadow_trades[
-                self.shadow_trades['blocked_by_filter'] == filter_name
-            ]
-            
+        for filter_name, idx in self._by_filter.items():
+            pnl_r = self._pnl_r[idx]
             results[filter_name] = {
-                'count': len(filter_shadows),
-                'win_rate': filter_shadows['win'].mean(),
-                'avg_r': filter_shadows['pnl_r'].mean(),
-                'total_r': filter_shadows['pnl_r'].sum(),
-                'best_r': filter_shadows['pnl_r'].max(),
-                'worst_r': filter_shadows['pnl_r'].min()
+                'count': idx.size,
+                'win_rate': self._win[idx].mean(),
+                'avg_r': pnl_r.mean(),
+                'total_r': pnl_r.sum(),
+                'best_r': pnl_r.max(),
+                'worst_r': pnl_r.min()
             }
         
         return results
@@ -239,18 +275,8 @@ class ShadowTradeAnalyzer:
             Comparison metrics
         """
         return {
-            'real_trades': {
-                'count': len(self.real_trades),
-                'win_rate': self.real_trades['win'].mean(),
-                'avg_r': self.real_trades['pnl_r'].mean(),
-                'total_r': self.real_trades['pnl_r'].sum()
-            },
-            'shadow_trades': {
-                'count': len(self.shadow_trades),
-                'win_rate': self.shadow_trades['win'].mean(),
-                'avg_r': self.shadow_trades['pnl_r'].mean(),
-                'total_r': self.shadow_trades['pnl_r'].sum()
-            }
+            'real_trades': _trade_stats(self._real_pnl_r, self._real_win),
+            'shadow_trades': _trade_stats(self._pnl_r, self._win)
         }
     
     def filter_opportunity_cost(self) -> Dict[str, float]:
@@ -262,22 +288,23 @@ class ShadowTradeAnalyzer:
         Returns:
             Dict of filter_name -> opportunity_cost
         """
-        costs = {}
-        
-        for filter_name in self.shadow_trades['blocked_by_filter'].unique():
-            if pd.isna(filter_name):
-                continue
-            
-            filter_shadows = self.shadow_trades[
-                self.shadow_trades['blocked_by_filter'] == filter_name
-            ]
-            
-            # Opportunity cost = what we missed
-            opportunity_cost = filter_shadows['pnl_r'].sum()
-            
-            costs[filter_name] = opportunity_cost
-        
-        return costs
+        # Opportunity cost = what we missed
+        return {
+            filter_name: self._pnl_r[idx].sum()
+            for filter_name, idx in self._by_filter.items()
+        }
+
+
+def _trade_stats(pnl_r: np.ndarray, win: np.ndarray) -> Dict[str, Any]:
+    """Count, win rate, average and total R (NaN averages when empty)."""
+    if pnl_r.size == 0:
+        return {'count': 0, 'win_rate': np.nan, 'avg_r': np.nan, 'total_r': 0.0}
+    return {
+        'count': pnl_r.size,
+        'win_rate': win.mean(),
+        'avg_r': pnl_r.mean(),
+        'total_r': pnl_r.sum()
+    }
 
 
 # Example usage
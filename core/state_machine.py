@@ -16,22 +16,130 @@ States represent where we are in the trading logic:
 State transitions are one-way and irreversible (except IDLE reset).
 """
 
+import logging
+from itertools import islice
+from collections import ChainMap, deque
 from enum import Enum
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, FrozenSet, Tuple, Deque, Mapping
 from strategy_logging.schemas import TradingState
 from utils.config_loader import Config
 
 
-@dataclass
+# Valid transitions (see StateMachine._is_valid_transition), built once
+_VALID_TRANSITIONS: Dict[TradingState, FrozenSet[TradingState]] = {
+    TradingState.IDLE: frozenset({
+        TradingState.SESSION_ACTIVE
+    }),
+    TradingState.SESSION_ACTIVE: frozenset({
+        TradingState.ONS_INVALID,
+        TradingState.AWAITING_DEVIATION
+    }),
+    TradingState.ONS_INVALID: frozenset({
+        TradingState.IDLE  # Reset for next session
+    }),
+    TradingState.AWAITING_DEVIATION: frozenset({
+        TradingState.AWAITING_SMT,
+        TradingState.SESSION_LOCKED
+    }),
+    TradingState.AWAITING_SMT: frozenset({
+        TradingState.AWAITING_RECLAIM,
+        TradingState.SESSION_LOCKED
+    }),
+    TradingState.AWAITING_RECLAIM: frozenset({
+        TradingState.IN_TRADE,
+        TradingState.SESSION_LOCKED
+    }),
+    TradingState.IN_TRADE: frozenset({
+        TradingState.SESSION_LOCKED
+    }),
+    TradingState.SESSION_LOCKED: frozenset({
+        TradingState.IDLE  # Reset for next session
+    })
+}
+
+# State names by TradingState.index (Enum .value is a Python-level
+# property; a tuple index is not)
+_STATE_STR: Tuple[str, ...] = tuple(state.value for state in TradingState)
+
+# The same table as one bitmask per source state: bit to.index of
+# _VALID_MASK[from.index] is set for each valid transition
+_VALID_MASK: List[int] = [0] * len(_STATE_STR)
+for _from_state, _to_states in _VALID_TRANSITIONS.items():
+    for _to_state in _to_states:
+        _VALID_MASK[_from_state.index] |= 1 << _to_state.index
+del _from_state, _to_states, _to_state
+
+# StateMachine.can_trade answer per state: (can_trade, reason_if_not,
+# whether the max-trades limit is checked first)
+_CAN_TRADE_BLOCKED = {
+    TradingState.IN_TRADE: (False, "Already in trade", False),
+    TradingState.SESSION_LOCKED: (False, "Session locked", False),
+    TradingState.ONS_INVALID: (False, "ONS filter failed", False)
+}
+_TRADEABLE_STATES = frozenset({
+    TradingState.AWAITING_DEVIATION,
+    TradingState.AWAITING_SMT,
+    TradingState.AWAITING_RECLAIM
+})
+_CAN_TRADE_BY_STATE: Tuple[Tuple[bool, Optional[str], bool], ...] = tuple(
+    _CAN_TRADE_BLOCKED.get(
+        state,
+        (True, None, True) if state in _TRADEABLE_STATES
+        else (False, f"Not in tradeable state (current: {state.value})", True)
+    )
+    for state in TradingState  # In index order
+)
+
+
+log = logging.getLogger(__name__)
+
+_now = datetime.now
+
+# Shared read-only context for transitions recorded without one
+_EMPTY_CONTEXT: Mapping[str, Any] = MappingProxyType({})
+
+
+@dataclass(slots=True, frozen=True)
 class StateTransition:
     """Records a state transition for logging and debugging."""
     timestamp: datetime
     from_state: TradingState
     to_state: TradingState
     reason: str
-    context: Dict[str, Any] = field(default_factory=dict)
+    context: Mapping[str, Any] = field(default_factory=lambda: _EMPTY_CONTEXT)
+
+
+@dataclass(slots=True)
+class StateContext:
+    """
+    Per-model state of a StateMachine (one per symbol, scenario, ...).
+    
+    Create with StateMachine.new_context() and switch a machine between
+    contexts with StateMachine.rebind(); the transition tables and session
+    config stay shared.
+    """
+    state_history: Deque[StateTransition]
+    serialized_history: Deque[Dict[str, Any]]
+    current_state: TradingState = TradingState.IDLE
+    previous_state: Optional[TradingState] = None
+    trades_taken_today: int = 0
+    current_session_date: Optional[datetime] = None
+    session_transitions: int = 0
+
+
+# StateContext field -> StateMachine attribute
+_CONTEXT_ATTRS = (
+    ('state_history', 'state_history'),
+    ('serialized_history', '_serialized_history'),
+    ('current_state', 'current_state'),
+    ('previous_state', 'previous_state'),
+    ('trades_taken_today', 'trades_taken_today'),
+    ('current_session_date', 'current_session_date'),
+    ('session_transitions', 'session_transitions')
+)
 
 
 class StateMachine:
@@ -41,29 +149,113 @@ class StateMachine:
     Manages state transitions and enforces trading rules.
     """
     
-    def __init__(self):
-        """Initialize state machine."""
+    # Session config, read once on first use (see _prime)
+    _MAX_TRADES: Optional[int] = None
+    _HISTORY_LIMIT: Optional[int] = None
+    
+    @classmethod
+    def _prime(cls) -> None:
+        """Cache the session config used by every instance (after Config.initialize())."""
+        cls._MAX_TRADES = Config.get('session', 'max_trades_per_session')
+        cls._HISTORY_LIMIT = Config.get('session', 'history_limit', default=2048)
+    
+    def __init__(self, history_limit: Optional[int] = None):
+        """
+        Initialize state machine.
+        
+        Args:
+            history_limit: Transitions kept in state_history (default:
+                session.history_limit from config)
+        """
+        cls = type(self)
+        if cls._MAX_TRADES is None:
+            cls._prime()
+        if history_limit is None:
+            history_limit = cls._HISTORY_LIMIT
+        
         self.current_state = TradingState.IDLE
         self.previous_state: Optional[TradingState] = None
         
-        # State history
-        self.state_history: List[StateTransition] = []
+        # current_state.index, kept in step by transition_to, rebind and
+        # reset_for_new_session so hot loops compare plain ints
+        self.current_state_int = TradingState.IDLE.index
+        
+        # State history (most recent transitions, bounded for long runs),
+        # and the same transitions as get_transition_history returns them,
+        # serialized once when recorded
+        self.state_history: Deque[StateTransition] = deque(maxlen=history_limit)
+        self._serialized_history: Deque[Dict[str, Any]] = deque(maxlen=history_limit)
         
         # Session tracking
         self.trades_taken_today = 0
-        self.max_trades_per_session = Config.get('session', 'max_trades_per_session')
+        self.max_trades_per_session = cls._MAX_TRADES
         
         # Session date tracking
         self.current_session_date: Optional[datetime] = None
         
-        # Context data
-        self.context: Dict[str, Any] = {}
+        # Transitions since the last session reset (see merged_context)
+        self.session_transitions = 0
+        
+        # (state, trades taken, max trades, can_trade result)
+        self._can_trade_cached: Tuple[Any, ...] = (None, None, None, None)
+        
+        # Context the state above is saved to on rebind (created then)
+        self._bound: Optional[StateContext] = None
+    
+    @classmethod
+    def new_context(cls, history_limit: Optional[int] = None) -> StateContext:
+        """
+        Create a fresh per-model state (IDLE, no trades, empty history).
+        
+        Args:
+            history_limit: Transitions kept in its history (default:
+                session.history_limit from config)
+        
+        Returns:
+            StateContext to pass to rebind()
+        """
+        if cls._MAX_TRADES is None:
+            cls._prime()
+        if history_limit is None:
+            history_limit = cls._HISTORY_LIMIT
+        return StateContext(
+            state_history=deque(maxlen=history_limit),
+            serialized_history=deque(maxlen=history_limit)
+        )
+    
+    def rebind(self, ctx: StateContext) -> StateContext:
+        """
+        Switch this machine to another model's state.
+        
+        The state the machine is leaving is saved to the context it was
+        bound to (a new one on the first rebind) and returned, so one
+        machine can step many models: ctx_a = sm.rebind(ctx_b). While
+        bound, the machine's attributes are the live state; the context
+        is brought up to date when the machine rebinds away from it.
         
+        Args:
+            ctx: State to continue from
+        
+        Returns:
+            The context holding the state that was just left
+        """
+        left = self._bound
+        if left is None:
+            left = StateContext(state_history=self.state_history,
+                                serialized_history=self._serialized_history)
+        for ctx_field, attr in _CONTEXT_ATTRS:
+            setattr(left, ctx_field, getattr(self, attr))
+        for ctx_field, attr in _CONTEXT_ATTRS:
+            setattr(self, attr, getattr(ctx, ctx_field))
+        self.current_state_int = self.current_state.index
+        self._bound = ctx
+        return left
+    
     def transition_to(
         self, 
         new_state: TradingState, 
         reason: str, 
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Mapping[str, Any]] = _EMPTY_CONTEXT
     ) -> bool:
         """
         Attempt to transition to a new state.
@@ -71,38 +263,51 @@ class StateMachine:
         Args:
             new_state: Target state
             reason: Why this transition is happening
-            context: Additional context data
+            context: Additional context data (stored with the transition;
+                None or empty records the shared empty mapping)
         
         Returns:
             True if transition successful, False if invalid
         """
+        from_state = self.current_state
+        
+        # State names, read once
+        cur = _STATE_STR[from_state.index]
+        nxt = _STATE_STR[new_state.index]
+        
         # Validate transition
-        if not self._is_valid_transition(self.current_state, new_state):
-            print(f"⚠️  Invalid transition: {self.current_state.value} → {new_state.value}")
+        if not self._is_valid_transition(from_state, new_state):
+            log.warning("⚠️  Invalid transition: %s → %s", cur, nxt)
             return False
         
         # Record transition
         transition = StateTransition(
-            timestamp=datetime.now(),
-            from_state=self.current_state,
+            timestamp=_now(),
+            from_state=from_state,
             to_state=new_state,
             reason=reason,
-            context=context or {}
+            context=context or _EMPTY_CONTEXT
         )
         
         self.state_history.append(transition)
+        self._serialized_history.append({
+            'timestamp': transition.timestamp.isoformat(),
+            'from': cur,
+            'to': nxt,
+            'reason': reason,
+            'context': dict(context) if context else {}
+        })
         
-        # Update context
-        if context:
-            self.context.update(context)
+        self.session_transitions += 1
         
         # Log transition
-        print(f"🔄 State: {self.current_state.value} → {new_state.value}")
-        print(f"   Reason: {reason}")
+        if log.isEnabledFor(logging.INFO):
+            log.info("🔄 State: %s → %s\n   Reason: %s", cur, nxt, reason)
         
         # Update state
-        self.previous_state = self.current_state
+        self.previous_state = from_state
         self.current_state = new_state
+        self.current_state_int = new_state.index
         
         # Handle special state actions
         self._on_state_entered(new_state, reason)
@@ -130,41 +335,7 @@ class StateMachine:
         Returns:
             True if transition is valid
         """
-        # Define valid transitions
-        valid_transitions = {
-            TradingState.IDLE: [
-                TradingState.SESSION_ACTIVE
-            ],
-            TradingState.SESSION_ACTIVE: [
-                TradingState.ONS_INVALID,
-                TradingState.AWAITING_DEVIATION
-            ],
-            TradingState.ONS_INVALID: [
-                TradingState.IDLE  # Reset for next session
-            ],
-            TradingState.AWAITING_DEVIATION: [
-                TradingState.AWAITING_SMT,
-                TradingState.SESSION_LOCKED
-            ],
-            TradingState.AWAITING_SMT: [
-                TradingState.AWAITING_RECLAIM,
-                TradingState.SESSION_LOCKED
-            ],
-            TradingState.AWAITING_RECLAIM: [
-                TradingState.IN_TRADE,
-                TradingState.SESSION_LOCKED
-            ],
-            TradingState.IN_TRADE: [
-                TradingState.SESSION_LOCKED
-            ],
-            TradingState.SESSION_LOCKED: [
-                TradingState.IDLE  # Reset for next session
-            ]
-        }
-        
-        # Check if transition is in valid list
-        allowed = valid_transitions.get(from_state, [])
-        return to_state in allowed
+        return bool((_VALID_MASK[from_state.index] >> to_state.index) & 1)
     
     def _on_state_entered(self, state: TradingState, reason: str) -> None:
         """
@@ -176,46 +347,59 @@ class StateMachine:
         """
         if state == TradingState.IN_TRADE:
             self.trades_taken_today += 1
-            print(f"   📊 Trades today: {self.trades_taken_today}/{self.max_trades_per_session}")
+            log.info("   📊 Trades today: %d/%d", self.trades_taken_today, self.max_trades_per_session)
         
         elif state == TradingState.SESSION_LOCKED:
-            print(f"   🔒 Session locked (no more trades today)")
+            log.info("   🔒 Session locked (no more trades today)")
         
         elif state == TradingState.ONS_INVALID:
-            print(f"   ❌ ONS filter failed - session locked")
+            log.info("   ❌ ONS filter failed - session locked")
+    
+    @property
+    def merged_context(self) -> ChainMap:
+        """
+        Context of this session's transitions, merged (latest wins).
+        
+        Built on read from the transition records; each context stays with
+        its own transition. Only transitions still in state_history count.
+        """
+        return ChainMap(*[
+            t.context
+            for t in islice(reversed(self.state_history), self.session_transitions)
+        ])
     
     def can_trade(self) -> tuple[bool, Optional[str]]:
         """
         Check if we can take a trade right now.
         
+        The answer is cached until the state, trade count or limit changes,
+        so polling (get_state_summary every tick) is a few comparisons.
+        
         Returns:
             Tuple of (can_trade, reason_if_not)
         """
-        # Already in trade
-        if self.current_state == TradingState.IN_TRADE:
-            return False, "Already in trade"
+        state = self.current_state
+        trades = self.trades_taken_today
+        max_trades = self.max_trades_per_session
         
-        # Session locked
-        if self.current_state == TradingState.SESSION_LOCKED:
-            return False, "Session locked"
+        cached = self._can_trade_cached
+        if cached[0] is state and cached[1] == trades and cached[2] == max_trades:
+            return cached[3]
         
-        # ONS invalid
-        if self.current_state == TradingState.ONS_INVALID:
-            return False, "ONS filter failed"
+        result = self._compute_can_trade()
+        self._can_trade_cached = (state, trades, max_trades, result)
+        return result
+    
+    def _compute_can_trade(self) -> tuple[bool, Optional[str]]:
+        """Uncached can_trade."""
+        # In trade / session locked / ONS invalid answer first, then the
+        # max-trades limit, then whether the state is tradeable
+        ok, reason, check_max_trades = _CAN_TRADE_BY_STATE[self.current_state.index]
         
-        # Max trades reached
-        if self.trades_taken_today >= self.max_trades_per_session:
+        if check_max_trades and self.trades_taken_today >= self.max_trades_per_session:
             return False, f"Max trades reached ({self.max_trades_per_session})"
         
-        # Not in a tradeable state
-        if self.current_state not in [
-            TradingState.AWAITING_DEVIATION,
-            TradingState.AWAITING_SMT,
-            TradingState.AWAITING_RECLAIM
-        ]:
-            return False, f"Not in tradeable state (current: {self.current_state.value})"
-        
-        return True, None
+        return ok, reason
     
     def reset_for_new_session(self, session_date: datetime) -> None:
         """
@@ -225,12 +409,14 @@ class StateMachine:
             session_date: The date of the new session
         """
         self.current_state = TradingState.IDLE
+        self.current_state_int = TradingState.IDLE.index
         self.previous_state = None
         self.trades_taken_today = 0
         self.current_session_date = session_date
-        self.context = {}
+        self.session_transitions = 0
         
-        print(f"\n🔄 State machine reset for session: {session_date.date()}")
+        if log.isEnabledFor(logging.INFO):
+            log.info("\n🔄 State machine reset for session: %s", session_date.date())
     
     def get_state_summary(self) -> Dict[str, Any]:
         """
@@ -240,8 +426,8 @@ class StateMachine:
             Dictionary with current state info
         """
         return {
-            'current_state': self.current_state.value,
-            'previous_state': self.previous_state.value if self.previous_state else None,
+            'current_state': _STATE_STR[self.current_state.index],
+            'previous_state': _STATE_STR[self.previous_state.index] if self.previous_state else None,
             'trades_taken': self.trades_taken_today,
             'max_trades': self.max_trades_per_session,
             'can_trade': self.can_trade()[0],
@@ -251,27 +437,21 @@ class StateMachine:
     
     def get_transition_history(self) -> List[Dict[str, Any]]:
         """
-        Get full history of state transitions.
+        Get history of state transitions (the most recent
+        session.history_limit of them).
         
         Returns:
             List of transition dictionaries
         """
-        return [
-            {
-                'timestamp': t.timestamp.isoformat(),
-                'from': t.from_state.value,
-                'to': t.to_state.value,
-                'reason': t.reason,
-                'context': t.context
-            }
-            for t in self.state_history
-        ]
+        return list(self._serialized_history)
 
 
 # Example usage and testing
 if __name__ == "__main__":
     from utils.config_loader import Config
     
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     print("="*70)
     print("STATE MACHINE TESTING")
     print("="*70)
@@ -19,8 +19,17 @@ Flow:
 All decisions are logged for analysis and shadow trade evaluation.
 """
 
+import io
+import multiprocessing
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, Tuple
+from functools import lru_cache
+from typing import Optional, Dict, Any, Tuple, List, NamedTuple, TextIO
+import numpy as np
 import pandas as pd
 
 from core.state_machine import StateMachine
@@ -29,20 +38,89 @@ from core.indicators import (
     ADRCalculator,
     ONSFilter,
     ISICalculator,
-    SMTDetector
+    SMTDetector,
+    ISIResult,
+    SMTResult,
+    ONSResult
 )
 from core.shadow_trades import ShadowTradeManager, FilterCheck
+from core.strategy_kernels import (
+    EVENT_NONE,
+    EVENT_DEVIATION,
+    EVENT_RECLAIM,
+    EVENT_RECLAIM_TIMEOUT,
+    EVENT_STOP_LOSS,
+    EVENT_TP1,
+    TRADE_DTYPE
+)
+
+# Prefer the ahead-of-time build (python -m core._strategy_aot) to skip
+# JIT warm-up; fall back to the JIT / pure Python kernel
+try:
+    from core.strategy_aot import session_core_loop
+except ImportError:
+    from core.strategy_kernels import session_core_loop
 from strategy_logging.logger import Logger
 from strategy_logging.schemas import (
     TradingState,
     EventLog,
     TradeLog,
-    NoTradeLog
+    NoTradeLog,
+    NoTradeReason
 )
 from utils.time_utils import TimeUtils
 from utils.config_loader import Config
 
 
+class _IndexKey:
+    """
+    Identity cache key for a DatetimeIndex (pandas indexes are unhashable).
+    
+    The key holds a reference to the index, so the id cannot be reused by
+    another index while the cache entry is alive.
+    """
+    
+    __slots__ = ('index',)
+    
+    def __init__(self, index: pd.DatetimeIndex):
+        self.index = index
+    
+    def __hash__(self) -> int:
+        return id(self.index)
+    
+    def __eq__(self, other) -> bool:
+        return isinstance(other, _IndexKey) and other.index is self.index
+
+
+class _SessionInputs(NamedTuple):
+    """Per-session values precomputed by StrategyEngine.precompute_sessions."""
+    midnight_open: float
+    adr: float
+    ons_result: ONSResult
+
+
+# _log_no_trade reason codes -> logged NoTradeReason
+_NO_TRADE_REASONS = {
+    'ONS_INVALID': NoTradeReason.ONS_INVALID,
+    'ISI_TOO_HIGH': NoTradeReason.DISPLACEMENT_TOO_STRONG,
+    'RECLAIM_TIMEOUT': NoTradeReason.RECLAIM_TIMEOUT,
+}
+
+# Banner printed at the start of each session
+_SESSION_HEADER = "\n" + "=" * 70 + "\nRUNNING SESSION: {}\n" + "=" * 70
+
+# run_session's bar loop stops once the session locks
+_SESSION_LOCKED = TradingState.SESSION_LOCKED.index
+
+
+@lru_cache(maxsize=8)
+def _window_mask(key: _IndexKey, start_time: str, end_time: str) -> np.ndarray:
+    """Trading window mask for an index, cached per (index, window)."""
+    mask = TimeUtils.trading_window_mask(key.index, start_time, end_time)
+    mask.flags.writeable = False
+    return mask
+
+
 class StrategyEngine:
     """
     Main trading strategy engine.
@@ -50,11 +128,19 @@ class StrategyEngine:
     Orchestrates all components to make trading decisions.
     """
     
-    def __init__(self):
-        """Initialize strategy engine with all components."""
-        print("="*70)
-        print("INITIALIZING STRATEGY ENGINE")
-        print("="*70)
+    def __init__(self, verbose: bool = True, output_log_size: int = 10_000):
+        """
+        Initialize strategy engine with all components.
+        
+        Args:
+            verbose: Print session progress as it happens. When False the
+                messages are kept unformatted in output_log (see flush_output)
+            output_log_size: Most recent messages kept when not verbose
+        """
+        self.verbose = verbose
+        self.output_log: deque = deque(maxlen=output_log_size)
+        
+        self._say("=" * 70 + "\nINITIALIZING STRATEGY ENGINE\n" + "=" * 70)
         
         # Configuration
         Config.initialize()
@@ -68,8 +154,8 @@ class StrategyEngine:
         self.mo_calc = MidnightOpenCalculator()
         self.adr_calc = ADRCalculator(lookback_days=20)
         self.ons_filter = ONSFilter(
-            min_ratio=Config.get('ons', 'min_adr_ratio'),
-            max_ratio=Config.get('ons', 'max_adr_ratio')
+            min_ratio=Config.get('ons_filter', 'min_ratio'),
+            max_ratio=Config.get('ons_filter', 'max_ratio')
         )
         self.isi_calc = ISICalculator(
             threshold_min=Config.get('isi', 'threshold_min'),
@@ -82,29 +168,66 @@ class StrategyEngine:
         self.midnight_open: Optional[float] = None
         self.adr: Optional[float] = None
         self.bias: Optional[str] = None
+        self.bias_sign: Optional[int] = None  # +1 LONG, -1 SHORT
         
         # Deviation tracking
         self.deviation_detected = False
         self.deviation_time: Optional[datetime] = None
+        self.deviation_time_ns: Optional[int] = None
         self.deviation_extreme: Optional[float] = None
         self.deviation_start_idx: Optional[int] = None
         self.deviation_end_idx: Optional[int] = None
         
         # Trade tracking
-        self.current_trade: Optional[Dict[str, Any]] = None
+        self.current_trade: Optional[np.void] = None  # TRADE_DTYPE record
         self.trade_count = 0
         
+        # Session inputs from precompute_sessions (for _session_data only)
+        self._session_data: Optional[pd.DataFrame] = None
+        self._session_inputs: Dict[datetime, _SessionInputs] = {}
+        
         # Configuration values
         self.trading_window_start = Config.get('session', 'trading_window_start')
         self.trading_window_end = Config.get('session', 'trading_window_end')
         self.reclaim_time_limit = Config.get('reclaim', 'max_time_minutes')
-        self.reclaim_body_ratio = Config.get('reclaim', 'min_body_ratio')
+        self.reclaim_time_limit_ns = round(self.reclaim_time_limit * 60_000_000_000)
+        self.reclaim_body_ratio = float(Config.get('reclaim', 'min_body_ratio'))
+        self.deviation_lookback = 20  # Bars before the sweep searched for the extreme
+        self.stop_buffer = 2.0  # Points beyond the deviation extreme
+        self.tp1_r = float(Config.get('risk', 'tp1_r'))
+        
+        self._say(
+            "✅ Strategy engine initialized\n"
+            "   Trading window: {} - {}\n"
+            "   ONS range: {:.0%} - {:.0%}\n"
+            "   ISI thresholds: {} - {}\n" + "=" * 70,
+            self.trading_window_start, self.trading_window_end,
+            Config.get('ons_filter', 'min_ratio'), Config.get('ons_filter', 'max_ratio'),
+            Config.get('isi', 'threshold_min'), Config.get('isi', 'threshold_max')
+        )
+    
+    def _say(self, message: str, *args) -> None:
+        """Print a message now (verbose) or keep it for flush_output()."""
+        if self.verbose:
+            print(message.format(*args) if args else message)
+        else:
+            self.output_log.append((message, args))
+    
+    def flush_output(self, file: Optional[TextIO] = None) -> None:
+        """
+        Write and clear the messages kept while not verbose.
         
-        print("✅ Strategy engine initialized")
-        print(f"   Trading window: {self.trading_window_start} - {self.trading_window_end}")
-        print(f"   ONS range: {Config.get('ons_filter', 'min_ratio'):.0%} - {Config.get('ons_filter', 'max_ratio'):.0%}")
-        print(f"   ISI thresholds: {Config.get('isi', 'threshold_min')} - {Config.get('isi', 'threshold_max')}")
-        print("="*70)
+        Args:
+            file: Destination (default sys.stdout), written in one call
+        """
+        if not self.output_log:
+            return
+        file = file if file is not None else sys.stdout
+        file.write('\n'.join(
+            message.format(*args) if args else message
+            for message, args in self.output_log
+        ) + '\n')
+        self.output_log.clear()
     
     def run_session(
         self,
@@ -123,9 +246,7 @@ class StrategyEngine:
         Returns:
             Session results dictionary
         """
-        print(f"\n{'='*70}")
-        print(f"RUNNING SESSION: {session_date.date()}")
-        print(f"{'='*70}")
+        self._say(_SESSION_HEADER, session_date.date())
         
         # Reset for new session
         self.state_machine.reset_for_new_session(session_date)
@@ -133,20 +254,31 @@ class StrategyEngine:
         self.deviation_detected = False
         self.current_trade = None
         
+        # Values from precompute_sessions, if this session was batched
+        precomputed = None
+        if nq_data is self._session_data:
+            precomputed = self._session_inputs.get(session_date)
+        
         # Step 1: Calculate midnight open
         try:
-            self.midnight_open = self.mo_calc.calculate(nq_data, session_date)
-            print(f"\n📍 Midnight Open: {self.midnight_open:.2f}")
+            if precomputed is not None:
+                self.midnight_open = precomputed.midnight_open
+            else:
+                self.midnight_open = self.mo_calc.calculate(nq_data, session_date)
+            self._say("\n📍 Midnight Open: {:.2f}", self.midnight_open)
         except ValueError as e:
-            print(f"❌ Could not calculate midnight open: {e}")
+            self._say("❌ Could not calculate midnight open: {}", e)
             return {'session_date': session_date, 'trades': 0, 'reason': 'NO_MIDNIGHT_OPEN'}
         
         # Step 2: Calculate ADR
         try:
-            self.adr = self.adr_calc.calculate(nq_data, session_date)
-            print(f"📊 ADR (20-day): {self.adr:.2f} points")
+            if precomputed is not None:
+                self.adr = precomputed.adr
+            else:
+                self.adr = self.adr_calc.calculate(nq_data, session_date)
+            self._say("📊 ADR (20-day): {:.2f} points", self.adr)
         except ValueError as e:
-            print(f"❌ Could not calculate ADR: {e}")
+            self._say("❌ Could not calculate ADR: {}", e)
             return {'session_date': session_date, 'trades': 0, 'reason': 'NO_ADR'}
         
         # Step 3: Validate ONS
@@ -155,17 +287,20 @@ class StrategyEngine:
             "Session opened"
         )
         
-        ons_result = self.ons_filter.validate(nq_data, session_date)
+        if precomputed is not None:
+            ons_result = precomputed.ons_result
+        else:
+            ons_result = self.ons_filter.validate(nq_data, session_date)
         
-        if not ons_result['valid']:
-            print(f"\n❌ ONS Invalid: {ons_result['reason']}")
+        if not ons_result.valid:
+            self._say("\n❌ ONS Invalid: {}", ons_result.reason)
             self.state_machine.transition_to(
                 TradingState.ONS_INVALID,
-                ons_result['reason']
+                ons_result.reason
             )
             
             # Log no-trade
-            self._log_no_trade('ONS_INVALID', ons_result['reason'])
+            self._log_no_trade('ONS_INVALID', ons_result.reason)
             
             return {
                 'session_date': session_date,
@@ -174,7 +309,7 @@ class StrategyEngine:
                 'ons_result': ons_result
             }
         
-        print(f"✅ ONS Valid: {ons_result['ratio']:.1%} of ADR")
+        self._say("✅ ONS Valid: {:.1%} of ADR", ons_result.ratio)
         
         # Step 4: Process bars looking for setup
         self.state_machine.transition_to(
@@ -186,117 +321,129 @@ class StrategyEngine:
         trading_bars = self._get_trading_window_bars(nq_data)
         
         if trading_bars.empty:
-            print("⚠️  No bars in trading window")
+            self._say("⚠️  No bars in trading window")
             return {'session_date': session_date, 'trades': 0, 'reason': 'NO_DATA_IN_WINDOW'}
         
-        print(f"\n📈 Processing {len(trading_bars)} bars in trading window...")
+        self._say("\n📈 Processing {} bars in trading window...", len(trading_bars))
+        
+        # Column arrays for the bar loop kernel
+        open_ = trading_bars['open'].to_numpy(dtype=np.float64)
+        high = trading_bars['high'].to_numpy(dtype=np.float64)
+        low = trading_bars['low'].to_numpy(dtype=np.float64)
+        close = trading_bars['close'].to_numpy(dtype=np.float64)
+        bar_times = trading_bars.index
+        times_ns = bar_times.as_unit('ns').asi8
+        n_bars = len(close)
+        
+        # Candle body / range for the reclaim check (NaN for zero-range bars)
+        range_size = high - low
+        body_ratio = np.divide(
+            np.abs(close - open_), range_size,
+            out=np.full(n_bars, np.nan), where=range_size > 0
+        )
+        
+        # Determine bias from the first bar
+        if self.bias is None:
+            self.bias = self._determine_bias(close[0])
+            self._say(
+                "\n🎯 Bias: {} (price {} MO)",
+                self.bias, 'below' if self.bias == 'LONG' else 'above'
+            )
         
-        # Process each bar
-        for idx in range(len(trading_bars)):
-            current_bar = trading_bars.iloc[idx]
-            current_time = current_bar.name
-            current_price = current_bar['close']
+        self.bias_sign = 1 if self.bias == "LONG" else -1
+        
+        # Kernel inputs that are only set once the session gets that far
+        start = 0
+        deviation_time_ns = 0
+        stop_loss = np.nan
+        tp1_price = np.nan
+        
+        # Run the bar loop in the kernel, handling each event here, until
+        # the session locks or the bars run out
+        state = self.state_machine.current_state_int
+        while state != _SESSION_LOCKED and start < n_bars:
+            event, idx, extreme = session_core_loop(
+                open_, high, low, close, body_ratio, times_ns,
+                state, start,
+                self.midnight_open, float(self.bias_sign), self.deviation_lookback,
+                deviation_time_ns, self.reclaim_time_limit_ns, self.reclaim_body_ratio,
+                stop_loss, tp1_price
+            )
             
-            # Determine/update bias
-            if self.bias is None:
-                self.bias = self._determine_bias(current_price)
-                print(f"\n🎯 Bias: {self.bias} (price {'below' if self.bias == 'LONG' else 'above'} MO)")
+            if event == EVENT_NONE:
+                break
             
-            # State: AWAITING_DEVIATION
-            if self.state_machine.current_state == TradingState.AWAITING_DEVIATION:
-                if self._check_for_deviation(trading_bars, idx):
-                    print(f"\n⚡ Deviation detected at {current_time}")
-                    print(f"   Extreme: {self.deviation_extreme:.2f}")
-                    
-                    self.state_machine.transition_to(
-                        TradingState.AWAITING_SMT,
-                        f"Sweep to {self.deviation_extreme:.2f}"
-                    )
+            current_time = bar_times[idx]
             
-            # State: AWAITING_SMT
-            elif self.state_machine.current_state == TradingState.AWAITING_SMT:
-                # Check ISI first
-                isi_result = self._check_isi(trading_bars)
-                
-                if isi_result['assessment'] == 'NO_FADE':
-                    print(f"\n❌ ISI too high: {isi_result['isi']:.2f} (strong trend)")
-                    
-                    self._log_no_trade('ISI_TOO_HIGH', f"ISI: {isi_result['isi']:.2f}")
-                    
-                    self.state_machine.transition_to(
-                        TradingState.SESSION_LOCKED,
-                        "Displacement too strong"
-                    )
-                    break
+            # AWAITING_DEVIATION → AWAITING_SMT
+            if event == EVENT_DEVIATION:
+                self._record_deviation(idx, extreme, current_time, times_ns[idx])
+                self._say(
+                    "\n⚡ Deviation detected at {}\n   Extreme: {:.2f}",
+                    current_time, self.deviation_extreme
+                )
                 
-                # Check SMT
-                smt_result = self._check_smt(nq_data, es_data)
+                self.state_machine.transition_to(
+                    TradingState.AWAITING_SMT,
+                    f"Sweep to {self.deviation_extreme:.2f}"
+                )
                 
-                if not smt_result['smt_binary']:
-                    print(f"\n❌ SMT failed (no divergence)")
-                    
-                    # This is a shadow trade! (one filter failed)
-                    self._log_shadow_trade('SMT_BINARY', smt_result, isi_result)
-                    
-                    self.state_machine.transition_to(
-                        TradingState.SESSION_LOCKED,
-                        "SMT confirmation failed"
-                    )
+                # ISI and SMT are decided once, on the bar after the sweep
+                if idx + 1 >= n_bars:
                     break
+                if self._confirm_deviation(trading_bars, nq_data, es_data):
+                    deviation_time_ns = self.deviation_time_ns
+                    start = idx + 2
+            
+            # AWAITING_RECLAIM → SESSION_LOCKED
+            elif event == EVENT_RECLAIM_TIMEOUT:
+                self._say("\n⏰ Reclaim timeout ({} minutes)", self.reclaim_time_limit)
                 
-                print(f"\n✅ SMT confirmed (degree: {smt_result['smt_degree']:.2f})")
+                self._log_no_trade('RECLAIM_TIMEOUT', 
+                                  f"No reclaim within {self.reclaim_time_limit} min")
                 
                 self.state_machine.transition_to(
-                    TradingState.AWAITING_RECLAIM,
-                    "SMT divergence confirmed"
+                    TradingState.SESSION_LOCKED,
+                    "Reclaim timeout"
                 )
             
-            # State: AWAITING_RECLAIM
-            elif self.state_machine.current_state == TradingState.AWAITING_RECLAIM:
-                # Check time limit
-                if self._check_reclaim_timeout(current_time):
-                    print(f"\n⏰ Reclaim timeout ({self.reclaim_time_limit} minutes)")
-                    
-                    self._log_no_trade('RECLAIM_TIMEOUT', 
-                                      f"No reclaim within {self.reclaim_time_limit} min")
-                    
-                    self.state_machine.transition_to(
-                        TradingState.SESSION_LOCKED,
-                        "Reclaim timeout"
-                    )
-                    break
+            # AWAITING_RECLAIM → IN_TRADE
+            elif event == EVENT_RECLAIM:
+                self._say(
+                    "\n🎯 Reclaim detected at {}\n   Entry: {:.2f}",
+                    current_time, close[idx]
+                )
+                
+                # Enter trade
+                self._enter_trade(close[idx], times_ns[idx], nq_data, es_data)
                 
-                # Check for reclaim
-                if self._check_for_reclaim(current_bar):
-                    print(f"\n🎯 Reclaim detected at {current_time}")
-                    print(f"   Entry: {current_bar['close']:.2f}")
-                    
-                    # Enter trade
-                    self._enter_trade(current_bar, nq_data, es_data)
-                    
-                    self.state_machine.transition_to(
-                        TradingState.IN_TRADE,
-                        "Reclaim entry triggered"
-                    )
+                self.state_machine.transition_to(
+                    TradingState.IN_TRADE,
+                    "Reclaim entry triggered"
+                )
+                
+                stop_loss = self.current_trade['stop_loss']
+                tp1_price = self.current_trade['tp1_price']
+                start = idx + 1
             
-            # State: IN_TRADE
-            elif self.state_machine.current_state == TradingState.IN_TRADE:
-                # Manage position
-                exit_result = self._manage_position(current_bar)
+            # IN_TRADE → SESSION_LOCKED
+            else:
+                exit_result = self._exit_result(event)
                 
-                if exit_result:
-                    print(f"\n🔚 Trade exited: {exit_result['reason']}")
-                    print(f"   Exit: {current_bar['close']:.2f}")
-                    print(f"   P&L: {exit_result['pnl_r']:.2f}R")
-                    
-                    # Log trade
-                    self._log_trade(current_bar, exit_result)
-                    
-                    self.state_machine.transition_to(
-                        TradingState.SESSION_LOCKED,
-                        f"Trade complete: {exit_result['reason']}"
-                    )
-                    break
+                self._say(
+                    "\n🔚 Trade exited: {}\n   Exit: {:.2f}\n   P&L: {:.2f}R",
+                    exit_result['reason'], close[idx], exit_result['pnl_r']
+                )
+                
+                # Log trade
+                self._log_trade(current_time, exit_result)
+                
+                self.state_machine.transition_to(
+                    TradingState.SESSION_LOCKED,
+                    f"Trade complete: {exit_result['reason']}"
+                )
+            
+            state = self.state_machine.current_state_int
         
         # Session summary
         return {
@@ -308,16 +455,139 @@ class StrategyEngine:
             'state': self.state_machine.current_state.value
         }
     
-    def _get_trading_window_bars(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Get bars within trading window."""
-        trading_bars = df[
-            TimeUtils.is_in_trading_window(
-                df.index,
-                self.trading_window_start,
-                self.trading_window_end
+    def precompute_sessions(
+        self,
+        nq_data: pd.DataFrame,
+        session_dates: List[datetime]
+    ) -> pd.DataFrame:
+        """
+        Precompute midnight open, ADR and ONS validation for many sessions.
+        
+        A backtest calls run_session once per date on the same data. The
+        daily bars behind the ADR and the overnight ranges are built once
+        for all dates (ONSFilter.validate_batch), and run_session then looks
+        the values up for this nq_data frame instead of recalculating them.
+        Dates with a missing value (no midnight bar, no overnight bars, too
+        few ADR days) are left to run_session, so they fail as before.
+        
+        Args:
+            nq_data: NQ price data (1-minute bars), the frame later passed
+                to run_session
+            session_dates: Session dates to precompute
+        
+        Returns:
+            DataFrame indexed by session date with columns midnight_open,
+            adr, ons_high, ons_low, ons_range, ons_ratio, ons_valid
+        """
+        ons = self.ons_filter.validate_batch(nq_data, session_dates)
+        
+        midnight_opens = np.full(len(session_dates), np.nan)
+        for i, session_date in enumerate(session_dates):
+            try:
+                midnight_opens[i] = self.mo_calc.calculate(nq_data, session_date)
+            except ValueError:
+                pass
+        
+        table = pd.DataFrame(
+            {
+                'midnight_open': midnight_opens,
+                'adr': ons['adr'],
+                'ons_high': ons['ons_high'],
+                'ons_low': ons['ons_low'],
+                'ons_range': ons['ons_range'],
+                'ons_ratio': ons['ratio'],
+                'ons_valid': ons['valid'],
+            },
+            index=pd.Index(session_dates, name='session_date')
+        )
+        
+        # The ADR of the ONS filter doubles as the session ADR (both 20-day)
+        complete = table.drop(columns='ons_valid').notna().all(axis=1).to_numpy()
+        
+        self._session_data = nq_data
+        self._session_inputs = {}
+        for session_date, row, ok in zip(session_dates, table.itertuples(index=False), complete):
+            if not ok:
+                continue
+            self._session_inputs[session_date] = _SessionInputs(
+                midnight_open=float(row.midnight_open),
+                adr=float(row.adr),
+                ons_result=self.ons_filter.evaluate(
+                    float(row.ons_high), float(row.ons_low), float(row.ons_range), float(row.adr)
+                )
             )
-        ]
-        return trading_bars
+        
+        return table
+    
+    def run_backtest(
+        self,
+        nq_data: pd.DataFrame,
+        es_data: pd.DataFrame,
+        session_dates: List[datetime],
+        max_workers: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Run many independent sessions in parallel worker processes.
+        
+        Session inputs are precomputed here once (precompute_sessions) and
+        shipped to each worker with the data. Every session runs on a fresh
+        quiet engine with the configured parameters, as if each date were
+        run with StrategyEngine().run_session. Session messages are
+        collected per session and replayed here in date order.
+        
+        Workers are spawned processes, so scripts calling this must guard
+        their entry point with `if __name__ == '__main__':`.
+        
+        Args:
+            nq_data: NQ price data (1-minute bars)
+            es_data: ES price data (1-minute bars)
+            session_dates: Dates of the sessions to run
+            max_workers: Worker processes (default: CPU count); 1 runs
+                the sessions in this process
+        
+        Returns:
+            Session results dictionaries, in session_dates order
+        """
+        self.precompute_sessions(nq_data, session_dates)
+        initargs = (nq_data, es_data, self._session_inputs)
+        
+        if max_workers == 1:
+            _init_backtest_worker(*initargs)
+            try:
+                outcomes = [_run_session_worker(d) for d in session_dates]
+            finally:
+                _worker_state.clear()
+        else:
+            # Spawned, not forked: numba's threading layers are not fork-safe
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_backtest_worker,
+                initargs=initargs
+            ) as pool:
+                outcomes = list(pool.map(_run_session_worker, session_dates))
+        
+        results = []
+        for result, messages in outcomes:
+            for message in messages:
+                self._say(message)
+            results.append(result)
+        
+        return results
+    
+    def _get_trading_window_bars(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Get bars within trading window.
+        
+        The window mask is cached per index, so sessions that share the
+        same data frame only build it once.
+        """
+        mask = _window_mask(
+            _IndexKey(df.index),
+            self.trading_window_start,
+            self.trading_window_end
+        )
+        return df.iloc[mask]
     
     def _determine_bias(self, current_price: float) -> str:
         """Determine LONG or SHORT bias."""
@@ -326,45 +596,85 @@ class StrategyEngine:
         else:
             return "SHORT"
     
-    def _check_for_deviation(self, bars: pd.DataFrame, idx: int) -> bool:
-        """Check if deviation has occurred."""
-        if self.deviation_detected:
+    def _record_deviation(
+        self,
+        idx: int,
+        extreme: float,
+        bar_time: datetime,
+        bar_time_ns: int
+    ) -> None:
+        """
+        Record the deviation found by the session kernel.
+        
+        Args:
+            idx: Position of the sweep bar
+            extreme: Lowest low (LONG) / highest high (SHORT) of the sweep
+                bar and the lookback bars before it
+            bar_time: Timestamp of the sweep bar
+            bar_time_ns: The same timestamp as int64 ns (reclaim timeout)
+        """
+        self.deviation_extreme = float(extreme)
+        self.deviation_time = bar_time
+        self.deviation_time_ns = int(bar_time_ns)
+        self.deviation_start_idx = max(0, idx - self.deviation_lookback)
+        self.deviation_end_idx = idx
+        self.deviation_detected = True
+    
+    def _confirm_deviation(
+        self,
+        trading_bars: pd.DataFrame,
+        nq_data: pd.DataFrame,
+        es_data: pd.DataFrame
+    ) -> bool:
+        """
+        Run the ISI and SMT filters for the recorded deviation.
+        
+        Both depend only on the deviation window and the session data, so
+        they are evaluated exactly once per deviation. Locks the session
+        (and logs why) when a filter fails.
+        
+        Returns:
+            True if the session moved on to AWAITING_RECLAIM
+        """
+        # Check ISI first
+        isi_result = self._check_isi(trading_bars)
+        
+        if isi_result.assessment == 'NO_FADE':
+            self._say("\n❌ ISI too high: {:.2f} (strong trend)", isi_result.isi)
+        
+            self._log_no_trade('ISI_TOO_HIGH', f"ISI: {isi_result.isi:.2f}")
+        
+            self.state_machine.transition_to(
+                TradingState.SESSION_LOCKED,
+                "Displacement too strong"
+            )
             return False
         
-        current_bar = bars.iloc[idx]
+        # Check SMT
+        smt_result = self._check_smt(nq_data, es_data)
         
-        if self.bias == "LONG":
-            # Check if swept below midnight open
-            if current_bar['low'] < self.midnight_open:
-                # Find lowest point in recent bars
-                lookback = min(20, idx)
-                recent_bars = bars.iloc[max(0, idx-lookback):idx+1]
-                
-                self.deviation_extreme = recent_bars['low'].min()
-                self.deviation_time = current_bar.name
-                self.deviation_start_idx = max(0, idx-lookback)
-                self.deviation_end_idx = idx
-                self.deviation_detected = True
-                
-                return True
+        if not smt_result.smt_binary:
+            self._say("\n❌ SMT failed (no divergence)")
         
-        elif self.bias == "SHORT":
-            # Check if swept above midnight open
-            if current_bar['high'] > self.midnight_open:
-                lookback = min(20, idx)
-                recent_bars = bars.iloc[max(0, idx-lookback):idx+1]
-                
-                self.deviation_extreme = recent_bars['high'].max()
-                self.deviation_time = current_bar.name
-                self.deviation_start_idx = max(0, idx-lookback)
-                self.deviation_end_idx = idx
-                self.deviation_detected = True
-                
-                return True
+            # This is a shadow trade! (one filter failed)
+            self._log_shadow_trade('SMT_BINARY', smt_result, isi_result)
+        
+            self.state_machine.transition_to(
+                TradingState.SESSION_LOCKED,
+                "SMT confirmation failed"
+            )
+            return False
+        
+        self._say("\n✅ SMT confirmed (degree: {:.2f})", smt_result.smt_degree)
         
-        return False
+        self.state_machine.transition_to(
+            TradingState.AWAITING_RECLAIM,
+            "SMT divergence confirmed"
+        )
+        
+        return True
     
-    def _check_isi(self, bars: pd.DataFrame) -> Dict[str, Any]:
+    def _check_isi(self, bars: pd.DataFrame) -> ISIResult:
         """Check ISI displacement filter."""
         isi_result = self.isi_calc.calculate(
             bars,
@@ -377,7 +687,7 @@ class StrategyEngine:
         self,
         nq_data: pd.DataFrame,
         es_data: pd.DataFrame
-    ) -> Dict[str, Any]:
+    ) -> SMTResult:
         """Check SMT divergence."""
         # Simplified: Use midnight open as reference
         # In production, use prior session lows
@@ -396,148 +706,84 @@ class StrategyEngine:
         
         return smt_result
     
-    def _check_reclaim_timeout(self, current_time: datetime) -> bool:
-        """Check if reclaim has timed out."""
-        if self.deviation_time is None:
-            return False
-        
-        minutes_elapsed = (current_time - self.deviation_time).total_seconds() / 60
-        return minutes_elapsed > self.reclaim_time_limit
-    
-    def _check_for_reclaim(self, bar: pd.Series) -> bool:
-        """Check if reclaim has occurred."""
-        if self.bias == "LONG":
-            # Need bullish close above midnight open
-            if bar['close'] > self.midnight_open and bar['close'] > bar['open']:
-                # Check body ratio
-                body = abs(bar['close'] - bar['open'])
-                range_size = bar['high'] - bar['low']
-                
-                if range_size > 0:
-                    body_ratio = body / range_size
-                    return body_ratio >= self.reclaim_body_ratio
-        
-        elif self.bias == "SHORT":
-            # Need bearish close below midnight open
-            if bar['close'] < self.midnight_open and bar['close'] < bar['open']:
-                body = abs(bar['close'] - bar['open'])
-                range_size = bar['high'] - bar['low']
-                
-                if range_size > 0:
-                    body_ratio = body / range_size
-                    return body_ratio >= self.reclaim_body_ratio
-        
-        return False
-    
     def _enter_trade(
         self,
-        entry_bar: pd.Series,
+        entry_price: float,
+        entry_time_ns: int,
         nq_data: pd.DataFrame,
         es_data: pd.DataFrame
     ) -> None:
-        """Enter a trade."""
-        entry_price = entry_bar['close']
-        
-        # Calculate stops and targets
-        if self.bias == "LONG":
-            stop_loss = self.deviation_extreme - 2.0  # Buffer below extreme
-            risk_points = entry_price - stop_loss
-            tp1_price = entry_price + (risk_points * Config.get('risk', 'tp1_r'))
-        
-        else:  # SHORT
-            stop_loss = self.deviation_extreme + 2.0
-            risk_points = stop_loss - entry_price
-            tp1_price = entry_price - (risk_points * Config.get('risk', 'tp1_r'))
-        
-        self.current_trade = {
-            'entry_time': entry_bar.name,
-            'entry_price': entry_price,
-            'stop_loss': stop_loss,
-            'tp1_price': tp1_price,
-            'risk_r': 1.0,
-            'position_size': 1.0,  # Simplified
-            'tp1_hit': False
-        }
+        """
+        Enter a trade at the close of the reclaim bar.
+        
+        The open trade is kept as a TRADE_DTYPE record (fixed float fields,
+        read like a dict: self.current_trade['stop_loss']).
+        """
+        sign = self.bias_sign
+        
+        # Calculate stops and targets (stop buffered beyond the extreme)
+        stop_loss = self.deviation_extreme - sign * self.stop_buffer
+        risk_points = sign * (entry_price - stop_loss)
+        tp1_price = entry_price + sign * risk_points * self.tp1_r
+        
+        trade = np.zeros(1, dtype=TRADE_DTYPE)[0]
+        trade['entry_time'] = entry_time_ns
+        trade['entry_price'] = entry_price
+        trade['stop_loss'] = stop_loss
+        trade['tp1_price'] = tp1_price
+        trade['risk_r'] = 1.0
+        trade['position_size'] = 1.0  # Simplified
+        self.current_trade = trade
         
         self.trade_count += 1
     
-    def _manage_position(self, bar: pd.Series) -> Optional[Dict[str, Any]]:
+    def _exit_result(self, event: int) -> Dict[str, Any]:
         """
-        Manage open position.
+        Build the exit result for a stop loss or TP1 event of the open trade.
+        
+        Args:
+            event: EVENT_STOP_LOSS or EVENT_TP1 from the session kernel
         
-        Returns exit result if trade should close, None otherwise.
+        Returns:
+            Exit result dictionary
         """
-        if self.current_trade is None:
-            return None
-        
-        # Check stop loss
-        if self.bias == "LONG":
-            if bar['low'] <= self.current_trade['stop_loss']:
-                pnl_points = self.current_trade['stop_loss'] - self.current_trade['entry_price']
-                pnl_r = -1.0
-                return {
-                    'reason': 'STOP_LOSS',
-                    'exit_price': self.current_trade['stop_loss'],
-                    'pnl_points': pnl_points,
-                    'pnl_r': pnl_r,
-                    'win': False
-                }
-            
-            # Check TP1
-            if not self.current_trade['tp1_hit'] and bar['high'] >= self.current_trade['tp1_price']:
-                self.current_trade['tp1_hit'] = True
-                # In production, partial exit here
-            
-            # Check if TP1 hit and can trail
-            if self.current_trade['tp1_hit'] and bar['high'] >= self.current_trade['tp1_price']:
-                pnl_points = self.current_trade['tp1_price'] - self.current_trade['entry_price']
-                pnl_r = Config.get('risk', 'tp1_r')
-                return {
-                    'reason': 'TP1',
-                    'exit_price': self.current_trade['tp1_price'],
-                    'pnl_points': pnl_points,
-                    'pnl_r': pnl_r,
-                    'win': True
-                }
-        
-        else:  # SHORT
-            if bar['high'] >= self.current_trade['stop_loss']:
-                pnl_points = self.current_trade['entry_price'] - self.current_trade['stop_loss']
-                pnl_r = -1.0
-                return {
-                    'reason': 'STOP_LOSS',
-                    'exit_price': self.current_trade['stop_loss'],
-                    'pnl_points': pnl_points,
-                    'pnl_r': pnl_r,
-                    'win': False
-                }
-            
-            if not self.current_trade['tp1_hit'] and bar['low'] <= self.current_trade['tp1_price']:
-                self.current_trade['tp1_hit'] = True
-            
-            if self.current_trade['tp1_hit'] and bar['low'] <= self.current_trade['tp1_price']:
-                pnl_points = self.current_trade['entry_price'] - self.current_trade['tp1_price']
-                pnl_r = Config.get('risk', 'tp1_r')
-                return {
-                    'reason': 'TP1',
-                    'exit_price': self.current_trade['tp1_price'],
-                    'pnl_points': pnl_points,
-                    'pnl_r': pnl_r,
-                    'win': True
-                }
-        
-        return None
+        if event == EVENT_STOP_LOSS:
+            reason = 'STOP_LOSS'
+            exit_price = self.current_trade['stop_loss']
+            pnl_r = -1.0
+        else:
+            self.current_trade['tp1_hit'] = True
+            reason = 'TP1'
+            exit_price = self.current_trade['tp1_price']
+            pnl_r = self.tp1_r
+        
+        pnl_points = self.bias_sign * (exit_price - self.current_trade['entry_price'])
+        
+        return {
+            'reason': reason,
+            'exit_price': exit_price,
+            'pnl_points': pnl_points,
+            'pnl_r': pnl_r,
+            'win': event == EVENT_TP1
+        }
     
     def _log_no_trade(self, reason: str, details: str) -> None:
-        """Log a rejected setup."""
+        """
+        Log a rejected setup.
+        
+        Args:
+            reason: Rejection code (a key of _NO_TRADE_REASONS)
+            details: Human-readable reason
+        """
         no_trade = NoTradeLog(
-            timestamp=datetime.now(),
+            timestamp_ns=time.time_ns(),
             instrument="NQ",
-            reason=reason,
-            details=details,
+            rejection_reason=_NO_TRADE_REASONS[reason],
+            state_at_rejection=self.state_machine.current_state,
             midnight_open=self.midnight_open,
+            current_price=np.nan,  # Not tracked at the rejection points
             adr=self.adr,
-            bias=self.bias
+            details=details
         )
         
         self.logger.log_no_trade(no_trade)
@@ -545,22 +791,64 @@ class StrategyEngine:
     def _log_shadow_trade(
         self,
         blocked_by: str,
-        smt_result: Dict[str, Any],
-        isi_result: Dict[str, Any]
+        smt_result: SMTResult,
+        isi_result: ISIResult
     ) -> None:
         """Log a shadow trade (one-filter-failed)."""
-        print("   👻 Logging as SHADOW trade (one filter failed)")
+        self._say("   👻 Logging as SHADOW trade (one filter failed)")
         # Shadow trade logging implementation
         # Would simulate entry/exit with same logic
         pass
     
-    def _log_trade(self, exit_bar: pd.Series, exit_result: Dict[str, Any]) -> None:
+    def _log_trade(self, exit_time: datetime, exit_result: Dict[str, Any]) -> None:
         """Log a completed trade."""
         # Trade logging implementation
-        print(f"   📝 Trade logged: {exit_result['reason']}")
+        self._say("   📝 Trade logged: {}", exit_result['reason'])
         pass
 
 
+# Data of the current run_backtest worker process (see _init_backtest_worker)
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_backtest_worker(
+    nq_data: pd.DataFrame,
+    es_data: pd.DataFrame,
+    session_inputs: Dict[datetime, _SessionInputs]
+) -> None:
+    """Keep the backtest data in the worker process (pickled once per worker)."""
+    _worker_state['nq_data'] = nq_data
+    _worker_state['es_data'] = es_data
+    _worker_state['session_inputs'] = session_inputs
+
+
+def _run_session_worker(session_date: datetime) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Run one session of run_backtest on a fresh quiet engine.
+    
+    Returns:
+        Tuple of (session result, formatted session messages)
+    """
+    # Engine and logger banners are not part of the session output
+    with redirect_stdout(io.StringIO()):
+        engine = StrategyEngine(verbose=False)
+    engine.output_log.clear()
+    
+    engine._session_data = _worker_state['nq_data']
+    engine._session_inputs = _worker_state['session_inputs']
+    
+    result = engine.run_session(
+        _worker_state['nq_data'],
+        _worker_state['es_data'],
+        session_date
+    )
+    messages = [
+        message.format(*args) if args else message
+        for message, args in engine.output_log
+    ]
+    return result, messages
+
+
 # Example usage
 if __name__ == "__main__":
     print("Strategy engine module loaded successfully")
@@ -0,0 +1,166 @@
+"""
+Strategy Kernels
+================
+Array-level bar loop for StrategyEngine.run_session.
+
+The kernel walks the trading window bars through the numeric states of a
+session (deviation scan, reclaim scan, open position) and returns at the
+first bar that needs the engine's attention. run_session stays the
+orchestrator: it handles ISI/SMT, state machine transitions and logging in
+Python, then resumes the kernel from the next bar. Kernels are
+JIT-compiled with numba when it is installed (see utils/_njit.py) and run
+as plain Python otherwise.
+
+Conventions:
+- timestamps are int64 nanoseconds since the Unix epoch (UTC)
+- arrays must be in time order
+- bias_sign is +1.0 for LONG and -1.0 for SHORT; multiplying a price
+  difference by it turns every LONG/SHORT pair of checks into one
+"""
+
+import numpy as np
+
+from strategy_logging.schemas import TradingState
+from utils._njit import njit
+
+
+# Bar loop states passed to session_core_loop (the TradingState indices, so
+# StateMachine.current_state_int can be passed straight through)
+STATE_AWAITING_DEVIATION = TradingState.AWAITING_DEVIATION.index
+STATE_AWAITING_RECLAIM = TradingState.AWAITING_RECLAIM.index
+STATE_IN_TRADE = TradingState.IN_TRADE.index
+
+# Open trade record (StrategyEngine.current_trade); entry_time is int64 ns
+TRADE_DTYPE = np.dtype([
+    ('entry_time', 'i8'),
+    ('entry_price', 'f8'),
+    ('stop_loss', 'f8'),
+    ('tp1_price', 'f8'),
+    ('risk_r', 'f8'),
+    ('position_size', 'f8'),
+    ('tp1_hit', '?'),
+])
+
+# Event codes returned by session_core_loop
+EVENT_NONE = 0
+EVENT_DEVIATION = 1
+EVENT_RECLAIM = 2
+EVENT_RECLAIM_TIMEOUT = 3
+EVENT_STOP_LOSS = 4
+EVENT_TP1 = 5
+
+
+@njit(cache=True)
+def session_core_loop(
+    open_,
+    high,
+    low,
+    close,
+    body_ratio,
+    times_ns,
+    state,
+    start,
+    midnight_open,
+    bias_sign,
+    deviation_lookback,
+    deviation_time_ns,
+    reclaim_time_limit_ns,
+    reclaim_body_ratio,
+    stop_loss,
+    tp1_price
+):
+    """
+    Run the session bar loop from bar start until the next event.
+
+    Per state:
+    - AWAITING_DEVIATION: the bar sweeps the midnight open (low below it
+      for longs, high above it for shorts); the deviation extreme is the
+      lowest low (highest high) of the sweep bar and up to
+      deviation_lookback bars before it
+    - AWAITING_RECLAIM: more than reclaim_time_limit_ns have passed
+      since the deviation (timeout), else the bar closes back across the
+      midnight open in the bias direction with a body of at least
+      reclaim_body_ratio of its range
+    - IN_TRADE: the bar touches the stop loss, else TP1
+
+    Args:
+        open_, high, low, close: Trading window bars
+        body_ratio: |close - open| / (high - low) per bar, NaN where the
+            bar has no range (precomputed as one array operation)
+        times_ns: Bar timestamps (int64 ns)
+        state: One of the STATE_* codes
+        start: First bar to examine
+        midnight_open: Midnight open price
+        bias_sign: +1.0 for LONG bias, -1.0 for SHORT
+        deviation_lookback: Bars before the sweep bar searched for the extreme
+        deviation_time_ns: Deviation bar timestamp (AWAITING_RECLAIM only)
+        reclaim_time_limit_ns: Reclaim time limit (int64 ns)
+        reclaim_body_ratio: Minimum body / range of the reclaim bar
+        stop_loss: Stop loss price (IN_TRADE only)
+        tp1_price: TP1 price (IN_TRADE only)
+
+    Returns:
+        Tuple of (event, bar_index, deviation_extreme); event is one of the
+        EVENT_* codes, EVENT_NONE (with bar_index == len(close)) if the
+        bars ran out. deviation_extreme is NaN except for EVENT_DEVIATION.
+    """
+    n = len(close)
+
+    # Bar extreme moving against the bias (sweep / stop side) and with it
+    if bias_sign > 0:
+        adverse = low
+        favorable = high
+    else:
+        adverse = high
+        favorable = low
+
+    # Running extreme of the adverse side over the lookback window: a
+    # monotonic deque of bar indices (head..tail) whose signed values
+    # increase, so the head is always the window extreme. NaN bars are
+    # skipped, as np.nanmin / np.nanmax would.
+    window = np.empty(n, dtype=np.int64)
+    head = 0
+    tail = 0
+
+    if state == STATE_AWAITING_DEVIATION:
+        for j in range(max(0, start - deviation_lookback), start):
+            value = bias_sign * adverse[j]
+            if value == value:
+                while tail > head and bias_sign * adverse[window[tail - 1]] >= value:
+                    tail -= 1
+                window[tail] = j
+                tail += 1
+
+    for i in range(start, n):
+        if state == STATE_AWAITING_DEVIATION:
+            value = bias_sign * adverse[i]
+            if value == value:
+                while tail > head and bias_sign * adverse[window[tail - 1]] >= value:
+                    tail -= 1
+                window[tail] = i
+                tail += 1
+            while tail > head and window[head] < i - deviation_lookback:
+                head += 1
+
+            if bias_sign * (midnight_open - adverse[i]) > 0:
+                return EVENT_DEVIATION, i, adverse[window[head]]
+
+        elif state == STATE_AWAITING_RECLAIM:
+            if times_ns[i] - deviation_time_ns > reclaim_time_limit_ns:
+                return EVENT_RECLAIM_TIMEOUT, i, np.nan
+
+            # Close back across the midnight open with a body in the bias direction
+            if (
+                bias_sign * (close[i] - midnight_open) > 0
+                and bias_sign * (close[i] - open_[i]) > 0
+                and body_ratio[i] >= reclaim_body_ratio
+            ):
+                return EVENT_RECLAIM, i, np.nan
+
+        elif state == STATE_IN_TRADE:
+            if bias_sign * (adverse[i] - stop_loss) <= 0:
+                return EVENT_STOP_LOSS, i, np.nan
+            if bias_sign * (favorable[i] - tp1_price) >= 0:
+                return EVENT_TP1, i, np.nan
+
+    return EVENT_NONE, n, np.nan
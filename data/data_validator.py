@@ -7,8 +7,9 @@ Detects gaps, duplicates, missing bars, and timezone issues.
 Critical for production backtesting - bad data = false confidence.
 """
 
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import List, Dict, Tuple, Optional
 import pytz
 
@@ -27,6 +28,10 @@ class DataValidator:
         """
         self.expected_bar_size = expected_bar_size
         self.bar_size_seconds = self._parse_bar_size(expected_bar_size)
+        
+        # Gap scan thresholds as int64 nanoseconds (1 second tolerance)
+        self._expected_ns = self.bar_size_seconds * 1_000_000_000
+        self._tol_ns = 1_000_000_000
     
     def _parse_bar_size(self, bar_size: str) -> int:
         """Convert bar size string to seconds."""
@@ -110,25 +115,24 @@ class DataValidator:
         Returns:
             List of (gap_start, gap_end, missing_bars)
         """
-        gaps = []
-        
-        for i in range(1, len(df)):
-            prev_time = df.index[i-1]
-            curr_time = df.index[i]
-            
-            expected_diff = timedelta(seconds=self.bar_size_seconds)
-            actual_diff = curr_time - prev_time
-            
-            # Allow small tolerance (1 second)
-            if actual_diff > expected_diff + timedelta(seconds=1):
-                missing_bars = int(actual_diff.total_seconds() / self.bar_size_seconds) - 1
-                
-                # Only report gaps during regular trading hours
-                # (futures trade 23+ hours, so overnight gaps are normal)
-                if missing_bars >= 1 and missing_bars < 100:  # Ignore weekend gaps
-                    gaps.append((prev_time, curr_time, missing_bars))
-        
-        return gaps
+        # Bar-to-bar time differences in one pass over the int64 timestamps
+        diffs = np.diff(df.index.as_unit('ns').asi8)
+        missing = diffs // self._expected_ns - 1
+        
+        # Only report gaps during regular trading hours
+        # (futures trade 23+ hours, so overnight gaps are normal)
+        gap_mask = (
+            (diffs > self._expected_ns + self._tol_ns)
+            & (missing >= 1)
+            & (missing < 100)  # Ignore weekend gaps
+        )
+        positions = np.flatnonzero(gap_mask)
+        
+        return list(zip(
+            df.index[positions],
+            df.index[positions + 1],
+            missing[positions].tolist()
+        ))
     
     def _check_ohlc_logic(self, df: pd.DataFrame) -> List[Tuple[datetime, str]]:
         """
@@ -139,40 +143,21 @@ class DataValidator:
         - low <= open, close, high
         - All prices > 0
         """
-        errors = []
-        
-        # Check high is highest
-        invalid_high = df[
-            (df['high'] < df['open']) |
-            (df['high'] < df['close']) |
-            (df['high'] < df['low'])
+        prices = df[['open', 'high', 'low', 'close']].to_numpy()
+        o, h, l, c = prices.T
+        
+        # One boolean array per rule, over the columns read once
+        rules = (
+            ((h < o) | (h < c) | (h < l), "High is not highest price"),
+            ((l > o) | (l > c) | (l > h), "Low is not lowest price"),
+            ((prices <= 0).any(axis=1), "Non-positive price detected")
+        )
+        
+        return [
+            (timestamp, message)
+            for invalid, message in rules
+            for timestamp in df.index[np.flatnonzero(invalid)]
         ]
-        
-        for idx in invalid_high.index:
-            errors.append((idx, "High is not highest price"))
-        
-        # Check low is lowest
-        invalid_low = df[
-            (df['low'] > df['open']) |
-            (df['low'] > df['close']) |
-            (df['low'] > df['high'])
-        ]
-        
-        for idx in invalid_low.index:
-            errors.append((idx, "Low is not lowest price"))
-        
-        # Check positive prices
-        invalid_prices = df[
-            (df['open'] <= 0) |
-            (df['high'] <= 0) |
-            (df['low'] <= 0) |
-            (df['close'] <= 0)
-        ]
-        
-        for idx in invalid_prices.index:
-            errors.append((idx, "Non-positive price detected"))
-        
-        return errors
     
     def _check_zero_volume(self, df: pd.DataFrame) -> int:
         """Count bars with zero volume."""
@@ -183,14 +168,11 @@ class DataValidator:
         if not isinstance(df.index, pd.DatetimeIndex):
             return {'consistent': False, 'message': 'Index is not DatetimeIndex'}
         
+        # A DatetimeIndex carries one timezone for all its timestamps
+        # (mixed timezones cannot be stored in it), so no per-row scan
         if df.index.tz is None:
             return {'consistent': False, 'message': 'Timestamps are timezone-naive'}
         
-        # Check all timestamps have same timezone
-        tz_set = set([t.tzinfo for t in df.index])
-        if len(tz_set) > 1:
-            return {'consistent': False, 'message': f'Multiple timezones detected: {tz_set}'}
-        
         return {'consistent': True, 'message': f'All timestamps in {df.index.tz}'}
     
     def _check_price_anomalies(self, df: pd.DataFrame) -> List[Tuple[datetime, str, float]]:
@@ -20,7 +20,7 @@ Limitations:
 import yfinance as yf
 import pandas as pd
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, List, Optional
 import pytz
 
 
@@ -88,6 +88,64 @@ class YahooFinanceLoader:
         
         return df
     
+    def fetch_historical_bars_batch(
+        self,
+        symbols: List[str],
+        period: str = "5d",
+        interval: str = "1m"
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch historical bars for several instruments in one request.
+        
+        Args:
+            symbols: List of symbols ("NQ", "ES", "YM", "RTY")
+            period: Time period ("1d", "5d", "1mo", "3mo", "1y", "2y")
+            interval: Bar size ("1m", "5m", "15m", "1h", "1d")
+        
+        Returns:
+            Dict of symbol -> DataFrame with OHLCV data (EST timezone);
+            symbols without data map to an empty DataFrame
+        """
+        yahoo_symbols = {symbol: self.SYMBOL_MAP.get(symbol, symbol) for symbol in symbols}
+        
+        print(f"📥 Fetching {', '.join(symbols)} data from Yahoo Finance (batch)...")
+        print(f"   Period: {period}, Interval: {interval}")
+        
+        # One download for all tickers, columns grouped per ticker
+        raw = yf.download(
+            tickers=" ".join(yahoo_symbols.values()),
+            period=period,
+            interval=interval,
+            group_by='ticker',
+            auto_adjust=True,
+            progress=False
+        )
+        
+        results = {}
+        for symbol, yahoo_symbol in yahoo_symbols.items():
+            if isinstance(raw.columns, pd.MultiIndex):
+                if yahoo_symbol in raw.columns.get_level_values(0):
+                    df = raw[yahoo_symbol].copy()
+                else:
+                    df = pd.DataFrame()
+            else:
+                df = raw.copy()
+            
+            # Rows only present for the other tickers are all-NaN here
+            df = df.dropna(how='all')
+            
+            if df.empty:
+                print(f"⚠️  No data returned for {symbol}")
+                results[symbol] = df
+                continue
+            
+            df = self._process_dataframe(df, symbol)
+            
+            print(f"✅ Fetched {len(df)} bars for {symbol}")
+            results[symbol] = df
+        
+        return results
+    
     def fetch_date_range(
         self,
         symbol: str,
@@ -12,7 +12,20 @@ from enum import Enum
 
 
 class TradingState(Enum):
-    """Trading state machine states."""
+    """
+    Trading state machine states.
+    
+    Values are the logged state names. Each member also has an integer
+    index (declaration order, 0-7) so the state machine can use plain
+    table lookups instead of hashing the enum.
+    """
+    
+    def __new__(cls, value):
+        member = object.__new__(cls)
+        member._value_ = value
+        member.index = len(cls.__members__)
+        return member
+    
     IDLE = "IDLE"
     SESSION_ACTIVE = "SESSION_ACTIVE"
     ONS_INVALID = "ONS_INVALID"
@@ -214,9 +227,12 @@ class NoTradeLog:
     """
     No-trade log - tracks when conditions were evaluated but no trade taken.
     Critical for understanding filter effectiveness.
+    
+    The timestamp is kept as time.time_ns() and only turned into a
+    datetime when the record is read or written.
     """
-    # Timestamp
-    timestamp: datetime
+    # Timestamp (epoch nanoseconds, from time.time_ns())
+    timestamp_ns: int
     
     # Instrument
     instrument: str
@@ -244,10 +260,19 @@ class NoTradeLog:
     overnight_range: Optional[float] = None
     adr: Optional[float] = None
     
+    # Human-readable reason
+    details: Optional[str] = None
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Local wall-clock time of the record (like datetime.now())."""
+        seconds, nanos = divmod(self.timestamp_ns, 1_000_000_000)
+        return datetime.fromtimestamp(seconds).replace(microsecond=nanos // 1000)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for CSV writing."""
-        d = asdict(self)
-        d['timestamp'] = self.timestamp.isoformat()
+        d = {'timestamp': self.timestamp.isoformat(), **asdict(self)}
+        del d['timestamp_ns']
         d['rejection_reason'] = self.rejection_reason.value
         d['state_at_rejection'] = self.state_at_rejection.value
         return d
@@ -77,6 +77,59 @@ class TestSprint1(unittest.TestCase):
         except Exception as e:
             self.fail(f"Time utils test FAILED: {e}")
 
+    def test_trading_window_mask(self):
+        """Test 2b: Vectorized trading window mask matches the scalar check"""
+        import pandas as pd
+        from utils.time_utils import TimeUtils
+        
+        # Spans the EST/EDT switch on 2025-03-09
+        index = pd.date_range('2025-03-07 13:00', '2025-03-11 16:00', freq='7min', tz='UTC')
+        
+        mask = TimeUtils.trading_window_mask(index, "09:30", "10:30")
+        expected = [TimeUtils.is_in_trading_window(ts.to_pydatetime(), "09:30", "10:30") for ts in index]
+        
+        self.assertEqual(mask.tolist(), expected)
+        self.assertTrue(mask.any())
+        
+        # Naive timestamps are treated as UTC
+        naive_mask = TimeUtils.trading_window_mask(index.tz_localize(None), "09:30", "10:30")
+        self.assertEqual(naive_mask.tolist(), expected)
+
+    def test_data_validator_gaps(self):
+        """Test 2c: Gap scan reports short gaps and skips weekend-sized ones"""
+        import pandas as pd
+        from data.data_validator import DataValidator
+        
+        index = pd.date_range('2025-01-20 09:30', periods=300, freq='1min', tz='America/New_York')
+        # 3 bars missing after 09:39, a 150-bar gap after 10:59
+        index = index[:10].append(index[13:90]).append(index[240:])
+        
+        gaps = DataValidator(expected_bar_size='1min')._check_gaps(pd.DataFrame(index=index))
+        
+        self.assertEqual(gaps, [(index[9], index[10], 3)])
+        self.assertIsInstance(gaps[0][2], int)
+
+    def test_data_validator_ohlc_logic(self):
+        """Test 2d: OHLC rule violations, grouped by rule in time order"""
+        import pandas as pd
+        from data.data_validator import DataValidator
+        
+        index = pd.date_range('2025-01-20 09:30', periods=4, freq='1min', tz='America/New_York')
+        df = pd.DataFrame({
+            'open': [100.0, 100.0, 100.0, 100.0],
+            'high': [101.0, 99.0, 101.0, 101.0],
+            'low': [99.0, 98.0, 100.5, -1.0],
+            'close': [100.5, 98.5, 100.2, 100.0]
+        }, index=index)
+        
+        errors = DataValidator()._check_ohlc_logic(df)
+        
+        self.assertEqual(errors, [
+            (index[1], "High is not highest price"),
+            (index[2], "Low is not lowest price"),
+            (index[3], "Non-positive price detected")
+        ])
+
     def test_logging_system(self):
         """Test 3: Logging System"""
         try:
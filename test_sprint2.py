@@ -210,6 +210,302 @@ class TestSprint2(unittest.TestCase):
             self.fail(f"SMT test FAILED: {e}")
 
 
+class TestIndicatorKernels(unittest.TestCase):
+    """Array kernels vs pandas reference on synthetic data (no network)."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Build 25 days of synthetic 1-minute bars in EST."""
+        import numpy as np
+
+        rng = np.random.default_rng(7)
+        index = pd.date_range(
+            '2025-01-01', periods=25 * 1440, freq='1min', tz='UTC'
+        ).tz_convert('America/New_York')
+        close = 20000 + np.cumsum(rng.normal(0, 2.0, len(index)))
+        cls.df = pd.DataFrame({
+            'open': close,
+            'high': close + rng.uniform(0, 3, len(index)),
+            'low': close - rng.uniform(0, 3, len(index)),
+            'close': close,
+            'volume': 1000.0,
+        }, index=index)
+        cls.as_of = pd.Timestamp('2025-01-24 09:30', tz='America/New_York')
+
+    def test_midnight_open_matches_pandas(self):
+        """MO kernel returns the open of the 00:00 EST bar"""
+        from core.indicators import MidnightOpenCalculator
+
+        mo = MidnightOpenCalculator().calculate(self.df, self.as_of)
+        expected = self.df.loc[self.as_of.normalize(), 'open']
+
+        self.assertIsInstance(mo, float)
+        self.assertEqual(mo, expected)
+
+    def test_adr_matches_resample(self):
+        """ADR kernel matches resample('1D') reference"""
+        from core.indicators import ADRCalculator
+
+        daily = self.df.resample('1D').agg({'high': 'max', 'low': 'min'}).dropna()
+        daily = daily[daily.index < self.as_of].tail(20)
+        expected = (daily['high'] - daily['low']).mean()
+
+        adr = ADRCalculator(lookback_days=20).calculate(self.df, self.as_of)
+
+        self.assertIsInstance(adr, float)
+        self.assertAlmostEqual(adr, expected, places=9)
+
+        with self.assertRaises(ValueError):
+            ADRCalculator(lookback_days=40).calculate(self.df, self.as_of)
+
+    def test_ons_range_matches_mask(self):
+        """ONS kernel matches boolean-mask reference"""
+        from core.indicators import ONSFilter
+
+        start = pd.Timestamp('2025-01-23 16:00', tz='America/New_York')
+        end = self.as_of.normalize()
+        ons = self.df[(self.df.index >= start) & (self.df.index <= end)]
+
+        ons_high, ons_low, ons_range = ONSFilter().calculate_ons_range(self.df, self.as_of)
+
+        self.assertEqual(ons_high, ons['high'].max())
+        self.assertEqual(ons_low, ons['low'].min())
+        self.assertAlmostEqual(ons_range, ons['high'].max() - ons['low'].min())
+
+    def test_adr_polars_engine_matches_pandas(self):
+        """Polars ADR engine matches the default engine"""
+        try:
+            import polars  # noqa: F401
+        except ImportError:
+            self.skipTest("polars not installed")
+        from core.indicators import ADRCalculator
+
+        expected = ADRCalculator(lookback_days=20).calculate(self.df, self.as_of)
+        adr = ADRCalculator(lookback_days=20, engine='polars').calculate(self.df, self.as_of)
+
+        self.assertAlmostEqual(adr, expected, places=9)
+
+        with self.assertRaises(ValueError):
+            ADRCalculator(lookback_days=40, engine='polars').calculate(self.df, self.as_of)
+        with self.assertRaises(ValueError):
+            ADRCalculator(engine='spark')
+
+    def test_adr_incremental_matches_fresh(self):
+        """ADR daily-bar cache extends with appended bars only"""
+        from core.indicators import ADRCalculator
+
+        high = self.df['high'].to_numpy()
+        low = self.df['low'].to_numpy()
+        timestamps = self.df.index.as_unit('ns').asi8
+
+        cached = ADRCalculator(lookback_days=20)
+        for n_bars in (21 * 1440 + 7, 22 * 1440, 23 * 1440 + 300, len(timestamps)):
+            as_of = self.df.index[n_bars - 1]
+            self.assertEqual(
+                cached.calculate_arrays(high[:n_bars], low[:n_bars], timestamps[:n_bars], as_of),
+                ADRCalculator(lookback_days=20).calculate_arrays(
+                    high[:n_bars], low[:n_bars], timestamps[:n_bars], as_of
+                )
+            )
+            self.assertEqual(cached._daily_cache['n_bars'], n_bars)
+
+    def test_atr_matches_pandas(self):
+        """ATR kernel matches the concat/rolling pandas reference"""
+        from core.indicators import ISICalculator, SMTDetector
+
+        high, low, close = self.df['high'], self.df['low'], self.df['close']
+        tr = pd.concat([
+            high - low,
+            abs(high - close.shift()),
+            abs(low - close.shift()),
+        ], axis=1).max(axis=1)
+        expected = tr.rolling(window=14).mean()
+
+        atr = ISICalculator().calculate_atr(self.df, period=14)
+        pd.testing.assert_series_equal(atr, expected, check_names=False)
+
+        # SMT reuses the ATR computed for ISI while the frame is unchanged
+        detector = SMTDetector(atr_period=14)
+        self.assertIs(detector._calculate_atr(self.df), atr)
+
+    def test_rolling_mean_bottleneck_fallback(self):
+        """Without compiled kernels the ATR uses bottleneck.move_mean"""
+        from unittest.mock import patch
+        import numpy as np
+        import core.indicators as indicators
+
+        if indicators.bn is None:
+            self.skipTest("bottleneck not installed")
+
+        values = self.df['close'].diff().abs().to_numpy(copy=True)
+        values[100] = np.nan
+        expected = pd.Series(values).rolling(14).mean().to_numpy()
+
+        with patch.object(indicators, '_COMPILED_KERNELS', False):
+            result = indicators._rolling_mean(values, 14)
+        np.testing.assert_allclose(result, expected, rtol=1e-9)
+
+    def test_rolling_mean_matches_pandas_on_long_series(self):
+        """Running-sum rolling mean stays identical to pandas (no drift)"""
+        import numpy as np
+        from core.indicator_kernels import rolling_mean_loop
+
+        rng = np.random.default_rng(11)
+        values = np.abs(rng.normal(3, 2, 200_000)) * 10 ** rng.uniform(-3, 3, 200_000)
+        values[rng.integers(0, len(values), 20)] = np.nan
+        values[1000:1100] = 2.5
+
+        for period in (1, 14, 500):
+            expected = pd.Series(values).rolling(window=period).mean().to_numpy()
+            np.testing.assert_array_equal(rolling_mean_loop(values, period), expected)
+
+    def test_isi_matches_pandas(self):
+        """Fused ISI kernel matches the Series arithmetic"""
+        from core.indicators import ISICalculator
+
+        start_idx, end_idx = 600, 611
+        move = self.df.iloc[start_idx:end_idx + 1]
+        ranges = (move['high'] - move['low']).replace(0, float('nan'))
+        bodies = abs(move['close'] - move['open'])
+        body_top = move[['open', 'close']].max(axis=1)
+        body_bottom = move[['open', 'close']].min(axis=1)
+        wicks = (move['high'] - body_top) + (body_bottom - move['low'])
+
+        isi_calc = ISICalculator()
+        atr = isi_calc.calculate_atr(self.df, period=14).iloc[end_idx]
+        result = isi_calc.calculate(self.df, start_idx, end_idx)
+
+        self.assertAlmostEqual(result['atr'], atr, places=9)
+        self.assertAlmostEqual(result['avg_body_ratio'], (bodies / ranges).mean(), places=12)
+        self.assertAlmostEqual(result['avg_wick_ratio'], (wicks / ranges).mean(), places=12)
+        self.assertAlmostEqual(
+            result['isi'],
+            bodies.mean() / atr * len(move) * (1 - (wicks / ranges).mean()),
+            places=9
+        )
+
+    def test_isi_float32_precision_close_to_float64(self):
+        """precision='f32' matches f64 on tick-aligned prices"""
+        from core.indicators import ISICalculator, SMTDetector
+
+        # 0.25 ticks are exact in float32; only the arithmetic rounds
+        df = (self.df * 4).round() / 4
+        expected = ISICalculator().calculate(df, 600, 611)
+        result = ISICalculator(precision='f32').calculate(df, 600, 611)
+
+        for key in ('isi', 'atr', 'avg_body_ratio', 'avg_wick_ratio'):
+            self.assertIsInstance(result[key], float)
+            self.assertAlmostEqual(
+                result[key], expected[key], delta=1e-6 * max(abs(expected[key]), 1.0)
+            )
+        self.assertEqual(result['assessment'], expected['assessment'])
+
+        with self.assertRaises(ValueError):
+            SMTDetector(precision='f16')
+
+    def test_sweep_kernels_match_nanargmin(self):
+        """Direction kernels pick the first NaN-skipping extreme bar"""
+        from core.indicators import SMTDetector
+
+        df = self.df.iloc[:600].copy()
+        df.iloc[[10, 20], df.columns.get_loc('low')] = float('nan')
+        detector = SMTDetector()
+
+        for direction, column, key, find in (
+            ('below', 'low', 'sweep_low', df['low'].idxmin),
+            ('above', 'high', 'sweep_high', df['high'].idxmax),
+        ):
+            extreme = df[column].min() if direction == 'below' else df[column].max()
+            level = extreme + (1.0 if direction == 'below' else -1.0)
+            result = detector.detect_sweep(df, level, direction)
+            self.assertTrue(result['swept'])
+            self.assertEqual(result[key], extreme)
+            self.assertEqual(result['sweep_time'], find())
+
+            missed = detector.detect_sweep(df, extreme, direction)
+            self.assertFalse(missed['swept'])
+            self.assertIsNone(missed[key])
+
+    def test_results_are_named_tuples_with_dict_access(self):
+        """Indicator results expose attributes and the v1.0 dict keys"""
+        from core.indicators import ISICalculator, SMTDetector, ISIResult, SweepResult
+
+        isi = ISICalculator().calculate(self.df, 600, 611)
+        self.assertIsInstance(isi, ISIResult)
+        self.assertEqual(isi['isi'], isi.isi)
+        self.assertIn('assessment', isi)
+
+        level = self.df['low'].iloc[:600].min() + 1.0
+        smt = SMTDetector().detect_divergence(
+            self.df.iloc[:600], self.df.iloc[:600], level, level - 10_000.0
+        )
+        self.assertIsInstance(smt.instrument_a_sweep, SweepResult)
+        self.assertTrue(smt['smt_binary'])
+        self.assertEqual(
+            set(dict(smt.instrument_a_sweep)),
+            {'swept', 'sweep_depth', 'sweep_depth_norm', 'sweep_low', 'sweep_time'}
+        )
+        self.assertIsNone(smt['instrument_b_sweep'].get('sweep_low'))
+
+    def test_smt_divergence_batch_matches_single(self):
+        """Batch SMT rows match detect_divergence for each level pair"""
+        import numpy as np
+        from core.indicators import SMTDetector
+
+        nq = self.df.iloc[:900]
+        es = self.df.iloc[900:1800] - 10.0
+        detector = SMTDetector()
+
+        for direction, column in (('below', 'low'), ('above', 'high')):
+            levels_a = np.linspace(nq[column].min() - 5, nq[column].max() + 5, 12)
+            levels_b = np.linspace(es[column].max() + 5, es[column].min() - 5, 12)
+            batch = detector.detect_divergence_batch(nq, es, levels_a, levels_b, direction)
+
+            for row, level_a, level_b in zip(batch, levels_a, levels_b):
+                single = detector.detect_divergence(nq, es, level_a, level_b, direction)
+                self.assertEqual(bool(row['smt_binary']), single.smt_binary)
+                self.assertEqual(bool(row['a_swept']), single.instrument_a_sweep.swept)
+                self.assertEqual(bool(row['b_swept']), single.instrument_b_sweep.swept)
+                self.assertAlmostEqual(row['smt_degree'], single.smt_degree, places=12)
+
+    def test_ons_validate_arrays_matches_dataframe(self):
+        """validate_arrays on raw buffers matches the DataFrame path"""
+        from core.indicators import ONSFilter
+
+        ons_filter = ONSFilter()
+        expected = ons_filter.validate(self.df, self.as_of)
+        result = ons_filter.validate_arrays(
+            self.df['high'].to_numpy(),
+            self.df['low'].to_numpy(),
+            self.df.index.as_unit('ns').asi8,
+            self.as_of
+        )
+
+        self.assertEqual(result, expected)
+
+
+    def test_ons_validate_batch_matches_validate(self):
+        """validate_batch agrees with per-date validate"""
+        from core.indicators import ONSFilter
+
+        ons_filter = ONSFilter(min_ratio=0.30, max_ratio=0.70)
+        dates = [self.as_of - pd.Timedelta(days=k) for k in range(3)]
+        dates.append(pd.Timestamp('2025-01-03 09:30', tz='America/New_York'))
+
+        results = ons_filter.validate_batch(self.df, dates)
+
+        self.assertEqual(len(results), len(dates))
+        for target_date, row in zip(dates[:3], results[:3]):
+            expected = ons_filter.validate(self.df, target_date)
+            self.assertEqual(bool(row['valid']), bool(expected['valid']))
+            for key in ('ons_range', 'adr', 'ratio'):
+                self.assertEqual(row[key], expected[key])
+
+        # Too little history for the ADR: NaN and invalid instead of raising
+        self.assertFalse(results[3]['valid'])
+        self.assertTrue(pd.isna(results[3]['adr']))
+
+
 if __name__ == '__main__':
     # Run the tests
     unittest.main(verbosity=2)
\ No newline at end of file
@@ -200,6 +200,194 @@ class TestSprint3(unittest.TestCase):
             self.fail(f"Transition history test FAILED: {e}")
 
 
+    def test_can_trade_reasons(self):
+        """Test 9: can_trade reasons and max-trades precedence"""
+        sm = StateMachine()
+        sm.trades_taken_today = sm.max_trades_per_session
+        
+        expected = {
+            TradingState.IN_TRADE: (False, "Already in trade"),
+            TradingState.SESSION_LOCKED: (False, "Session locked"),
+            TradingState.ONS_INVALID: (False, "ONS filter failed"),
+            TradingState.IDLE: (False, f"Max trades reached ({sm.max_trades_per_session})"),
+            TradingState.AWAITING_SMT: (False, f"Max trades reached ({sm.max_trades_per_session})"),
+        }
+        for state, result in expected.items():
+            sm.current_state = state
+            self.assertEqual(sm.can_trade(), result)
+        
+        sm.trades_taken_today = 0
+        sm.current_state = TradingState.SESSION_ACTIVE
+        self.assertEqual(sm.can_trade(), (False, "Not in tradeable state (current: SESSION_ACTIVE)"))
+        sm.current_state = TradingState.AWAITING_RECLAIM
+        self.assertEqual(sm.can_trade(), (True, None))
+
+    def test_state_history_is_bounded(self):
+        """Test 10: state_history keeps only the most recent transitions"""
+        sm = StateMachine(history_limit=4)
+        for day in range(3):
+            sm.transition_to(TradingState.SESSION_ACTIVE, f"Day {day}")
+            sm.transition_to(TradingState.ONS_INVALID, f"Day {day}")
+            sm.transition_to(TradingState.IDLE, f"Day {day}")
+        
+        self.assertEqual(len(sm.state_history), 4)
+        history = sm.get_transition_history()
+        self.assertEqual(len(history), 4)
+        self.assertEqual(history[-1]['to'], 'IDLE')
+        self.assertEqual(history[0]['reason'], 'Day 1')
+
+    def test_rebind_switches_between_contexts(self):
+        """Test 11: One machine stepping two models via rebind"""
+        sm = StateMachine()
+        sm.transition_to(TradingState.SESSION_ACTIVE, "Model A")
+        
+        ctx_b = StateMachine.new_context()
+        ctx_a = sm.rebind(ctx_b)
+        self.assertEqual(sm.current_state, TradingState.IDLE)
+        self.assertEqual(sm.get_transition_history(), [])
+        sm.transition_to(TradingState.SESSION_ACTIVE, "Model B")
+        sm.transition_to(TradingState.ONS_INVALID, "Model B")
+        
+        self.assertIs(sm.rebind(ctx_a), ctx_b)
+        self.assertEqual(sm.current_state, TradingState.SESSION_ACTIVE)
+        self.assertEqual([t['reason'] for t in sm.get_transition_history()], ["Model A"])
+        self.assertEqual(ctx_b.current_state, TradingState.ONS_INVALID)
+        self.assertEqual(len(ctx_b.state_history), 2)
+
+    def test_merged_context(self):
+        """Test 12: merged_context covers this session's transitions, latest first"""
+        sm = StateMachine()
+        sm.transition_to(TradingState.SESSION_ACTIVE, "Test", {'ons_range': 100.0})
+        sm.transition_to(TradingState.ONS_INVALID, "Test", {'ons_range': 50.0, 'adr': 200.0})
+        
+        self.assertEqual(dict(sm.merged_context), {'ons_range': 50.0, 'adr': 200.0})
+        
+        sm.reset_for_new_session(datetime.now())
+        self.assertEqual(dict(sm.merged_context), {})
+        sm.transition_to(TradingState.SESSION_ACTIVE, "Test", {'ons_range': 75.0})
+        self.assertEqual(dict(sm.merged_context), {'ons_range': 75.0})
+
+    def test_current_state_int_follows_state(self):
+        """Test 13: current_state_int tracks transitions, resets and rebinds"""
+        sm = StateMachine()
+        self.assertEqual(sm.current_state_int, TradingState.IDLE.index)
+        
+        sm.transition_to(TradingState.SESSION_ACTIVE, "Test")
+        sm.transition_to(TradingState.AWAITING_DEVIATION, "Test")
+        self.assertEqual(sm.current_state_int, TradingState.AWAITING_DEVIATION.index)
+        
+        ctx = sm.rebind(StateMachine.new_context())
+        self.assertEqual(sm.current_state_int, TradingState.IDLE.index)
+        sm.rebind(ctx)
+        self.assertEqual(sm.current_state_int, TradingState.AWAITING_DEVIATION.index)
+        
+        sm.reset_for_new_session(datetime.now())
+        self.assertEqual(sm.current_state_int, TradingState.IDLE.index)
+
+
+class TestShadowTrades(unittest.TestCase):
+    """Shadow trade evaluation and post-50 analysis."""
+
+    def setUp(self):
+        """Build a trade log with 50 real and a few shadow trades."""
+        import pandas as pd
+
+        shadows = [
+            ('SMT_BINARY', 2.0), ('ISI_DISPLACEMENT', -1.0), ('SMT_BINARY', -1.0),
+            (None, 1.0), ('SMT_BINARY', 1.5),
+        ]
+        self.trade_log = pd.DataFrame(
+            [{'trade_type': 'REAL', 'blocked_by_filter': None, 'pnl_r': 1.0, 'win': True}] * 50
+            + [
+                {'trade_type': 'SHADOW', 'blocked_by_filter': name, 'pnl_r': pnl, 'win': pnl > 0}
+                for name, pnl in shadows
+            ]
+        )
+
+    def test_one_gating_failure_is_shadow_trade(self):
+        """Exactly one failed gating filter with all core filters passed"""
+        from core.shadow_trades import ShadowTradeManager, FilterCheck
+
+        core = [
+            FilterCheck(name, passed=True)
+            for name in ('TIME_WINDOW', 'ONS_VALID', 'DEVIATION_DETECTED', 'RECLAIM_DETECTED')
+        ]
+        manager = ShadowTradeManager()
+
+        result = manager.evaluate_for_shadow_trade(core + [
+            FilterCheck('SMT_BINARY', passed=False),
+            FilterCheck('ISI_DISPLACEMENT', passed=True),
+        ])
+        self.assertTrue(result['is_shadow_trade'])
+        self.assertEqual(result['blocked_by'], 'SMT_BINARY')
+        self.assertEqual(result['filters_failed'], ['SMT_BINARY'])
+        self.assertEqual(len(result['filters_passed']), 5)
+        self.assertEqual(manager.shadow_trade_count, 1)
+
+        result = manager.evaluate_for_shadow_trade(core + [
+            FilterCheck('SMT_BINARY', passed=False),
+            FilterCheck('ISI_DISPLACEMENT', passed=False),
+        ])
+        self.assertFalse(result['is_shadow_trade'])
+        self.assertEqual(result['blocked_by'], ['SMT_BINARY', 'ISI_DISPLACEMENT'])
+
+        core[1] = FilterCheck('ONS_VALID', passed=False)
+        result = manager.evaluate_for_shadow_trade(core + [FilterCheck('SMT_BINARY', passed=False)])
+        self.assertFalse(result['is_shadow_trade'])
+        self.assertEqual(result['reason'], 'Core structural conditions not met')
+        self.assertEqual(manager.shadow_trade_count, 1)
+
+    def test_compare_to_real_trades(self):
+        """Real vs shadow summary stats"""
+        from core.shadow_trades import ShadowTradeAnalyzer
+
+        comparison = ShadowTradeAnalyzer(self.trade_log).compare_to_real_trades()
+
+        self.assertEqual(comparison['real_trades'],
+                         {'count': 50, 'win_rate': 1.0, 'avg_r': 1.0, 'total_r': 50.0})
+        shadow = comparison['shadow_trades']
+        self.assertEqual(shadow['count'], 5)
+        self.assertAlmostEqual(shadow['win_rate'], 0.6)
+        self.assertAlmostEqual(shadow['total_r'], 2.5)
+
+    def test_near_miss_computed_at_construction(self):
+        """FilterCheck.near_miss: within 20% of threshold, None if unknown"""
+        from core.shadow_trades import ShadowTradeManager, FilterCheck
+
+        close = FilterCheck('ISI_DISPLACEMENT', passed=False, value=1.1, threshold=1.2, distance=-0.1)
+        far = FilterCheck('ISI_DISPLACEMENT', passed=False, value=0.6, threshold=1.2, distance=-0.6)
+        unknown = FilterCheck('SMT_BINARY', passed=False, threshold=0, distance=1.0)
+
+        self.assertTrue(close.near_miss)
+        self.assertFalse(far.near_miss)
+        self.assertIsNone(unknown.near_miss)
+
+        manager = ShadowTradeManager()
+        self.assertFalse(manager._is_near_miss(far))
+        self.assertTrue(manager._is_near_miss(unknown))
+
+    def test_analyze_by_filter(self):
+        """Per-filter stats in first-seen order, rows without a filter skipped"""
+        from core.shadow_trades import ShadowTradeAnalyzer
+
+        analyzer = ShadowTradeAnalyzer(self.trade_log)
+        results = analyzer.analyze_by_filter()
+
+        self.assertEqual(list(results), ['SMT_BINARY', 'ISI_DISPLACEMENT'])
+        smt = results['SMT_BINARY']
+        self.assertEqual(smt['count'], 3)
+        self.assertAlmostEqual(smt['win_rate'], 2 / 3)
+        self.assertAlmostEqual(smt['avg_r'], 2.5 / 3)
+        self.assertEqual(smt['total_r'], 2.5)
+        self.assertEqual(smt['best_r'], 2.0)
+        self.assertEqual(smt['worst_r'], -1.0)
+
+        self.assertEqual(
+            analyzer.filter_opportunity_cost(),
+            {'SMT_BINARY': 2.5, 'ISI_DISPLACEMENT': -1.0}
+        )
+
+
 if __name__ == '__main__':
     # Run the tests
     unittest.main(verbosity=2)
\ No newline at end of file
@@ -164,6 +164,211 @@ class TestSprint4(unittest.TestCase):
             self.fail(f"Multi-session test FAILED: {e}")
 
 
+class TestStrategyKernels(unittest.TestCase):
+    """Tests for the session bar loop kernel (synthetic data, no network)."""
+
+    def setUp(self):
+        """Five 1-minute bars around a midnight open of 100."""
+        import numpy as np
+        
+        self.open_ = np.array([101.0, 100.5, 99.0, 99.2, 100.0])
+        self.high = np.array([101.5, 101.0, 99.5, 100.8, 104.0])
+        self.low = np.array([100.5, 99.0, 98.5, 99.0, 99.8])
+        self.close = np.array([100.6, 99.2, 99.3, 100.7, 103.5])
+        self.times_ns = np.arange(5, dtype=np.int64) * 60_000_000_000
+        self.body_ratio = np.abs(self.close - self.open_) / (self.high - self.low)
+
+    def _run(self, state, start, bias_sign=1.0, time_limit=2_700_000_000_000, stop=float('nan'), tp1=float('nan')):
+        """Run the kernel on the fixture bars (deviation at bar 1)."""
+        from core.strategy_kernels import session_core_loop
+        
+        event, idx, _ = session_core_loop(
+            self.open_, self.high, self.low, self.close, self.body_ratio,
+            self.times_ns, state, start, 100.0, bias_sign, 20,
+            self.times_ns[1], time_limit, 0.5, stop, tp1
+        )
+        return event, idx
+
+    def test_deviation_and_reclaim(self):
+        """Sweep of the midnight open, then a strong close back above it"""
+        from core.strategy_kernels import (
+            STATE_AWAITING_DEVIATION, STATE_AWAITING_RECLAIM,
+            EVENT_DEVIATION, EVENT_RECLAIM, EVENT_RECLAIM_TIMEOUT
+        )
+        
+        self.assertEqual(self._run(STATE_AWAITING_DEVIATION, 0), (EVENT_DEVIATION, 1))
+        self.assertEqual(self._run(STATE_AWAITING_DEVIATION, 0, bias_sign=-1.0), (EVENT_DEVIATION, 0))
+        self.assertEqual(self._run(STATE_AWAITING_RECLAIM, 2), (EVENT_RECLAIM, 3))
+        
+        # Bar 3 is 2 minutes after the deviation bar: only past a limit below 2
+        self.assertEqual(self._run(STATE_AWAITING_RECLAIM, 2, time_limit=120_000_000_000), (EVENT_RECLAIM, 3))
+        self.assertEqual(self._run(STATE_AWAITING_RECLAIM, 2, time_limit=90_000_000_000), (EVENT_RECLAIM_TIMEOUT, 3))
+
+    def test_deviation_extreme(self):
+        """Running extreme matches a nanmin / nanmax over the lookback window"""
+        import numpy as np
+        from core.strategy_kernels import (
+            session_core_loop, STATE_AWAITING_DEVIATION, EVENT_DEVIATION
+        )
+        
+        rng = np.random.default_rng(7)
+        low = 100.0 + np.cumsum(rng.normal(0, 1, 300))
+        high = low + 1.0
+        low[5::11] = np.nan
+        times_ns = np.arange(300, dtype=np.int64)
+        
+        for bias_sign, prices, reduce in ((1.0, low, np.nanmin), (-1.0, high, np.nanmax)):
+            level = reduce(prices[:250]) + bias_sign * 0.5
+            event, idx, extreme = session_core_loop(
+                low, high, low, low, np.zeros(300), times_ns,
+                STATE_AWAITING_DEVIATION, 0, level, bias_sign, 4,
+                0, 2_700_000_000_000, 0.5, np.nan, np.nan
+            )
+            self.assertEqual(event, EVENT_DEVIATION)
+            self.assertEqual(extreme, reduce(prices[max(0, idx - 4):idx + 1]))
+
+    def test_position_exits(self):
+        """Stop loss takes priority over TP1; no event when bars run out"""
+        from core.strategy_kernels import (
+            STATE_IN_TRADE, EVENT_STOP_LOSS, EVENT_TP1, EVENT_NONE
+        )
+        
+        self.assertEqual(self._run(STATE_IN_TRADE, 4, stop=98.0, tp1=103.0), (EVENT_TP1, 4))
+        self.assertEqual(self._run(STATE_IN_TRADE, 4, stop=99.9, tp1=103.0), (EVENT_STOP_LOSS, 4))
+        self.assertEqual(self._run(STATE_IN_TRADE, 4, stop=98.0, tp1=105.0), (EVENT_NONE, 5))
+        
+        # Short: stop above, target below
+        self.assertEqual(self._run(STATE_IN_TRADE, 2, bias_sign=-1.0, stop=102.0, tp1=98.5), (EVENT_TP1, 2))
+
+
+class TestStrategyEngineSynthetic(unittest.TestCase):
+    """StrategyEngine checks on synthetic 1-minute bars (no network)."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Thirty days of random-walk NQ bars."""
+        import numpy as np
+        
+        rng = np.random.default_rng(3)
+        index = pd.date_range('2025-01-01', periods=30 * 1440, freq='1min', tz='UTC')
+        close = 20000 + np.cumsum(rng.normal(0, 3, len(index)))
+        open_ = np.r_[close[0], close[:-1]]
+        cls.nq_data = pd.DataFrame({
+            'open': open_,
+            'high': np.maximum(open_, close) + rng.uniform(0, 3, len(index)),
+            'low': np.minimum(open_, close) - rng.uniform(0, 3, len(index)),
+            'close': close,
+            'volume': 1.0,
+        }, index=index)
+
+    def test_precompute_sessions_matches_live(self):
+        """Precomputed session inputs equal the per-session calculations"""
+        from core.strategy import StrategyEngine
+        from core.indicators import ONSFilter
+        
+        engine = StrategyEngine()
+        engine.ons_filter = ONSFilter(min_ratio=0.3, max_ratio=0.7)
+        
+        dates = [datetime(2025, 1, 1) + timedelta(days=d) for d in (5, 24, 27)]
+        table = engine.precompute_sessions(self.nq_data, dates)
+        
+        self.assertEqual(list(table.index), dates)
+        
+        # Too few days for a 20-day ADR: left to run_session
+        self.assertNotIn(dates[0], engine._session_inputs)
+        
+        for session_date in dates[1:]:
+            inputs = engine._session_inputs[session_date]
+            self.assertEqual(inputs.midnight_open, engine.mo_calc.calculate(self.nq_data, session_date))
+            self.assertEqual(inputs.adr, engine.adr_calc.calculate(self.nq_data, session_date))
+            self.assertEqual(inputs.ons_result, engine.ons_filter.validate(self.nq_data, session_date))
+
+    def test_quiet_engine_defers_output(self):
+        """verbose=False keeps session messages until flush_output"""
+        import io
+        from contextlib import redirect_stdout
+        from core.strategy import StrategyEngine
+        from core.indicators import ONSFilter
+        
+        session_date = datetime(2025, 1, 27)
+        es_data = self.nq_data / 4.2
+        outputs = []
+        
+        for verbose in (True, False):
+            with redirect_stdout(io.StringIO()):
+                engine = StrategyEngine(verbose=verbose)
+            engine.output_log.clear()
+            engine.ons_filter = ONSFilter(min_ratio=0.0, max_ratio=10.0)
+            engine._log_no_trade = lambda reason, details: None
+            
+            buffer = io.StringIO()
+            with redirect_stdout(buffer):
+                engine.run_session(self.nq_data, es_data, session_date)
+            
+            if not verbose:
+                self.assertEqual(buffer.getvalue(), '')
+                engine.flush_output(buffer)
+                self.assertEqual(len(engine.output_log), 0)
+            outputs.append(buffer.getvalue())
+        
+        self.assertIn('RUNNING SESSION: 2025-01-27', outputs[0])
+        self.assertEqual(outputs[1], outputs[0])
+
+    def test_no_trade_log_written(self):
+        """Rejected sessions write a no-trade row with the record's timestamp"""
+        import csv
+        import io
+        import tempfile
+        from contextlib import redirect_stdout
+        from core.strategy import StrategyEngine
+        from strategy_logging.logger import Logger
+        from core.indicators import ONSFilter
+        
+        with tempfile.TemporaryDirectory() as tmp, redirect_stdout(io.StringIO()):
+            engine = StrategyEngine()
+            engine.logger = Logger(f"{tmp}/events", f"{tmp}/trades", f"{tmp}/no_trades")
+            engine.ons_filter = ONSFilter(min_ratio=0.0, max_ratio=0.01)
+            
+            result = engine.run_session(self.nq_data, self.nq_data / 4.2, datetime(2025, 1, 27))
+            
+            with open(engine.logger.no_trade_log_file) as f:
+                rows = list(csv.DictReader(f))
+        
+        self.assertEqual(result['reason'], 'ONS_INVALID')
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['rejection_reason'], 'ONS_INVALID')
+        self.assertEqual(rows[0]['state_at_rejection'], 'ONS_INVALID')
+        self.assertTrue(rows[0]['details'].startswith('ONS too wide'))
+        self.assertEqual(datetime.fromisoformat(rows[0]['timestamp']).date(), datetime.now().date())
+
+    def test_run_backtest_matches_single_sessions(self):
+        """Parallel run_backtest gives the per-session results in date order"""
+        import io
+        from contextlib import redirect_stdout
+        from core.strategy import StrategyEngine
+        
+        es_data = self.nq_data / 4.2
+        dates = [datetime(2025, 1, d) for d in (28, 22, 24)]
+        
+        expected = []
+        for session_date in dates:
+            with redirect_stdout(io.StringIO()):
+                expected.append(StrategyEngine().run_session(self.nq_data, es_data, session_date))
+        
+        logs = []
+        for max_workers in (1, 2):
+            with redirect_stdout(io.StringIO()):
+                engine = StrategyEngine(verbose=False)
+            engine.output_log.clear()
+            
+            results = engine.run_backtest(self.nq_data, es_data, dates, max_workers=max_workers)
+            self.assertEqual(results, expected)
+            logs.append([message for message, _ in engine.output_log])
+        
+        self.assertEqual(logs[0], logs[1])
+        self.assertEqual(sum('RUNNING SESSION' in message for message in logs[0]), len(dates))
+
+
 if __name__ == '__main__':
     # Run the tests
     unittest.main(verbosity=2)
\ No newline at end of file
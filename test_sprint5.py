@@ -276,6 +276,134 @@ class TestSprint5(unittest.TestCase):
         self.assertEqual(stats['losing_trades'], 1)
         self.assertEqual(stats['win_rate'], 50.0)
 
+    def test_short_unrealized_pnl(self):
+        """Test 11: SHORT unrealized P&L from cached position constants"""
+        position = self.risk_manager.open_position(
+            entry_price=20000.0,
+            stop_loss=20050.0,
+            bias="SHORT",
+            instrument_spec=self.nq_spec
+        )
+        self.assertFalse(position.is_long)
+        
+        # 20 points in favour on 1 contract = $400 = 0.4R
+        result = self.risk_manager.update_position(19980.0, self.nq_spec)
+        self.assertIsNone(result)
+        self.assertEqual(position.unrealized_pnl_dollars, 400.0)
+        self.assertAlmostEqual(position.unrealized_pnl_r, 0.4)
+
+
+    def test_simulate_trade_matches_update_position(self):
+        """Test 12: Kernel trade replay matches tick-by-tick updates"""
+        import io
+        import contextlib
+        import numpy as np
+        
+        rng = np.random.default_rng(3)
+        for bias, stop in (("LONG", 19950.0), ("SHORT", 20050.0)):
+            for _ in range(20):
+                prices = 20000.0 + np.round(np.cumsum(rng.normal(0, 8, 200)) * 4) / 4
+                
+                with contextlib.redirect_stdout(io.StringIO()):
+                    manager = RiskManager(account_size=100000.0, risk_per_trade_pct=0.03)
+                    simulated = manager.simulate_trade(prices, 20000.0, stop, bias, self.nq_spec)
+                    manager.open_position(20000.0, stop, bias, self.nq_spec)
+                    exit_result = None
+                    for i, price in enumerate(prices):
+                        exit_result = manager.update_position(price, self.nq_spec)
+                        if exit_result is not None and not exit_result['position_remains']:
+                            break
+                
+                if manager.current_position is None:
+                    self.assertEqual(simulated['exit_index'], i)
+                    for key in ('reason', 'exit_price', 'pnl_dollars', 'pnl_r', 'win'):
+                        self.assertEqual(simulated[key], exit_result[key])
+                else:
+                    self.assertEqual(simulated['type'], 'OPEN')
+                    self.assertEqual(
+                        simulated['pnl_dollars'],
+                        manager.current_position.realized_pnl_dollars
+                    )
+
+
+    def test_quiet_mode_defers_event_output(self):
+        """Test 13: verbose=False keeps events until flush_events()"""
+        import io
+        import contextlib
+        
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            manager = RiskManager(verbose=False)
+            manager.open_position(20000.0, 19950.0, "LONG", self.nq_spec)
+            manager.update_position(19940.0, self.nq_spec)
+        self.assertEqual(out.getvalue(), "")
+        self.assertEqual([event[0] for event in manager.event_log], ['OPEN', 'FULL_EXIT'])
+        
+        flushed = io.StringIO()
+        manager.flush_events(flushed)
+        self.assertIn("Position opened", flushed.getvalue())
+        self.assertIn("Reason: STOP_LOSS", flushed.getvalue())
+        self.assertEqual(len(manager.event_log), 0)
+
+
+    def test_update_position_batch_matches_per_tick(self):
+        """Test 14: Batched updates match update_position per price"""
+        import numpy as np
+        
+        rng = np.random.default_rng(11)
+        for bias, stop in (("LONG", 19950.0), ("SHORT", 20050.0)):
+            for _ in range(20):
+                prices = 20000.0 + np.round(np.cumsum(rng.normal(0, 8, 150)) * 4) / 4
+                
+                per_tick = RiskManager(risk_per_trade_pct=0.03, verbose=False)
+                batched = RiskManager(risk_per_trade_pct=0.03, verbose=False)
+                for manager in (per_tick, batched):
+                    manager.open_position(20000.0, stop, bias, self.nq_spec)
+                
+                expected = [
+                    result for result in (
+                        per_tick.update_position(price, self.nq_spec) for price in prices
+                    ) if result is not None
+                ]
+                self.assertEqual(batched.update_position_batch(prices, self.nq_spec), expected)
+                self.assertEqual(batched.current_position, per_tick.current_position)
+                self.assertEqual(batched.account_size, per_tick.account_size)
+
+
+    def test_set_instrument_matches_explicit_spec(self):
+        """Test 15: Cached instrument gives the same trade as passing the spec"""
+        cached = RiskManager(risk_per_trade_pct=0.03, verbose=False)
+        cached.set_instrument(self.nq_spec)
+        explicit = RiskManager(risk_per_trade_pct=0.03, verbose=False)
+        
+        cached.open_position(20000.0, 20050.0, "SHORT")
+        explicit.open_position(20000.0, 20050.0, "SHORT", self.nq_spec)
+        for price in (19990.0, 19950.0, 20000.0):
+            self.assertEqual(cached.update_position(price), explicit.update_position(price, self.nq_spec))
+        self.assertEqual(cached.total_pnl_dollars, explicit.total_pnl_dollars)
+        
+        with self.assertRaises(ValueError):
+            RiskManager(verbose=False).calculate_position_size(20000.0, 19950.0)
+
+
+    def test_performance_summary_fresh_account(self):
+        """Test 16: Summary on a fresh account has no NaN/inf and reads as a dict"""
+        stats = RiskManager(verbose=False).get_performance_summary()
+        
+        self.assertEqual(stats.total_trades, 0)
+        self.assertEqual(stats['win_rate'], 0.0)
+        self.assertEqual(stats['avg_pnl_r'], 0.0)
+        self.assertEqual(stats['account_growth_pct'], 0.0)
+        self.assertEqual(RiskManager(account_size=0.0, verbose=False).get_performance_summary().account_growth_pct, 0.0)
+
+
+    def test_stop_on_wrong_side_not_opened(self):
+        """Test 17: No position when the stop is not beyond entry"""
+        self.assertIsNone(self.risk_manager.open_position(20000.0, 20050.0, "LONG", self.nq_spec))
+        self.assertIsNone(self.risk_manager.open_position(20000.0, 20000.0, "SHORT", self.nq_spec))
+        self.assertIsNone(self.risk_manager.current_position)
+        self.assertIsNone(self.risk_manager.simulate_trade([20000.0], 20000.0, 19950.0, "SHORT", self.nq_spec))
+
 
 if __name__ == '__main__':
     # Run the tests
@@ -97,11 +97,14 @@ class TestSprint6(unittest.TestCase):
         
         # Setup mock loader
         mock_loader = MagicMock()
-        mock_loader.fetch_historical_bars.side_effect = [mock_nq_data, mock_es_data]
+        mock_loader.fetch_historical_bars_batch.return_value = {
+            'NQ': mock_nq_data,
+            'ES': mock_es_data,
+        }
         mock_loader_class.return_value = mock_loader
         
-        # Create runner with mock
-        runner = BacktestRunner(debug=False)
+        # Create runner with mock (no disk cache so mock bars aren't persisted)
+        runner = BacktestRunner(debug=False, cache_dir=None)
         
         try:
             # Run backtest
@@ -162,6 +165,41 @@ class TestSprint6(unittest.TestCase):
         self.assertTrue(hasattr(bt.analyzers, 'Returns'))
         self.assertTrue(hasattr(bt.analyzers, 'TradeAnalyzer'))
 
+    def test_yahoo_bars_cache(self):
+        """Test 11: Yahoo bars are cached on disk between runs"""
+        import tempfile
+        from backtest.backtest_runner import BacktestRunner
+
+        dates = pd.date_range('2025-01-01', periods=100, freq='1min', tz='America/New_York')
+        df = pd.DataFrame({
+            'open': [100.0] * 100,
+            'high': [101.0] * 100,
+            'low': [99.0] * 100,
+            'close': [100.5] * 100,
+            'volume': [1000] * 100,
+        }, index=dates)
+
+        loader = MagicMock()
+        loader.fetch_historical_bars_batch.side_effect = (
+            lambda symbols, **kwargs: {symbol: df for symbol in symbols}
+        )
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            runner = BacktestRunner(debug=False, cache_dir=cache_dir)
+
+            first = runner._fetch_bars(loader, ['NQ'], '5d', '1m')
+            second = runner._fetch_bars(loader, ['NQ', 'ES'], '5d', '1m')
+
+            # NQ is served from disk; only ES is downloaded
+            self.assertEqual(loader.fetch_historical_bars_batch.call_count, 2)
+            self.assertEqual(loader.fetch_historical_bars_batch.call_args[0][0], ['ES'])
+            pd.testing.assert_frame_equal(first['NQ'], second['NQ'])
+
+            # Expired entries are refetched
+            runner.cache_ttl_hours = 0
+            runner._fetch_bars(loader, ['NQ', 'ES'], '5d', '1m')
+            self.assertEqual(loader.fetch_historical_bars_batch.call_args[0][0], ['NQ', 'ES'])
+
 
 if __name__ == '__main__':
     # Run the tests
@@ -0,0 +1,29 @@
+"""
+Optional Numba JIT
+==================
+Thin wrapper so hot-loop kernels can be decorated with ``@njit`` while
+numba stays an optional dependency.
+
+When numba is not installed the decorators are no-ops and the kernels run
+as plain Python/numpy code with identical results.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on environment
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (supports bare and called forms)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+    prange = range
+
+
+__all__ = ['njit', 'prange', 'NUMBA_AVAILABLE']
@@ -0,0 +1,35 @@
+"""
+Result Tuples
+=============
+Mixin giving NamedTuple results the read-only dict access of the plain
+dicts they replaced.
+"""
+
+from typing import Any
+
+
+class ResultMapping:
+    """
+    Read-only dict access for NamedTuple results.
+    
+    Results used to be plain dicts: result['isi'], 'isi' in result,
+    result.get() and result.keys() keep working through _asdict() (one
+    dict per lookup). Hot paths read the attributes instead.
+    
+    Mix in ahead of the NamedTuple: class Result(ResultMapping, _Fields)
+    """
+    __slots__ = ()
+    
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self._asdict()[key]
+        return super().__getitem__(key)
+    
+    def __contains__(self, key) -> bool:
+        return key in self._asdict()
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._asdict().get(key, default)
+    
+    def keys(self):
+        return self._asdict().keys()
@@ -5,6 +5,8 @@ Handles timezone conversions and session time detection.
 All strategy logic operates in US/Eastern (EST/EDT).
 """
 
+import numpy as np
+import pandas as pd
 import pytz
 from datetime import datetime, time, timedelta
 from typing import Optional
@@ -81,6 +83,39 @@ class TimeUtils:
         
         return window_start <= current_time <= window_end
     
+    @classmethod
+    def trading_window_mask(
+        cls,
+        index: pd.DatetimeIndex,
+        start_time: str = "09:30",
+        end_time: str = "10:30"
+    ) -> np.ndarray:
+        """
+        Vectorized is_in_trading_window for a whole DatetimeIndex.
+        
+        Args:
+            index: Timestamps to check (naive timestamps are treated as UTC)
+            start_time: Window start (HH:MM format)
+            end_time: Window end (HH:MM format)
+            
+        Returns:
+            Boolean array, True where the timestamp is within the window
+        """
+        if index.tz is None:
+            index = index.tz_localize(cls.UTC)
+        
+        # Wall-clock nanoseconds since midnight EST
+        wall_ns = index.tz_convert(cls.EST).tz_localize(None).as_unit('ns').asi8
+        time_of_day = wall_ns % 86_400_000_000_000
+        
+        start_h, start_m = map(int, start_time.split(':'))
+        end_h, end_m = map(int, end_time.split(':'))
+        
+        window_start = (start_h * 60 + start_m) * 60_000_000_000
+        window_end = (end_h * 60 + end_m) * 60_000_000_000
+        
+        return (time_of_day >= window_start) & (time_of_day <= window_end)
+    
     @classmethod
     def get_session_date(cls, dt: datetime) -> datetime:
         """